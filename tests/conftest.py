@@ -0,0 +1,21 @@
+"""Shared fixtures; SDL runs headless so window tests need no display."""
+from __future__ import annotations
+
+import os
+from typing import Iterator
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_RENDER_DRIVER", "software")
+
+import pytest
+
+from window_art import Desktop
+
+
+@pytest.fixture
+def desktop() -> Iterator[Desktop]:
+    """An initialized Desktop, shut down again after the test."""
+    desktop = Desktop.get()
+    desktop.init()
+    yield desktop
+    desktop.quit()
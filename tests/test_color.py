@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from window_art.color import Color
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("red", (255, 0, 0, 255)),
+        ("Dark Slate-Gray", (47, 79, 79, 255)),
+        ("#abc", (170, 187, 204, 255)),
+        ("#abcd", (170, 187, 204, 221)),
+        ("#ff6347", (255, 99, 71, 255)),
+        ("#ff634780", (255, 99, 71, 128)),
+        ((255, 99, 71), (255, 99, 71, 255)),
+        ((255, 99, 71, 128), (255, 99, 71, 128)),
+        ((300, -5, 71), (255, 0, 71, 255)),
+    ],
+)
+def test_parse(value: Any, expected: tuple[int, int, int, int]) -> None:
+    assert Color.parse(value).as_tuple() == expected
+
+
+def test_parse_returns_color_unchanged() -> None:
+    c = Color(1, 2, 3)
+    assert Color.parse(c) is c
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["nope", "#12", "#ggg", "#ff63471", (1, 2), [1, 2, 3], ([1], 2, 3), ("a", "b", "c"), 7],
+)
+def test_parse_rejects_with_value_error(value: Any) -> None:
+    with pytest.raises(ValueError):
+        Color.parse(value)
+
+
+@pytest.mark.parametrize("value", ["red", "#ff0000", (255, 0, 0)])
+def test_parse_results_are_not_shared(value: Any) -> None:
+    first = Color.parse(value)
+    first.r = 0
+    second = Color.parse(value)
+    assert second is not first
+    assert second.as_tuple() == (255, 0, 0, 255)
+
+
+def test_from_name_results_are_not_shared() -> None:
+    first = Color.from_name("coral")
+    first.g = 0
+    assert Color.from_name("coral").as_tuple() == (255, 127, 80, 255)
+
+
+def test_to_hex_round_trip() -> None:
+    assert Color.parse("#ff6347").to_hex() == "#ff6347"
+    assert Color.parse("#ff634780").to_hex() == "#ff634780"
+
+
+def test_with_alpha() -> None:
+    red = Color.parse("red")
+    assert red.with_alpha(0.5).a == 127
+    assert red.with_alpha(300).a == 255
+    assert red.a == 255
+
+
+def test_lerp_clamps_only_when_extrapolating() -> None:
+    black = Color(0, 0, 0)
+    white = Color(255, 255, 255)
+    assert black.lerp(white, 0.5).as_tuple() == (127, 127, 127, 255)
+    assert black.lerp(white, 2.0).as_tuple() == (255, 255, 255, 255)
+    assert white.lerp(black, 2.0).as_tuple() == (0, 0, 0, 255)
+
+
+@pytest.mark.parametrize("t", [i / 64 for i in range(65)])
+def test_lerp_q16_tracks_lerp(t: float) -> None:
+    a = Color(10, 200, 37, 255)
+    b = Color(250, 3, 37, 0)
+    fixed = a.lerp_q16(b, int(t * 65536)).as_tuple()
+    exact = a.lerp(b, t).as_tuple()
+    assert all(abs(f - e) <= 1 for f, e in zip(fixed, exact))
+
+
+def test_lerp_q16_endpoints() -> None:
+    a = Color(10, 200, 37, 255)
+    b = Color(250, 3, 37, 0)
+    assert a.lerp_q16(b, 0) == a
+    assert a.lerp_q16(b, 65536) == b
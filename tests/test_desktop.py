@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import pytest
+
+from window_art import Desktop, Window
+
+
+def test_update_only_keeps_windows_with_pending_work(desktop: Desktop) -> None:
+    win = desktop.window(0, 0, 50, 50, "red")
+    win.x = 20
+    assert win in desktop._active_windows
+    assert desktop.update() is True
+    assert desktop._active_windows == []
+
+
+def test_activation_during_update_pass_is_kept(desktop: Desktop, monkeypatch: pytest.MonkeyPatch) -> None:
+    first = desktop.window(0, 0, 50, 50, "red")
+    second = desktop.window(60, 0, 50, 50, "blue")
+    desktop.update()
+
+    apply_changes = Window._apply_changes
+
+    def activate_other(self: Window, dt: float = 0.0) -> bool:
+        if self is first:
+            # What a parallel() worker thread can do while the pass is running
+            second.x = 100
+        return apply_changes(self, dt)
+
+    monkeypatch.setattr(Window, "_apply_changes", activate_other)
+    first.x = 10
+    desktop.update()
+    assert desktop._active_windows == [second]
+    desktop.update()
+    assert desktop._active_windows == []
+
+
+def test_window_closed_during_update_pass_is_skipped(desktop: Desktop, monkeypatch: pytest.MonkeyPatch) -> None:
+    first = desktop.window(0, 0, 50, 50, "red")
+    second = desktop.window(60, 0, 50, 50, "blue")
+    desktop.update()
+
+    apply_changes = Window._apply_changes
+
+    def close_other(self: Window, dt: float = 0.0) -> bool:
+        if self is first:
+            second.close()
+        return apply_changes(self, dt)
+
+    monkeypatch.setattr(Window, "_apply_changes", close_other)
+    first.x = 10
+    second.x = 100
+    desktop.update()
+    assert desktop._active_windows == []
+    assert second.closed
+
+
+def test_closed_window_leaves_active_list_on_next_update(desktop: Desktop) -> None:
+    win = desktop.window(0, 0, 50, 50, "red")
+    win.x = 20
+    win.close()
+    assert not win._scheduled
+    desktop.update()
+    assert desktop._active_windows == []
+
+
+def test_stop_ends_update(desktop: Desktop) -> None:
+    desktop.stop()
+    assert desktop.update() is False
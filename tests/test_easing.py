@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from window_art import easing
+from window_art.easing import EASING_FUNCTIONS, EasingFunc, get_easing
+
+
+def _out_bounce(t: float) -> float:
+    n1 = 7.5625
+    d1 = 2.75
+    if t < 1 / d1:
+        return n1 * t * t
+    elif t < 2 / d1:
+        t -= 1.5 / d1
+        return n1 * t * t + 0.75
+    elif t < 2.5 / d1:
+        t -= 2.25 / d1
+        return n1 * t * t + 0.9375
+    t -= 2.625 / d1
+    return n1 * t * t + 0.984375
+
+
+_C1 = 1.70158
+_C2 = _C1 * 1.525
+_C3 = _C1 + 1
+_C4 = (2 * math.pi) / 3
+_C5 = (2 * math.pi) / 4.5
+
+# The textbook formulas (easings.net) the optimized functions must match.
+REFERENCE: dict[str, EasingFunc] = {
+    "linear": lambda t: t,
+    "ease_in_quad": lambda t: t**2,
+    "ease_out_quad": lambda t: 1 - (1 - t) ** 2,
+    "ease_in_out_quad": lambda t: 2 * t**2 if t < 0.5 else 1 - (-2 * t + 2) ** 2 / 2,
+    "ease_in_cubic": lambda t: t**3,
+    "ease_out_cubic": lambda t: 1 - (1 - t) ** 3,
+    "ease_in_out_cubic": lambda t: 4 * t**3 if t < 0.5 else 1 - (-2 * t + 2) ** 3 / 2,
+    "ease_in_quart": lambda t: t**4,
+    "ease_out_quart": lambda t: 1 - (1 - t) ** 4,
+    "ease_in_out_quart": lambda t: 8 * t**4 if t < 0.5 else 1 - (-2 * t + 2) ** 4 / 2,
+    "ease_in_quint": lambda t: t**5,
+    "ease_out_quint": lambda t: 1 - (1 - t) ** 5,
+    "ease_in_out_quint": lambda t: 16 * t**5 if t < 0.5 else 1 - (-2 * t + 2) ** 5 / 2,
+    "ease_in_sine": lambda t: 1 - math.cos(t * math.pi / 2),
+    "ease_out_sine": lambda t: math.sin(t * math.pi / 2),
+    "ease_in_out_sine": lambda t: -(math.cos(math.pi * t) - 1) / 2,
+    "ease_in_expo": lambda t: 0 if t == 0 else 2 ** (10 * t - 10),
+    "ease_out_expo": lambda t: 1 if t == 1 else 1 - 2 ** (-10 * t),
+    "ease_in_out_expo": lambda t: (
+        0 if t == 0
+        else 1 if t == 1
+        else 2 ** (20 * t - 10) / 2 if t < 0.5
+        else (2 - 2 ** (-20 * t + 10)) / 2
+    ),
+    "ease_in_circ": lambda t: 1 - math.sqrt(1 - t**2),
+    "ease_out_circ": lambda t: math.sqrt(1 - (t - 1) ** 2),
+    "ease_in_out_circ": lambda t: (
+        (1 - math.sqrt(1 - (2 * t) ** 2)) / 2 if t < 0.5
+        else (math.sqrt(1 - (-2 * t + 2) ** 2) + 1) / 2
+    ),
+    "ease_in_back": lambda t: _C3 * t**3 - _C1 * t**2,
+    "ease_out_back": lambda t: 1 + _C3 * (t - 1) ** 3 + _C1 * (t - 1) ** 2,
+    "ease_in_out_back": lambda t: (
+        ((2 * t) ** 2 * ((_C2 + 1) * 2 * t - _C2)) / 2 if t < 0.5
+        else ((2 * t - 2) ** 2 * ((_C2 + 1) * (t * 2 - 2) + _C2) + 2) / 2
+    ),
+    "ease_in_elastic": lambda t: (
+        0 if t == 0
+        else 1 if t == 1
+        else -(2 ** (10 * t - 10)) * math.sin((t * 10 - 10.75) * _C4)
+    ),
+    "ease_out_elastic": lambda t: (
+        0 if t == 0
+        else 1 if t == 1
+        else 2 ** (-10 * t) * math.sin((t * 10 - 0.75) * _C4) + 1
+    ),
+    "ease_in_out_elastic": lambda t: (
+        0 if t == 0
+        else 1 if t == 1
+        else -(2 ** (20 * t - 10) * math.sin((20 * t - 11.125) * _C5)) / 2 if t < 0.5
+        else (2 ** (-20 * t + 10) * math.sin((20 * t - 11.125) * _C5)) / 2 + 1
+    ),
+    "ease_in_bounce": lambda t: 1 - _out_bounce(1 - t),
+    "ease_out_bounce": _out_bounce,
+    "ease_in_out_bounce": lambda t: (
+        (1 - _out_bounce(1 - 2 * t)) / 2 if t < 0.5 else (1 + _out_bounce(2 * t - 1)) / 2
+    ),
+}
+
+SAMPLES = [i / 256 for i in range(257)]
+
+
+def test_reference_covers_every_easing() -> None:
+    names = set(EASING_FUNCTIONS) - {"ease_in", "ease_out", "ease_in_out"}
+    assert names == set(REFERENCE)
+
+
+@pytest.mark.parametrize("name", sorted(REFERENCE))
+def test_matches_reference(name: str) -> None:
+    func = EASING_FUNCTIONS[name]
+    reference = REFERENCE[name]
+    for t in SAMPLES:
+        assert func(t) == pytest.approx(reference(t), rel=1e-12, abs=1e-12), t
+
+
+@pytest.mark.parametrize("name", sorted(REFERENCE))
+def test_endpoints(name: str) -> None:
+    func = EASING_FUNCTIONS[name]
+    assert func(0.0) == pytest.approx(0.0, abs=1e-12)
+    assert func(1.0) == pytest.approx(1.0, abs=1e-12)
+
+
+def test_aliases() -> None:
+    assert easing.ease_in is easing.ease_in_quad
+    assert easing.ease_out is easing.ease_out_quad
+    assert easing.ease_in_out is easing.ease_in_out_quad
+
+
+@pytest.mark.parametrize("name", ["ease_out", "Ease-Out", "EASE OUT"])
+def test_get_easing_normalizes_names(name: str) -> None:
+    assert get_easing(name) is easing.ease_out_quad
+
+
+def test_get_easing_passes_callables_through() -> None:
+    def custom(t: float) -> float:
+        return t
+
+    assert get_easing(custom) is custom
+
+
+def test_get_easing_unknown_name() -> None:
+    with pytest.raises(ValueError, match="Unknown easing function"):
+        get_easing("wobble")
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from window_art.media import gif as gif_module
+from window_art.media import clear_media_size_cache
+from window_art.media.gif import GifAnimation, get_gif_info, get_gif_size
+
+
+def _color(frame: int) -> tuple[int, int, int]:
+    return (frame * 5 % 256, 255 - frame * 5 % 256, 0)
+
+
+def _write_gif(path: Path, durations: list[int], size: tuple[int, int] = (8, 6)) -> str:
+    frames = [Image.new("RGB", size, _color(i)) for i in range(len(durations))]
+    frames[0].save(
+        path, save_all=True, append_images=frames[1:], duration=durations, loop=0, disposal=1
+    )
+    return str(path)
+
+
+@pytest.fixture
+def uniform_gif(tmp_path: Path) -> str:
+    return _write_gif(tmp_path / "uniform.gif", [100] * 4)
+
+
+@pytest.fixture
+def varied_gif(tmp_path: Path) -> str:
+    return _write_gif(tmp_path / "varied.gif", [100, 200, 50, 150])
+
+
+def test_load_reads_timing(varied_gif: str) -> None:
+    gif = GifAnimation(varied_gif)
+    assert gif.size == (8, 6)
+    assert gif.frame_count == 4
+    assert gif.total_duration == pytest.approx(0.5)
+    assert [gif.get_frame_delay(i) for i in range(4)] == pytest.approx([0.1, 0.2, 0.05, 0.15])
+    gif.close()
+
+
+def test_missing_file_raises_value_error(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Failed to load GIF"):
+        GifAnimation(str(tmp_path / "missing.gif"))
+
+
+@pytest.mark.parametrize(
+    ("elapsed", "frame"),
+    [(0.05, 0), (0.15, 1), (0.29, 1), (0.31, 2), (0.37, 3), (0.49, 3), (0.52, 0), (0.65, 1)],
+)
+def test_update_selects_frame_by_elapsed_time(varied_gif: str, elapsed: float, frame: int) -> None:
+    gif = GifAnimation(varied_gif)
+    gif.update(elapsed)
+    assert gif.current_frame == frame
+    gif.close()
+
+
+def test_update_steps_uniform_frames(uniform_gif: str) -> None:
+    gif = GifAnimation(uniform_gif)
+    seen = []
+    for _ in range(9):
+        gif.update(0.07)
+        seen.append(gif.current_frame)
+    assert seen == [0, 1, 2, 2, 3, 0, 0, 1, 2]
+    gif.close()
+
+
+def test_update_reports_frame_changes(uniform_gif: str) -> None:
+    gif = GifAnimation(uniform_gif)
+    assert gif.update(0.05) is False
+    assert gif.update(0.05) is True
+    gif.close()
+
+
+def test_update_skips_frames_after_a_stall(varied_gif: str) -> None:
+    gif = GifAnimation(varied_gif)
+    assert gif.update(0.32) is True
+    assert gif.current_frame == 2
+    gif.close()
+
+
+def test_update_without_loop_stops_on_last_frame(varied_gif: str) -> None:
+    gif = GifAnimation(varied_gif)
+    gif.loop = False
+    assert gif.update(0.8) is True
+    assert gif.current_frame == 3
+    assert gif.playing is False
+    assert gif.update(0.1) is False
+    gif.close()
+
+
+def test_update_applies_speed(varied_gif: str) -> None:
+    gif = GifAnimation(varied_gif)
+    gif.speed = 2.0
+    gif.update(0.16)
+    assert gif.current_frame == 2
+    gif.close()
+
+
+def test_update_paused(varied_gif: str) -> None:
+    gif = GifAnimation(varied_gif)
+    gif.playing = False
+    assert gif.update(1.0) is False
+    assert gif.current_frame == 0
+    gif.close()
+
+
+def test_current_frame_setter_aligns_time(varied_gif: str) -> None:
+    gif = GifAnimation(varied_gif)
+    gif.current_frame = 2
+    gif.update(0.04)
+    assert gif.current_frame == 2
+    gif.update(0.02)
+    assert gif.current_frame == 3
+    gif.current_frame = 99
+    assert gif.current_frame == 3
+    gif.close()
+
+
+def test_reset(varied_gif: str) -> None:
+    gif = GifAnimation(varied_gif)
+    gif.loop = False
+    gif.update(1.0)
+    gif.reset()
+    assert gif.current_frame == 0
+    assert gif.playing is True
+    gif.close()
+
+
+def test_get_frame_data_is_rgba_bytes(varied_gif: str) -> None:
+    gif = GifAnimation(varied_gif)
+    for frame in range(gif.frame_count):
+        data = gif.get_frame_data(frame)
+        assert isinstance(data, bytes)
+        assert len(data) == 8 * 6 * 4
+        assert tuple(data[:4]) == (*_color(frame), 255)
+    gif.close()
+
+
+def test_frames_decode_once_across_loops(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = _write_gif(tmp_path / "long.gif", [20] * 40)
+    gif = GifAnimation(path)
+    decoded: list[int] = []
+    decode = gif._decode
+
+    def counting(frame: int) -> bytes:
+        decoded.append(frame)
+        return decode(frame)
+
+    monkeypatch.setattr(gif, "_decode", counting)
+    for _ in range(3):
+        for frame in range(gif.frame_count):
+            gif.get_frame_data(frame)
+    # Frame 0 is decoded by the constructor
+    assert sorted(decoded) == list(range(1, 40))
+    gif.close()
+
+
+def test_frame_cache_is_bounded_by_budget(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(gif_module, "_FRAME_CACHE_BYTES", 8 * 6 * 4 * 5)
+    path = _write_gif(tmp_path / "long.gif", [20] * 12)
+    gif = GifAnimation(path)
+    for frame in range(gif.frame_count):
+        assert tuple(gif.get_frame_data(frame)[:4]) == (*_color(frame), 255)
+    assert len(gif._decoded) == 5
+    gif.close()
+
+
+def test_preload_closes_source(varied_gif: str) -> None:
+    gif = GifAnimation(varied_gif)
+    gif.preload()
+    assert gif._img is None
+    assert [tuple(gif.get_frame_data(i)[:3]) for i in range(4)] == [_color(i) for i in range(4)]
+    gif.close()
+
+
+def test_closed_gif_cannot_decode(varied_gif: str) -> None:
+    gif = GifAnimation(varied_gif)
+    gif.close()
+    with pytest.raises(ValueError, match="closed"):
+        gif.get_frame_data(1)
+
+
+def test_get_gif_size(varied_gif: str) -> None:
+    assert get_gif_size(varied_gif) == (8, 6)
+
+
+def test_get_gif_info_returns_copies(varied_gif: str) -> None:
+    clear_media_size_cache()
+    info = get_gif_info(varied_gif)
+    assert info == {"width": 8, "height": 6, "frame_count": 4, "total_duration": pytest.approx(0.5)}
+    info["width"] = 0
+    assert get_gif_info(varied_gif)["width"] == 8
+
+
+def test_get_gif_info_rereads_changed_file(tmp_path: Path) -> None:
+    clear_media_size_cache()
+    path = _write_gif(tmp_path / "anim.gif", [100] * 3)
+    assert get_gif_info(path)["frame_count"] == 3
+    _write_gif(tmp_path / "anim.gif", [100] * 5, size=(10, 6))
+    # Make sure the stamp differs even on coarse-mtime filesystems
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert get_gif_info(path)["frame_count"] == 5
+    assert get_gif_size(path) == (10, 6)
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import pytest
+
+from window_art import Desktop
+from window_art.layout import CellSpec, Grid, TrackSize, grid_layout, grid_layout_arrays
+
+
+@pytest.mark.parametrize(
+    ("spec", "expected"),
+    [
+        ("1fr", TrackSize(1.0, "fr")),
+        ("2.5fr", TrackSize(2.5, "fr")),
+        ("100px", TrackSize(100.0, "px")),
+        (" 100 ", TrackSize(100.0, "px")),
+    ],
+)
+def test_track_size_parse(spec: str, expected: TrackSize) -> None:
+    assert TrackSize.parse(spec) == expected
+
+
+def test_grid_layout_mixes_fixed_and_fractional_tracks() -> None:
+    # 400 wide, two 10px gaps: 100px fixed, 280 shared 1:3 between the fr tracks
+    cells = grid_layout(50, 20, 400, 100, "100px 1fr 3fr", "1fr", gap=10)
+    assert cells == [
+        CellSpec(50, 20, 100, 100, 0, 0),
+        CellSpec(160, 20, 70, 100, 0, 1),
+        CellSpec(240, 20, 210, 100, 0, 2),
+    ]
+
+
+def test_grid_layout_separate_gaps_row_major() -> None:
+    cells = grid_layout(0, 0, 210, 110, "1fr 1fr", "1fr 1fr", gap=(10, 20))
+    assert [(c.row, c.col) for c in cells] == [(0, 0), (0, 1), (1, 0), (1, 1)]
+    assert [(c.x, c.y, c.w, c.h) for c in cells] == [
+        (0, 0, 100, 45),
+        (110, 0, 100, 45),
+        (0, 65, 100, 45),
+        (110, 65, 100, 45),
+    ]
+
+
+def test_grid_layout_fixed_tracks_overflowing_leave_fr_empty() -> None:
+    cells = grid_layout(0, 0, 100, 10, "80px 40px 1fr", "1fr")
+    assert [c.w for c in cells] == [80, 40, 0]
+
+
+@pytest.mark.parametrize(
+    ("columns", "rows", "gap"),
+    [("1fr", "1fr", 0), ("100px 1fr 2fr", "1fr 50px", 8), ("1fr 1fr 1fr 1fr", "2fr 1fr", (4, 12))],
+)
+def test_grid_layout_arrays_match_grid_layout(columns: str, rows: str, gap: float | tuple[float, float]) -> None:
+    cells = grid_layout(10, 20, 640, 480, columns, rows, gap)
+    arrays = grid_layout_arrays(10, 20, 640, 480, columns, rows, gap)
+    assert list(zip(*arrays)) == [(c.x, c.y, c.w, c.h, c.row, c.col) for c in cells]
+
+
+def test_grid_cell_specs_match_grid_layout(desktop: Desktop) -> None:
+    grid = Grid(0, 0, 300, 200, columns="1fr 2fr", rows="50px 1fr", gap=10)
+    cells = grid_layout(0, 0, 300, 200, "1fr 2fr", "50px 1fr", gap=10)
+    for spec in cells:
+        assert grid.get_cell_spec(spec.row, spec.col) == spec
+
+
+def test_cached_cell_specs_follow_spans_and_bounds(desktop: Desktop) -> None:
+    grid = Grid(0, 0, 300, 200, columns="1fr 1fr 1fr", rows="1fr 1fr", gap=10)
+    # Fill the cache before the spans and bounds change
+    assert grid.get_cell_spec(0, 0).w == pytest.approx(280 / 3)
+    grid.cell(0, 0, "red", colspan=2)
+    assert grid.get_cell_spec(0, 0) == grid._compute_cell(0, 0, 1, 2)
+    grid.swap(0, 0, 1, 0)
+    assert grid.get_cell_spec(0, 0) == grid._compute_cell(0, 0)
+    assert grid.get_cell_spec(1, 0) == grid._compute_cell(1, 0, 1, 2)
+    grid.move_to(20, 30)
+    grid.resize_to(600, 400)
+    assert grid.get_cell_spec(0, 2) == grid._compute_cell(0, 2)
+    spec = grid.get_cell_spec(1, 0)
+    assert (spec.x, spec.y, spec.h) == (20, 235, 195)
+    assert spec.w == pytest.approx(2 * 580 / 3 + 10)
+
+
+def test_cell_places_window(desktop: Desktop) -> None:
+    grid = Grid(0, 0, 300, 200, columns="1fr 1fr 1fr", rows="1fr 1fr")
+    win = grid.cell(1, 2, "red")
+    assert grid[1, 2] is win
+    assert grid[5] is win
+    assert (1, 2) in grid
+    assert (0, 0) not in grid
+    assert len(grid) == 1
+    assert (win.x, win.y, win.w, win.h) == (200, 100, 100, 100)
+
+
+def test_cell_spanning(desktop: Desktop) -> None:
+    grid = Grid(0, 0, 300, 200, columns="1fr 1fr 1fr", rows="1fr 1fr", gap=10)
+    win = grid.cell(0, 1, "red", colspan=2, rowspan=2)
+    spec = grid.get_cell_spec(0, 1)
+    assert (win.x, win.y) == (spec.x, spec.y)
+    assert win.w == pytest.approx(2 * (280 / 3) + 10)
+    assert win.h == pytest.approx(200)
+
+
+@pytest.mark.parametrize(
+    ("row", "col", "kwargs"),
+    [(-1, 0, {}), (2, 0, {}), (0, 3, {}), (1, 0, {"rowspan": 2}), (0, 2, {"colspan": 2})],
+)
+def test_cell_out_of_range(desktop: Desktop, row: int, col: int, kwargs: dict[str, int]) -> None:
+    grid = Grid(0, 0, 300, 200, columns="1fr 1fr 1fr", rows="1fr 1fr")
+    with pytest.raises(ValueError):
+        grid.cell(row, col, "red", **kwargs)
+
+
+def test_fill_skips_occupied_cells(desktop: Desktop) -> None:
+    grid = Grid(0, 0, 200, 200, columns="1fr 1fr", rows="1fr 1fr")
+    first = grid.cell(0, 0, "red")
+    filled = grid.fill(["green", "blue", "white", "black", "gray"])
+    assert len(filled) == 3
+    assert list(grid) == [first, *filled]
+
+
+def test_swap_moves_both_windows(desktop: Desktop) -> None:
+    grid = Grid(0, 0, 300, 200, columns="1fr 1fr 1fr", rows="1fr 1fr")
+    a = grid.cell(0, 0, "red")
+    b = grid.cell(1, 2, "blue")
+    grid.swap(0, 0, 1, 2)
+    assert grid[1, 2] is a and grid[0, 0] is b
+    assert (a.x, a.y) == (200, 100)
+    assert (b.x, b.y) == (0, 0)
+
+
+def test_swap_leaves_other_windows_untouched(desktop: Desktop) -> None:
+    grid = Grid(0, 0, 300, 200, columns="1fr 1fr 1fr", rows="1fr 1fr")
+    windows = grid.fill(["red", "green", "blue", "white", "black", "gray"])
+    desktop.update()
+    grid.swap(0, 0, 1, 2)
+    assert set(desktop._active_windows) == {windows[0], windows[5]}
+    assert (windows[0].x, windows[0].y) == (200, 100)
+    assert (windows[5].x, windows[5].y) == (0, 0)
+
+
+def test_swap_with_empty_cell_moves_span(desktop: Desktop) -> None:
+    grid = Grid(0, 0, 300, 200, columns="1fr 1fr 1fr", rows="1fr 1fr")
+    wide = grid.cell(0, 0, "red", colspan=2)
+    grid.swap(0, 0, 1, 1)
+    assert (0, 0) not in grid
+    assert grid[1, 1] is wide
+    assert (wide.x, wide.y, wide.w, wide.h) == (100, 100, 200, 100)
+    # The cell it left holds a plain single-cell window again
+    assert grid.cell(0, 0, "blue").w == 100
+
+
+def test_swap_animated_without_duration_swaps_instantly(desktop: Desktop) -> None:
+    grid = Grid(0, 0, 200, 100, columns="1fr 1fr", rows="1fr")
+    a = grid.cell(0, 0, "red")
+    b = grid.cell(0, 1, "blue")
+    grid.swap_animated(0, 0, 0, 1, duration=0)
+    assert grid[0, 1] is a and grid[0, 0] is b
+    assert (a.x, b.x) == (100, 0)
+
+
+@pytest.mark.parametrize("cells", [(-1, 0, 0, 0), (0, 0, 2, 0), (0, 0, 0, -1), (0, 3, 0, 0)])
+def test_swap_out_of_range(desktop: Desktop, cells: tuple[int, int, int, int]) -> None:
+    grid = Grid(0, 0, 300, 200, columns="1fr 1fr 1fr", rows="1fr 1fr")
+    grid.fill(["red"] * 6)
+    with pytest.raises(ValueError, match="out of range"):
+        grid.swap(*cells)
+    with pytest.raises(ValueError, match="out of range"):
+        grid.swap_animated(*cells)
+
+
+def test_move_and_resize_relayout(desktop: Desktop) -> None:
+    grid = Grid(0, 0, 200, 100, columns="1fr 1fr", rows="1fr")
+    _, right = grid.fill(["red", "blue"])
+    grid.move_to(50, 40)
+    assert (right.x, right.y) == (150, 40)
+    grid.resize_to(400, 100)
+    assert (right.x, right.w) == (250, 200)
+
+
+def test_clear_closes_windows(desktop: Desktop) -> None:
+    grid = Grid(0, 0, 200, 100, columns="1fr 1fr", rows="1fr")
+    windows = grid.fill(["red", "blue"])
+    grid.clear()
+    assert len(grid) == 0
+    assert all(win.closed for win in windows)
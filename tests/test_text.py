@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import random
+
+from PIL import Image, ImageDraw
+
+from window_art.media.text import TextRenderer
+
+
+def _pixels(data: bytes) -> list[tuple[int, ...]]:
+    return [tuple(data[i:i + 4]) for i in range(0, len(data), 4)]
+
+
+def _drawn_directly(renderer: TextRenderer, color: tuple[int, int, int, int]) -> bytes:
+    image = Image.new("RGBA", (renderer._width, renderer._height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    for line, x, y, _ in renderer._layout():
+        draw.text((x, y), line, font=renderer._font, fill=color)
+    return image.tobytes()
+
+
+def test_render_uses_text_color() -> None:
+    renderer = TextRenderer("Hello\nworld", 200, 120, font_size=40, text_color=(200, 30, 40, 255))
+    data = renderer.render()
+    assert data == _drawn_directly(renderer, (200, 30, 40, 255))
+    assert max(_pixels(data), key=lambda p: p[3])[:3] == (200, 30, 40)
+
+
+def test_render_follows_text_color_changes() -> None:
+    renderer = TextRenderer("Hello", 120, 80, text_color=(200, 30, 40, 255))
+    before = renderer.render()
+    renderer.text_color = (0, 0, 255, 128)
+    after = renderer.render()
+    assert after != before
+    assert after == _drawn_directly(renderer, (0, 0, 255, 128))
+
+
+def test_texture_coverage_is_white() -> None:
+    renderer = TextRenderer("Hello", 120, 80, text_color=(200, 30, 40, 255))
+    coverage = renderer._render_coverage()
+    assert coverage == _drawn_directly(renderer, (255, 255, 255, 255))
+    renderer.text_color = (0, 0, 255, 255)
+    # Recoloring is left to the texture color mod
+    assert renderer._render_coverage() is coverage
+
+
+def _wrap_reference(renderer: TextRenderer, text: str, max_width: int) -> list[str]:
+    """Greedy wrap measuring the ink box of each candidate line."""
+    lines: list[str] = []
+    current: list[str] = []
+    for word in text.split():
+        bbox = renderer._font.getbbox(" ".join(current + [word]))
+        if bbox[2] - bbox[0] <= max_width:
+            current.append(word)
+        elif current:
+            lines.append(" ".join(current))
+            current = [word]
+        else:
+            lines.append(word)
+    if current:
+        lines.append(" ".join(current))
+    return lines or [""]
+
+
+def test_wrap_matches_ink_box_measurement() -> None:
+    rng = random.Random(7)
+    words = ["AV", "To", "fly", "jig", "wave", "Typo", "LT", "ff", "i", "W.", "yes,", "overhang"]
+    renderer = TextRenderer("", 100, 100, font_size=22, text_wrap=True)
+    for _ in range(300):
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(1, 14)))
+        max_width = rng.randint(20, 160)
+        assert renderer._wrap_text(text, max_width) == _wrap_reference(renderer, text, max_width)
+
+
+def test_wrap_keeps_overlong_words_whole() -> None:
+    renderer = TextRenderer("", 100, 100, font_size=22, text_wrap=True)
+    assert renderer._wrap_text("a extraordinarily b", 10) == ["a", "extraordinarily", "b"]
+    assert renderer._wrap_text("   ", 10) == [""]
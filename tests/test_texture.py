@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from window_art import Desktop
+from window_art.media import _texture
+
+
+def test_failed_upload_destroys_texture(desktop: Desktop, monkeypatch: pytest.MonkeyPatch) -> None:
+    win = desktop.window(0, 0, 50, 50, "red")
+    destroyed: list[Any] = []
+    destroy = _texture._sdl2.SDL_DestroyTexture
+
+    def record_destroy(texture: Any) -> None:
+        destroyed.append(texture)
+        destroy(texture)
+
+    monkeypatch.setattr(_texture._sdl2, "SDL_UpdateTexture", lambda *args: -1)
+    monkeypatch.setattr(_texture._sdl2, "SDL_DestroyTexture", record_destroy)
+    with pytest.raises(RuntimeError, match="Failed to update texture"):
+        _texture.create_rgba_texture(win._renderer, 2, 2, bytes(16))
+    assert len(destroyed) == 1
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from window_art import vec2
+
+
+def test_normalized_matches_documented_example() -> None:
+    n = vec2(3, 4).normalized()
+    assert (n.x, n.y) == (0.6, 0.8)
+    assert n.length == 1.0
+
+
+def test_normalized_zero_vector() -> None:
+    assert vec2(0, 0).normalized() == vec2(0, 0)
+
+
+def test_length() -> None:
+    assert vec2(3, 4).length == 5.0
+    assert vec2(1e200, 1e200).length == pytest.approx(math.sqrt(2) * 1e200)
+
+
+@pytest.mark.parametrize("other", [vec2(3, 4), (3, 4), (3.0, 4.0)])
+def test_distances_accept_vectors_and_tuples(other: vec2 | tuple[float, float]) -> None:
+    origin = vec2(0, 0)
+    assert origin.distance_to(other) == 5.0
+    assert origin.distance_squared_to(other) == 25.0
+
+
+def test_distance_to_matches_subtraction() -> None:
+    a = vec2(1.5, -2.25)
+    b = vec2(-7.0, 3.5)
+    assert a.distance_to(b) == pytest.approx((a - b).length)
+    assert a.distance_squared_to(b) == pytest.approx((a - b).length ** 2)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import ctypes
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+import sdl2
+
+cv2 = pytest.importorskip("cv2")
+np = pytest.importorskip("numpy")
+
+from window_art import Desktop  # noqa: E402
+from window_art.media.video import VideoPlayer  # noqa: E402
+
+
+def _write_video(path: Path, frames: int = 10, size: tuple[int, int] = (16, 12)) -> str:
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 10.0, size)
+    for i in range(frames):
+        writer.write(np.full((size[1], size[0], 3), i * 20, np.uint8))
+    writer.release()
+    return str(path)
+
+
+class _FailingCapture:
+    """Capture whose reads fail, to stand in for a decoder error."""
+
+    def __init__(self, cap: Any) -> None:
+        self._cap = cap
+
+    def grab(self) -> bool:
+        return bool(self._cap.grab())
+
+    def read(self, image: Any = None) -> tuple[bool, Any]:
+        raise RuntimeError("decode failed")
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cap, name)
+
+
+@pytest.fixture
+def video(tmp_path: Path) -> str:
+    return _write_video(tmp_path / "clip.avi")
+
+
+def test_short_seek_takes_decoded_frame(video: str) -> None:
+    player = VideoPlayer(video)
+    player.current_frame = 3
+    assert player._frame_index == 3
+    player.close()
+
+
+def test_decoder_error_reaches_seek(video: str) -> None:
+    player = VideoPlayer(video)
+    player._stop_decoder()
+    player._cap = _FailingCapture(player._cap)
+    player._start_decoder()
+
+    result: list[BaseException] = []
+
+    def seek() -> None:
+        try:
+            player.current_frame = 2
+        except BaseException as exc:
+            result.append(exc)
+
+    thread = threading.Thread(target=seek)
+    thread.start()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert len(result) == 1 and str(result[0]) == "decode failed"
+    player.close()
+
+
+def test_dead_decoder_does_not_block_seek(video: str) -> None:
+    player = VideoPlayer(video)
+    player._stop_decoder()
+    player._pending = None
+    # A decoder that exits without queueing anything
+    player._decoder = threading.Thread(target=lambda: None)
+    player._decoder.start()
+    player._decoder.join()
+    player._current_frame = 2
+    assert player._take_frame(wait=True) is False
+    assert player._frame_index == 0
+    player._decoder = None
+    player.close()
+
+
+def test_target_size_shrinks_frames(video: str) -> None:
+    player = VideoPlayer(video, target_size=(8, 6))
+    assert player.size == (16, 12)
+    assert player.frame_size == (8, 6)
+    assert player._frame.shape[:2] == (6, 8)
+    player.current_frame = 2
+    assert player._frame.shape[:2] == (6, 8)
+    player.close()
+
+
+def test_clearing_target_size_decodes_current_frame_at_full_size(video: str) -> None:
+    player = VideoPlayer(video, target_size=(8, 6))
+    player.current_frame = 4
+    player.target_size = None
+    assert player.frame_size == (16, 12)
+    assert player._frame.shape[:2] == (12, 16)
+    assert player._frame_index == 4
+    assert player.update(0.1) is True
+    assert player._frame.shape[:2] == (12, 16)
+    player.close()
+
+
+def test_window_decodes_video_at_window_size(desktop: Desktop, video: str) -> None:
+    win = desktop.window(0, 0, 8, 6, video=video)
+    assert win._video.frame_size == (8, 6)
+    win.size = (12, 6)
+    desktop.update()
+    assert win._video.frame_size == (16, 12)
+
+
+def test_window_video_region_uses_full_size_frames(desktop: Desktop, video: str) -> None:
+    win = desktop.window(0, 0, 8, 6, video=video)
+    win.video_region = (8, 6, 8, 6)
+    assert win._video.frame_size == (16, 12)
+    w, h = ctypes.c_int(), ctypes.c_int()
+    sdl2.SDL_QueryTexture(win._video_texture, None, None, ctypes.byref(w), ctypes.byref(h))
+    assert (w.value, h.value) == (16, 12)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from window_art import Color, Desktop
+
+
+def test_color_setter_skips_unchanged_color(desktop: Desktop) -> None:
+    win = desktop.window(0, 0, 50, 50, "red")
+    desktop.update()
+    win.color = (255, 0, 0)
+    assert win._changes == 0
+    assert desktop._active_windows == []
+
+
+def test_color_mutated_and_reassigned_is_applied(desktop: Desktop) -> None:
+    win = desktop.window(0, 0, 50, 50, "red")
+    desktop.update()
+    color = win.color
+    color.r = 0
+    color.b = 255
+    win.color = color
+    assert win._color_rgba == (0, 0, 255, 255)
+    assert win in desktop._active_windows
+
+
+def test_text_color_mutated_and_reassigned_is_applied(desktop: Desktop) -> None:
+    win = desktop.window(0, 0, 100, 50, "white", text="hi", text_color="black")
+    desktop.update()
+    color = win.text_color
+    color.g = 200
+    win.text_color = color
+    assert win._text_renderer is not None
+    assert win._text_renderer.text_color == (0, 200, 0, 255)
+    assert win in desktop._active_windows
+
+
+def test_text_color_setter_skips_unchanged_color(desktop: Desktop) -> None:
+    win = desktop.window(0, 0, 100, 50, "white", text="hi", text_color="black")
+    desktop.update()
+    win.text_color = Color(0, 0, 0)
+    assert desktop._active_windows == []
@@ -71,6 +71,7 @@ from .media import (
     GifAnimation,
     TextRenderer,
     VideoPlayer,
+    clear_media_size_cache,
     get_gif_info,
     get_gif_size,
     get_image_size,
@@ -84,7 +85,15 @@ from .media import (
     load_image,
 )
 
-from .layout import CellSpec, Grid, TrackSize, grid, grid_layout
+from .layout import (
+    CellSpec,
+    Grid,
+    GridLayoutArrays,
+    TrackSize,
+    grid,
+    grid_layout,
+    grid_layout_arrays,
+)
 
 from .easing import (
     EASING_FUNCTIONS,
@@ -144,9 +153,9 @@ def run(fps: float = 60.0) -> Generator[None, None, None]:
         quit()
 
 
-def run_loop(fps: float = 60.0) -> None:
+def run_loop(fps: float = 60.0, *, realtime: bool = False, precise_timing: bool = False) -> None:
     """Run the main event loop (blocking)."""
-    _run(fps)
+    _run(fps, realtime=realtime, precise_timing=precise_timing)
 
 
 __version__ = "0.1.0"
@@ -163,10 +172,12 @@ __all__ = [
     "EasingFunc",
     "Grid",
     "CellSpec",
+    "GridLayoutArrays",
     "TrackSize",
     "load_image",
     "has_image_support",
     "get_image_size",
+    "clear_media_size_cache",
     "GifAnimation",
     "has_gif_support",
     "get_gif_size",
@@ -180,6 +191,7 @@ __all__ = [
     "get_text_size",
     "grid",
     "grid_layout",
+    "grid_layout_arrays",
     "init",
     "quit",
     "window",
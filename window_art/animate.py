@@ -5,7 +5,7 @@ import time
 from typing import Callable, Generator, Sequence
 
 from .color import Color, ColorLike
-from .core import Desktop
+from .core import Desktop, _sleep_until
 from .easing import EasingFunc, get_easing, linear
 from .window import Window
 
@@ -18,31 +18,33 @@ def _run_animation(animation: Animation) -> None:
     desktop.init()
 
     frame_time = 1.0 / 60.0
+    # Frames are paced against absolute deadlines so sleep overshoot does not
+    # accumulate; if we fall behind, missed frames are dropped, not bunched.
+    perf_counter = time.perf_counter
+    deadline = perf_counter() + frame_time
+    update = desktop.update
+    step = animation.__next__
 
     try:
         while True:
-            frame_start = time.perf_counter()
-
-            if not desktop.update():
+            if not update():
                 break
 
             try:
-                next(animation)
+                step()
             except StopIteration:
                 break
 
-            elapsed = time.perf_counter() - frame_start
-            if elapsed < frame_time:
-                time.sleep(frame_time - elapsed)
+            now = perf_counter()
+            if now < deadline:
+                _sleep_until(deadline)
+                deadline += frame_time
+            else:
+                deadline += frame_time * (int((now - deadline) / frame_time) + 1)
     except GeneratorExit:
         pass
 
 
-def _lerp(a: float, b: float, t: float) -> float:
-    """Linear interpolation between two values."""
-    return a + (b - a) * t
-
-
 def _move_gen(
     win: Window,
     x: float,
@@ -52,18 +54,109 @@ def _move_gen(
 ) -> Animation:
     """Generator that animates window position."""
     start_x, start_y = win.x, win.y
-    start_time = time.perf_counter()
+    dx, dy = x - start_x, y - start_y
+    perf_counter = time.perf_counter
+    start_time = perf_counter()
+    end_time = start_time + duration
+    inv_duration = 1.0 / duration if duration > 0 else 0.0
+    is_linear = ease is linear
 
     while True:
-        elapsed = time.perf_counter() - start_time
-        if elapsed >= duration:
-            win.x = x
-            win.y = y
+        now = perf_counter()
+        if now >= end_time:
+            # Write the exact target rather than start + delta * ease(1.0):
+            # that can land an ulp short and truncate to the previous pixel.
+            win.position = (x, y)
+            return
+
+        t = (now - start_time) * inv_duration
+        if not is_linear:
+            t = ease(t)
+        win._set_position(start_x + dx * t, start_y + dy * t)
+        yield
+
+
+def _move_all_gen(
+    windows: Sequence[Window],
+    x: float,
+    y: float,
+    duration: float,
+    ease: EasingFunc,
+) -> Animation:
+    """Generator that animates many windows to one position.
+
+    Windows share a clock and easing, so ``t`` is evaluated once per frame
+    and applied to per-window start/delta arrays.
+    """
+    wins = list(windows)
+    starts_x = [win.x for win in wins]
+    starts_y = [win.y for win in wins]
+    deltas_x = [x - sx for sx in starts_x]
+    deltas_y = [y - sy for sy in starts_y]
+    perf_counter = time.perf_counter
+    start_time = perf_counter()
+    end_time = start_time + duration
+    inv_duration = 1.0 / duration if duration > 0 else 0.0
+    is_linear = ease is linear
+
+    while True:
+        now = perf_counter()
+        if now >= end_time:
+            for win in wins:
+                win.position = (x, y)
+            return
+
+        t = (now - start_time) * inv_duration
+        if not is_linear:
+            t = ease(t)
+        for win, sx, sy, dx, dy in zip(wins, starts_x, starts_y, deltas_x, deltas_y):
+            win._set_position(sx + dx * t, sy + dy * t)
+        yield
+
+
+def _bounds_all_gen(
+    windows: Sequence[Window],
+    targets: Sequence[tuple[float, float, float, float]],
+    duration: float,
+    ease: EasingFunc,
+) -> Animation:
+    """Generator that animates many windows to per-window (x, y, w, h) bounds.
+
+    Like _move_all_gen, the shared easing is evaluated once per frame for
+    the whole batch rather than once per window and property. Windows whose
+    target size equals their current size are only moved.
+    """
+    wins = list(windows)
+    starts = [(win.x, win.y, win.w, win.h) for win in wins]
+    deltas = [
+        (tx - sx, ty - sy, tw - sw, th - sh)
+        for (sx, sy, sw, sh), (tx, ty, tw, th) in zip(starts, targets)
+    ]
+    resizing = [dw != 0 or dh != 0 for _, _, dw, dh in deltas]
+    perf_counter = time.perf_counter
+    start_time = perf_counter()
+    end_time = start_time + duration
+    inv_duration = 1.0 / duration if duration > 0 else 0.0
+    is_linear = ease is linear
+
+    while True:
+        now = perf_counter()
+        if now >= end_time:
+            for win, (tx, ty, tw, th), resize in zip(wins, targets, resizing):
+                win.position = (tx, ty)
+                if resize:
+                    win.size = (tw, th)
             return
 
-        t = ease(elapsed / duration)
-        win.x = _lerp(start_x, x, t)
-        win.y = _lerp(start_y, y, t)
+        t = (now - start_time) * inv_duration
+        if not is_linear:
+            t = ease(t)
+        for win, (sx, sy, sw, sh), (dx, dy, dw, dh), resize in zip(
+            wins, starts, deltas, resizing
+        ):
+            win._set_position(sx + dx * t, sy + dy * t)
+            if resize:
+                win._set_size(sw + dw * t, sh + dh * t)
         yield
 
 
@@ -76,18 +169,23 @@ def _resize_gen(
 ) -> Animation:
     """Generator that animates window size."""
     start_w, start_h = win.w, win.h
-    start_time = time.perf_counter()
+    dw, dh = w - start_w, h - start_h
+    perf_counter = time.perf_counter
+    start_time = perf_counter()
+    end_time = start_time + duration
+    inv_duration = 1.0 / duration if duration > 0 else 0.0
+    is_linear = ease is linear
 
     while True:
-        elapsed = time.perf_counter() - start_time
-        if elapsed >= duration:
-            win.w = w
-            win.h = h
+        now = perf_counter()
+        if now >= end_time:
+            win.size = (w, h)
             return
 
-        t = ease(elapsed / duration)
-        win.w = _lerp(start_w, w, t)
-        win.h = _lerp(start_h, h, t)
+        t = (now - start_time) * inv_duration
+        if not is_linear:
+            t = ease(t)
+        win._set_size(start_w + dw * t, start_h + dh * t)
         yield
 
 
@@ -99,16 +197,23 @@ def _fade_gen(
 ) -> Animation:
     """Generator that animates window opacity."""
     start_opacity = win.opacity
-    start_time = time.perf_counter()
+    d_opacity = opacity - start_opacity
+    perf_counter = time.perf_counter
+    start_time = perf_counter()
+    end_time = start_time + duration
+    inv_duration = 1.0 / duration if duration > 0 else 0.0
+    is_linear = ease is linear
 
     while True:
-        elapsed = time.perf_counter() - start_time
-        if elapsed >= duration:
+        now = perf_counter()
+        if now >= end_time:
             win.opacity = opacity
             return
 
-        t = ease(elapsed / duration)
-        win.opacity = _lerp(start_opacity, opacity, t)
+        t = (now - start_time) * inv_duration
+        if not is_linear:
+            t = ease(t)
+        win.opacity = start_opacity + d_opacity * t
         yield
 
 
@@ -120,32 +225,45 @@ def _color_gen(
 ) -> Animation:
     """Generator that animates window color."""
     start_color = win.color
-    start_time = time.perf_counter()
+    perf_counter = time.perf_counter
+    start_time = perf_counter()
+    end_time = start_time + duration
+    inv_duration = 1.0 / duration if duration > 0 else 0.0
+    is_linear = ease is linear
 
     while True:
-        elapsed = time.perf_counter() - start_time
-        if elapsed >= duration:
+        now = perf_counter()
+        if now >= end_time:
             win.color = color
             return
 
-        t = ease(elapsed / duration)
-        win.color = start_color.lerp(color, t)
+        t = (now - start_time) * inv_duration
+        if not is_linear:
+            t = ease(t)
+        tq = int(t * 65536)
+        if 0 <= tq <= 65536:
+            win.color = start_color.lerp_q16(color, tq)
+        else:
+            win.color = start_color.lerp(color, t)
         yield
 
 
 def _parallel_gen(animations: list[Animation]) -> Animation:
     """Generator that runs multiple animations in parallel."""
-    active = list(animations)
+    # Drive each animation through its bound __next__, a per-frame step
+    # callable, rather than looking up and dispatching through next().
+    active = [anim.__next__ for anim in animations]
 
     while active:
-        still_active = []
-        for anim in active:
+        # Finished animations are removed in place (keeping order), so the
+        # steady state allocates nothing per frame.
+        i = 0
+        while i < len(active):
             try:
-                next(anim)
-                still_active.append(anim)
+                active[i]()
+                i += 1
             except StopIteration:
-                pass
-        active = still_active
+                del active[i]
         yield
 
 
@@ -157,9 +275,10 @@ def _sequence_gen(animations: list[Animation]) -> Animation:
 
 def _wait_gen(duration: float) -> Animation:
     """Generator that waits for a duration."""
-    start_time = time.perf_counter()
+    perf_counter = time.perf_counter
+    end_time = perf_counter() + duration
 
-    while time.perf_counter() - start_time < duration:
+    while perf_counter() < end_time:
         yield
 
 
@@ -253,9 +372,7 @@ def move_all(
             win.y = y
         return
 
-    ease_func = get_easing(ease)
-    animations = [_move_gen(win, x, y, duration, ease_func) for win in windows]
-    _run_animation(_parallel_gen(animations))
+    _run_animation(_move_all_gen(windows, x, y, duration, get_easing(ease)))
 
 
 def move_by(
@@ -285,11 +402,19 @@ def wait(duration: float) -> None:
     _run_animation(_wait_gen(duration))
 
 
-def parallel(*funcs: Callable[[], None]) -> None:
+def parallel(*funcs: Callable[[], None] | Animation) -> None:
     """
-    Run multiple animation functions in parallel.
+    Run multiple animations in parallel.
+
+    Animation generators (from the ``*_async`` functions) are stepped
+    together on the calling thread. Plain callables are run on threads.
 
     Usage:
+        parallel(
+            move_async(win1, 100, 100, 1.0),
+            fade_async(win2, 0.5, 1.0),
+        )
+
         parallel(
             lambda: move(win1, 100, 100, 1.0),
             lambda: move(win2, 200, 200, 1.0),
@@ -298,14 +423,30 @@ def parallel(*funcs: Callable[[], None]) -> None:
     desktop = Desktop.get()
     desktop.init()
 
+    animations: list[Animation] = []
+    callables: list[Callable[[], None]] = []
+    for func in funcs:
+        # Generators are not callable, so this also narrows the union for mypy
+        if callable(func):
+            callables.append(func)
+        else:
+            animations.append(func)
+
+    if not callables:
+        _run_animation(_parallel_gen(animations))
+        return
+
     import threading
 
     threads: list[threading.Thread] = []
-    for func in funcs:
+    for func in callables:
         t = threading.Thread(target=func)
         t.start()
         threads.append(t)
 
+    if animations:
+        _run_animation(_parallel_gen(animations))
+
     for t in threads:
         t.join()
 
@@ -1,6 +1,7 @@
 """Color primitive with parsing from names, hex, and tuples."""
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from typing import Union
 
@@ -157,6 +158,24 @@ CSS_COLORS: dict[str, tuple[int, int, int]] = {
 
 ColorLike = Union[str, tuple[int, int, int], tuple[int, int, int, int], "Color"]
 
+# Lowercases ASCII letters and drops separators in a single str.translate pass.
+_NAME_TABLE = str.maketrans(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "abcdefghijklmnopqrstuvwxyz",
+    " -_",
+)
+
+
+# Hex digit value for each byte, -1 for non-hex bytes.
+_HEX: list[int] = [
+    int(chr(c), 16) if chr(c) in "0123456789abcdefABCDEF" else -1 for c in range(256)
+]
+
+
+def _normalize_name(name: str) -> str:
+    """Normalize a color name for lookup ("Dark Slate-Gray" -> "darkslategray")."""
+    return name.translate(_NAME_TABLE)
+
 
 @dataclass(slots=True)
 class Color:
@@ -173,58 +192,65 @@ class Color:
         self.b = max(0, min(255, self.b))
         self.a = max(0, min(255, self.a))
 
+    @classmethod
+    def _new_unchecked(cls, r: int, g: int, b: int, a: int = 255) -> Color:
+        """Construct without clamping; channels must already be in [0, 255]."""
+        c = object.__new__(cls)
+        c.r = r
+        c.g = g
+        c.b = b
+        c.a = a
+        return c
+
     @classmethod
     def from_name(cls, name: str) -> Color:
         """Create a color from a CSS color name."""
-        name_lower = name.lower().replace(" ", "").replace("-", "").replace("_", "")
-        if name_lower not in CSS_COLORS:
-            raise ValueError(f"Unknown color name: {name}")
-        r, g, b = CSS_COLORS[name_lower]
-        return cls(r, g, b)
+        # Names are usually already normalized ("coral"), so try them as-is
+        # before paying for the translate pass.
+        rgb = CSS_COLORS.get(name)
+        if rgb is None:
+            rgb = CSS_COLORS.get(_normalize_name(name))
+            if rgb is None:
+                raise ValueError(f"Unknown color name: {name}")
+        return cls._new_unchecked(*rgb)
 
     @classmethod
     def from_hex(cls, hex_str: str) -> Color:
         """Create a color from a hex string (#rgb, #rgba, #rrggbb, #rrggbbaa)."""
         h = hex_str.lstrip("#")
-        if len(h) == 3:
-            r = int(h[0] * 2, 16)
-            g = int(h[1] * 2, 16)
-            b = int(h[2] * 2, 16)
-            return cls(r, g, b)
-        elif len(h) == 4:
-            r = int(h[0] * 2, 16)
-            g = int(h[1] * 2, 16)
-            b = int(h[2] * 2, 16)
-            a = int(h[3] * 2, 16)
-            return cls(r, g, b, a)
-        elif len(h) == 6:
-            r = int(h[0:2], 16)
-            g = int(h[2:4], 16)
-            b = int(h[4:6], 16)
-            return cls(r, g, b)
-        elif len(h) == 8:
-            r = int(h[0:2], 16)
-            g = int(h[2:4], 16)
-            b = int(h[4:6], 16)
-            a = int(h[6:8], 16)
-            return cls(r, g, b, a)
+        try:
+            d = h.encode("ascii")
+        except UnicodeEncodeError:
+            raise ValueError(f"Invalid hex color format: {hex_str}") from None
+        n = len(d)
+        if n == 3 or n == 4:
+            r = _HEX[d[0]] * 0x11
+            g = _HEX[d[1]] * 0x11
+            b = _HEX[d[2]] * 0x11
+            a = _HEX[d[3]] * 0x11 if n == 4 else 255
+        elif n == 6 or n == 8:
+            r = (_HEX[d[0]] << 4) | _HEX[d[1]]
+            g = (_HEX[d[2]] << 4) | _HEX[d[3]]
+            b = (_HEX[d[4]] << 4) | _HEX[d[5]]
+            a = (_HEX[d[6]] << 4) | _HEX[d[7]] if n == 8 else 255
         else:
             raise ValueError(f"Invalid hex color format: {hex_str}")
+        if (r | g | b | a) < 0:
+            raise ValueError(f"Invalid hex color format: {hex_str}")
+        return cls._new_unchecked(r, g, b, a)
 
     @classmethod
     def parse(cls, value: ColorLike) -> Color:
         """Parse a color from various formats."""
         if isinstance(value, Color):
             return value
-        if isinstance(value, str):
-            if value.startswith("#"):
-                return cls.from_hex(value)
-            return cls.from_name(value)
-        if isinstance(value, tuple):
-            if len(value) == 3:
-                return cls(value[0], value[1], value[2])
-            elif len(value) == 4:
-                return cls(value[0], value[1], value[2], value[3])
+        if isinstance(value, (str, tuple)):
+            try:
+                rgba = _parse_cached(value)
+            except TypeError:
+                # Unhashable or non-numeric tuple contents
+                raise ValueError(f"Cannot parse color from: {value}") from None
+            return cls._new_unchecked(*rgba)
         raise ValueError(f"Cannot parse color from: {value}")
 
     def as_tuple(self) -> tuple[int, int, int, int]:
@@ -245,13 +271,42 @@ class Color:
         """Return a copy with a different alpha value."""
         if isinstance(alpha, float):
             alpha = int(alpha * 255)
-        return Color(self.r, self.g, self.b, alpha)
+        return Color._new_unchecked(self.r, self.g, self.b, max(0, min(255, alpha)))
 
     def lerp(self, other: Color, t: float) -> Color:
         """Linear interpolation to another color."""
-        return Color(
-            int(self.r + (other.r - self.r) * t),
-            int(self.g + (other.g - self.g) * t),
-            int(self.b + (other.b - self.b) * t),
-            int(self.a + (other.a - self.a) * t),
+        # Between two in-range colors the result stays in range; only
+        # extrapolation (t outside [0, 1]) needs clamping.
+        r = int(self.r + (other.r - self.r) * t)
+        g = int(self.g + (other.g - self.g) * t)
+        b = int(self.b + (other.b - self.b) * t)
+        a = int(self.a + (other.a - self.a) * t)
+        if 0.0 <= t <= 1.0:
+            return Color._new_unchecked(r, g, b, a)
+        return Color(r, g, b, a)
+
+    def lerp_q16(self, other: Color, tq: int) -> Color:
+        """Integer linear interpolation with ``tq`` as Q16 fixed point.
+
+        ``tq`` must be in [0, 65536] (``int(t * 65536)`` for t in [0, 1]).
+        """
+        return Color._new_unchecked(
+            self.r + ((other.r - self.r) * tq >> 16),
+            self.g + ((other.g - self.g) * tq >> 16),
+            self.b + ((other.b - self.b) * tq >> 16),
+            self.a + ((other.a - self.a) * tq >> 16),
         )
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_cached(value: str | tuple[int, ...]) -> tuple[int, int, int, int]:
+    """Parse a hashable color value into a clamped RGBA tuple, memoizing the result."""
+    if isinstance(value, str):
+        if value.startswith("#"):
+            return Color.from_hex(value).as_tuple()
+        return Color.from_name(value).as_tuple()
+    if len(value) == 3:
+        return Color(value[0], value[1], value[2]).as_tuple()
+    elif len(value) == 4:
+        return Color(value[0], value[1], value[2], value[3]).as_tuple()
+    raise ValueError(f"Cannot parse color from: {value}")
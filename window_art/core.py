@@ -1,34 +1,189 @@
 """Desktop singleton, SDL initialization, and event loop."""
 from __future__ import annotations
 
+import ctypes
+import errno
 import os
 import signal
 import sys
 import time
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from types import FrameType
-from typing import Callable, Generator, Iterator
+from typing import Any, Callable, Generator, Iterator
 
-if sys.platform == "darwin":
-    _stderr_fd = sys.stderr.fileno()
-    _devnull_fd = os.open(os.devnull, os.O_WRONLY)
-    _saved_stderr = os.dup(_stderr_fd)
-    os.dup2(_devnull_fd, _stderr_fd)
 
-import sdl2
-import sdl2.ext
+@contextmanager
+def _quiet_stderr() -> Iterator[None]:
+    """Silence native stderr chatter from SDL on macOS (no-op elsewhere)."""
+    if sys.platform != "darwin":
+        yield
+        return
+    sys.stderr.flush()
+    stderr_fd = sys.stderr.fileno()
+    devnull_fd = os.open(os.devnull, os.O_WRONLY)
+    saved_stderr = os.dup(stderr_fd)
+    os.dup2(devnull_fd, stderr_fd)
+    try:
+        yield
+    finally:
+        os.dup2(saved_stderr, stderr_fd)
+        os.close(saved_stderr)
+        os.close(devnull_fd)
 
-if sys.platform == "darwin":
-    os.dup2(_saved_stderr, _stderr_fd)
-    os.close(_saved_stderr)
-    os.close(_devnull_fd)
+
+with _quiet_stderr():
+    import sdl2
+    import sdl2.ext
 
 from .color import ColorLike
 from .window import PaddingLike, Window
 
+# Before 3.11, time.sleep on Windows is bound by the ~15.6 ms system timer
+# tick, which is coarser than a 60 FPS frame. Raise the timer resolution to
+# 1 ms while the desktop is initialized.
+_winmm: Any = None
+if sys.platform == "win32" and sys.version_info < (3, 11):
+    try:
+        _winmm = ctypes.WinDLL("winmm")
+    except OSError:
+        pass
 
-@dataclass
+
+class _timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+# On Linux, perf_counter() reads CLOCK_MONOTONIC, so frame deadlines can be
+# handed to clock_nanosleep as absolute times. Unlike a relative sleep, an
+# interrupted or late wakeup does not push later frames back.
+_TIMER_ABSTIME = 1
+_clock_nanosleep: Any = None
+if sys.platform.startswith("linux"):
+    try:
+        _clock_nanosleep = ctypes.CDLL(None).clock_nanosleep
+        _clock_nanosleep.argtypes = [
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.POINTER(_timespec),
+            ctypes.POINTER(_timespec),
+        ]
+        _clock_nanosleep.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _clock_nanosleep = None
+
+
+# Timer slack is how far the kernel may defer a sleeping thread's wakeup to
+# batch it with others (50 us by default). run(realtime=True) drops it to 1 ns.
+_PR_SET_TIMERSLACK = 29
+_PR_GET_TIMERSLACK = 30
+_prctl: Any = None
+if sys.platform.startswith("linux"):
+    try:
+        _prctl = ctypes.CDLL(None, use_errno=True).prctl
+        _prctl.argtypes = [ctypes.c_int] + [ctypes.c_ulong] * 4
+        _prctl.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _prctl = None
+
+
+def _enter_realtime() -> Callable[[], None]:
+    """Pin the calling thread to one CPU, use SCHED_FIFO and minimal timer slack.
+
+    Linux only and best-effort: each step is skipped when unsupported or not
+    permitted (SCHED_FIFO needs CAP_SYS_NICE or an RLIMIT_RTPRIO allowance).
+    Returns a function that restores the previous settings.
+    """
+    undo: list[Callable[[], object]] = []
+
+    if hasattr(os, "sched_setaffinity"):
+        try:
+            cpus = os.sched_getaffinity(0)
+            os.sched_setaffinity(0, {min(cpus)})
+            undo.append(lambda: os.sched_setaffinity(0, cpus))
+        except OSError:
+            pass
+
+    if hasattr(os, "sched_setscheduler"):
+        try:
+            policy = os.sched_getscheduler(0)
+            param = os.sched_getparam(0)
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(10))
+            undo.append(lambda: os.sched_setscheduler(0, policy, param))
+        except OSError:
+            pass
+
+    if _prctl is not None:
+        slack = _prctl(_PR_GET_TIMERSLACK, 0, 0, 0, 0)
+        if slack > 0 and _prctl(_PR_SET_TIMERSLACK, 1, 0, 0, 0) == 0:
+            undo.append(lambda: _prctl(_PR_SET_TIMERSLACK, slack, 0, 0, 0))
+
+    def restore() -> None:
+        for fn in reversed(undo):
+            try:
+                fn()
+            except OSError:
+                pass
+
+    return restore
+
+
+def _sleep_until(deadline: float) -> None:
+    """Sleep until an absolute time.perf_counter() deadline."""
+    if _clock_nanosleep is not None:
+        sec = int(deadline)
+        ts = _timespec(sec, int((deadline - sec) * 1e9))
+        # With an absolute deadline, a sleep cut short by a signal is simply
+        # restarted with the same arguments.
+        while (
+            _clock_nanosleep(time.CLOCK_MONOTONIC, _TIMER_ABSTIME, ctypes.byref(ts), None)
+            == errno.EINTR
+        ):
+            pass
+        return
+    remaining = deadline - time.perf_counter()
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+# How early _sleep_until_precise wakes from the OS sleep before spinning.
+_SPIN_MARGIN = 0.001
+
+
+def _sleep_until_precise(deadline: float) -> None:
+    """Sleep until a deadline, busy-waiting through the last millisecond.
+
+    OS sleeps can overshoot by a timer tick; spinning the tail trades a little
+    CPU for wakeups within microseconds of the deadline.
+    """
+    perf_counter = time.perf_counter
+    if deadline - perf_counter() > _SPIN_MARGIN:
+        _sleep_until(deadline - _SPIN_MARGIN)
+    while perf_counter() < deadline:
+        pass
+
+
+_EVENT_BATCH = 64
+
+# Event constants read on every polled event; module globals are cheaper to
+# resolve than attributes on the sdl2 package.
+_SDL_QUIT = sdl2.SDL_QUIT
+_SDL_KEYDOWN = sdl2.SDL_KEYDOWN
+_SDLK_ESCAPE = sdl2.SDLK_ESCAPE
+_SDLK_C = sdl2.SDLK_c
+_KMOD_CTRL = sdl2.KMOD_CTRL
+
+# High-rate motion events the event loop never looks at. Ignoring them at the
+# source keeps them out of the queue and stops them waking an idle run().
+_IGNORED_EVENTS = (
+    sdl2.SDL_MOUSEMOTION,
+    sdl2.SDL_FINGERMOTION,
+    sdl2.SDL_JOYAXISMOTION,
+    sdl2.SDL_CONTROLLERAXISMOTION,
+)
+
+
+@dataclass(slots=True, frozen=True)
 class Screen:
     """Information about a display screen."""
 
@@ -37,6 +192,10 @@ class Screen:
     w: int
     h: int
     index: int
+    _center: tuple[int, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_center", (self.x + self.w // 2, self.y + self.h // 2))
 
     @property
     def width(self) -> int:
@@ -48,7 +207,7 @@ class Screen:
 
     @property
     def center(self) -> tuple[int, int]:
-        return (self.x + self.w // 2, self.y + self.h // 2)
+        return self._center
 
 
 class Desktop:
@@ -58,12 +217,14 @@ class Desktop:
 
     def __init__(self) -> None:
         self._initialized = False
-        self._windows: list[Window] = []
+        self._windows: dict[int, Window] = {}
+        self._active_windows: list[Window] = []
         self._running = False
         self._stop_requested = False
         self._last_update_time: float = 0.0
         self._delta_time: float = 0.0
         self._frame_count: int = 0
+        self._events = (sdl2.SDL_Event * _EVENT_BATCH)()
         self._original_sigint_handler: Callable[[int, FrameType | None], None] | int | None = None
 
     @classmethod
@@ -84,13 +245,25 @@ class Desktop:
             return
 
         sdl2.SDL_SetHint(sdl2.SDL_HINT_NO_SIGNAL_HANDLERS, b"1")
-
-        if sdl2.SDL_Init(sdl2.SDL_INIT_VIDEO) != 0:
+        # Queue draw calls until present instead of sending each to the GPU
+        # driver. SDL only turns batching on by itself when no render driver
+        # is forced, e.g. through SDL_RENDER_DRIVER.
+        sdl2.SDL_SetHint(sdl2.SDL_HINT_RENDER_BATCHING, b"1")
+
+        with _quiet_stderr():
+            result = sdl2.SDL_Init(sdl2.SDL_INIT_VIDEO)
+        if result != 0:
             raise RuntimeError(f"SDL2 initialization failed: {sdl2.SDL_GetError()}")
 
         self._original_sigint_handler = signal.signal(signal.SIGINT, self._sigint_handler)
         signal.siginterrupt(signal.SIGINT, True)
 
+        for event_type in _IGNORED_EVENTS:
+            sdl2.SDL_EventState(event_type, sdl2.SDL_IGNORE)
+
+        if _winmm is not None:
+            _winmm.timeBeginPeriod(1)
+
         self._initialized = True
         self._stop_requested = False
         self._last_update_time = time.perf_counter()
@@ -104,9 +277,13 @@ class Desktop:
             signal.signal(signal.SIGINT, self._original_sigint_handler)
             self._original_sigint_handler = None
 
-        for win in list(self._windows):
+        for win in list(self._windows.values()):
             win.close()
         self._windows.clear()
+        self._active_windows.clear()
+
+        if _winmm is not None:
+            _winmm.timeEndPeriod(1)
 
         sdl2.SDL_Quit()
         self._initialized = False
@@ -159,26 +336,29 @@ class Desktop:
             text_wrap=text_wrap,
             text_padding=text_padding,
         )
-        self._windows.append(win)
+        self._windows[win.id] = win
         return win
 
     def _remove_window(self, win: Window) -> None:
         """Remove a window from tracking (called by Window.close)."""
-        if win in self._windows:
-            self._windows.remove(win)
+        self._windows.pop(win.id, None)
+        # Unscheduling is enough: update() skips windows that are no longer
+        # scheduled, whether it is mid-pass or on the next frame, and drops them.
+        win._scheduled = False
 
     def windows(self) -> list[Window]:
         """Get all active windows."""
-        return list(self._windows)
+        return list(self._windows.values())
 
     def clear(self) -> None:
         """Close all windows."""
-        for win in list(self._windows):
+        for win in list(self._windows.values()):
             win.close()
 
     def screens(self) -> list[Screen]:
         """Get information about all screens."""
-        self.init()
+        if not self._initialized:
+            self.init()
         result = []
         num_displays = sdl2.SDL_GetNumVideoDisplays()
         for i in range(num_displays):
@@ -192,54 +372,129 @@ class Desktop:
         screens = self.screens()
         return screens[0] if screens else None
 
-    def update(self) -> bool:
-        """Process one frame. Returns False if quit was requested or Ctrl+C pressed."""
-        self.init()
+    def update(self, now: float | None = None) -> bool:
+        """Process one frame. Returns False if quit was requested or Ctrl+C pressed.
+
+        ``now`` is the frame timestamp from ``time.perf_counter()``; callers
+        that already read the clock can pass it in to avoid a second read.
+        """
+        # Inline guard: init() is a no-op after the first call, but calling it
+        # would still cost a method call every frame.
+        if not self._initialized:
+            self.init()
 
         if self._stop_requested:
             return False
 
         self._running = True
 
-        current_time = time.perf_counter()
-        self._delta_time = current_time - self._last_update_time
-        self._last_update_time = current_time
+        if now is None:
+            now = time.perf_counter()
+        self._delta_time = now - self._last_update_time
+        self._last_update_time = now
         self._frame_count += 1
 
-        event = sdl2.SDL_Event()
-        while sdl2.SDL_PollEvent(event):
-            if event.type == sdl2.SDL_QUIT:
-                return False
-            if event.type == sdl2.SDL_KEYDOWN:
-                if event.key.keysym.sym == sdl2.SDLK_ESCAPE:
+        # Pump once, then drain the queue in batches rather than paying for a
+        # pump + single-event peep per SDL_PollEvent call.
+        events = self._events
+        sdl2.SDL_PumpEvents()
+        while True:
+            n = sdl2.SDL_PeepEvents(
+                events,
+                _EVENT_BATCH,
+                sdl2.SDL_GETEVENT,
+                sdl2.SDL_FIRSTEVENT,
+                sdl2.SDL_LASTEVENT,
+            )
+            for i in range(n):
+                event = events[i]
+                etype = event.type
+                if etype == _SDL_QUIT:
                     return False
-                if event.key.keysym.sym == sdl2.SDLK_c and (event.key.keysym.mod & sdl2.KMOD_CTRL):
-                    return False
-
-        for win in self._windows:
-            if not win.closed:
-                win._apply_changes(self._delta_time)
+                if etype == _SDL_KEYDOWN:
+                    key = event.key
+                    # The first press already decided; autorepeats cannot quit.
+                    if key.repeat:
+                        continue
+                    keysym = key.keysym
+                    sym = keysym.sym
+                    if sym == _SDLK_ESCAPE:
+                        return False
+                    if sym == _SDLK_C and (keysym.mod & _KMOD_CTRL):
+                        return False
+            if n < _EVENT_BATCH:
+                break
+
+        # Only windows with pending changes or playing media are visited;
+        # they re-enter the list through Window._activate().
+        # The list is swapped out before the pass so that a worker thread from
+        # parallel() activating a window meanwhile appends to the new list.
+        if self._active_windows:
+            dt = self._delta_time
+            active, self._active_windows = self._active_windows, []
+            self._active_windows.extend(
+                [win for win in active if win._scheduled and win._apply_changes(dt)]
+            )
 
         return not self._stop_requested
 
-    def run(self, fps: float = 60.0) -> None:
-        """Run the main event loop."""
+    def run(
+        self,
+        fps: float = 60.0,
+        *,
+        realtime: bool = False,
+        precise_timing: bool = False,
+    ) -> None:
+        """Run the main event loop.
+
+        With ``realtime=True`` the loop thread is pinned to one CPU and raised
+        to SCHED_FIFO with minimal timer slack for the duration of the loop,
+        reducing wakeup jitter at high frame rates. Linux only; steps the
+        process lacks privileges for (CAP_SYS_NICE) are skipped.
+
+        With ``precise_timing=True`` each frame sleeps until about 1 ms before
+        its deadline and busy-waits the rest, for tighter pacing at the cost
+        of some CPU.
+        """
         self.init()
         self._running = True
+        sleep_until = _sleep_until_precise if precise_timing else _sleep_until
+        restore = _enter_realtime() if realtime else None
         frame_time = 1.0 / fps
+        perf_counter = time.perf_counter
+        frame_start = perf_counter()
+        deadline = frame_start + frame_time
 
         try:
             while self._running:
-                frame_start = time.perf_counter()
-
-                if not self.update():
+                if not self.update(frame_start):
                     break
 
-                elapsed = time.perf_counter() - frame_start
-                if elapsed < frame_time:
-                    time.sleep(frame_time - elapsed)
+                now = perf_counter()
+                if now < deadline:
+                    if self._is_idle():
+                        # Nothing to redraw: block on the OS event queue for
+                        # the rest of the frame so input wakes us early.
+                        timeout_ms = int((deadline - now) * 1000)
+                        sdl2.SDL_WaitEventTimeout(None, timeout_ms)
+                        frame_start = perf_counter()
+                    else:
+                        # We slept until the deadline, so it doubles as the
+                        # next frame's timestamp without another clock read.
+                        sleep_until(deadline)
+                        frame_start = deadline
+                    deadline += frame_time
+                else:
+                    deadline += frame_time * (int((now - deadline) / frame_time) + 1)
+                    frame_start = now
         finally:
             self._running = False
+            if restore is not None:
+                restore()
+
+    def _is_idle(self) -> bool:
+        """Whether no window has pending changes or playing media."""
+        return not self._active_windows
 
     def stop(self) -> None:
         """Stop the main event loop."""
@@ -357,14 +612,14 @@ def primary_screen() -> Screen | None:
     return Desktop.get().primary_screen()
 
 
-def update() -> bool:
+def update(now: float | None = None) -> bool:
     """Process one frame."""
-    return Desktop.get().update()
+    return Desktop.get().update(now)
 
 
-def run(fps: float = 60.0) -> None:
+def run(fps: float = 60.0, *, realtime: bool = False, precise_timing: bool = False) -> None:
     """Run the main event loop."""
-    Desktop.get().run(fps)
+    Desktop.get().run(fps, realtime=realtime, precise_timing=precise_timing)
 
 
 def stop() -> None:
@@ -1,11 +1,32 @@
 """Easing functions for smooth animations."""
 from __future__ import annotations
 
+import functools
 import math
 from typing import Callable
 
 EasingFunc = Callable[[float], float]
 
+# Small integer powers are written as repeated multiplication, which skips the
+# generic float pow() call.
+#
+# Constants are folded once here rather than rebuilt on every call, since
+# easings run per animated property per frame.
+_HALF_PI = math.pi / 2
+_BACK_C1 = 1.70158
+_BACK_C2 = _BACK_C1 * 1.525
+_BACK_C3 = _BACK_C1 + 1
+_ELASTIC_C4 = (2 * math.pi) / 3
+_ELASTIC_C5 = (2 * math.pi) / 4.5
+_BOUNCE_N1 = 7.5625
+_BOUNCE_D1 = 2.75
+_BOUNCE_T1 = 1 / _BOUNCE_D1
+_BOUNCE_T2 = 2 / _BOUNCE_D1
+_BOUNCE_T3 = 2.5 / _BOUNCE_D1
+_BOUNCE_O2 = 1.5 / _BOUNCE_D1
+_BOUNCE_O3 = 2.25 / _BOUNCE_D1
+_BOUNCE_O4 = 2.625 / _BOUNCE_D1
+
 
 def linear(t: float) -> float:
     """Linear interpolation (no easing)."""
@@ -19,14 +40,16 @@ def ease_in_quad(t: float) -> float:
 
 def ease_out_quad(t: float) -> float:
     """Quadratic ease-out."""
-    return 1 - (1 - t) * (1 - t)
+    u = 1 - t
+    return 1 - u * u
 
 
 def ease_in_out_quad(t: float) -> float:
     """Quadratic ease-in-out."""
     if t < 0.5:
         return 2 * t * t
-    return 1 - (-2 * t + 2) ** 2 / 2
+    u = 2 - 2 * t
+    return 1 - u * u / 2
 
 
 def ease_in_cubic(t: float) -> float:
@@ -36,14 +59,16 @@ def ease_in_cubic(t: float) -> float:
 
 def ease_out_cubic(t: float) -> float:
     """Cubic ease-out."""
-    return 1 - (1 - t) ** 3
+    u = 1 - t
+    return 1 - u * u * u
 
 
 def ease_in_out_cubic(t: float) -> float:
     """Cubic ease-in-out."""
     if t < 0.5:
         return 4 * t * t * t
-    return 1 - (-2 * t + 2) ** 3 / 2
+    u = 2 - 2 * t
+    return 1 - u * u * u / 2
 
 
 def ease_in_quart(t: float) -> float:
@@ -53,14 +78,18 @@ def ease_in_quart(t: float) -> float:
 
 def ease_out_quart(t: float) -> float:
     """Quartic ease-out."""
-    return 1 - (1 - t) ** 4
+    u = 1 - t
+    u *= u
+    return 1 - u * u
 
 
 def ease_in_out_quart(t: float) -> float:
     """Quartic ease-in-out."""
     if t < 0.5:
         return 8 * t * t * t * t
-    return 1 - (-2 * t + 2) ** 4 / 2
+    u = 2 - 2 * t
+    u *= u
+    return 1 - u * u / 2
 
 
 def ease_in_quint(t: float) -> float:
@@ -70,24 +99,26 @@ def ease_in_quint(t: float) -> float:
 
 def ease_out_quint(t: float) -> float:
     """Quintic ease-out."""
-    return 1 - (1 - t) ** 5
+    u = 1 - t
+    return 1 - u * u * u * u * u
 
 
 def ease_in_out_quint(t: float) -> float:
     """Quintic ease-in-out."""
     if t < 0.5:
         return 16 * t * t * t * t * t
-    return 1 - (-2 * t + 2) ** 5 / 2
+    u = 2 - 2 * t
+    return 1 - u * u * u * u * u / 2
 
 
 def ease_in_sine(t: float) -> float:
     """Sinusoidal ease-in."""
-    return 1 - math.cos(t * math.pi / 2)
+    return 1 - math.cos(t * _HALF_PI)
 
 
 def ease_out_sine(t: float) -> float:
     """Sinusoidal ease-out."""
-    return math.sin(t * math.pi / 2)
+    return math.sin(t * _HALF_PI)
 
 
 def ease_in_out_sine(t: float) -> float:
@@ -139,22 +170,17 @@ def ease_in_out_circ(t: float) -> float:
 
 def ease_in_back(t: float) -> float:
     """Back ease-in (overshoots at start)."""
-    c1 = 1.70158
-    c3 = c1 + 1
-    return c3 * t * t * t - c1 * t * t
+    return _BACK_C3 * t * t * t - _BACK_C1 * t * t
 
 
 def ease_out_back(t: float) -> float:
     """Back ease-out (overshoots at end)."""
-    c1 = 1.70158
-    c3 = c1 + 1
-    return 1 + c3 * (t - 1) ** 3 + c1 * (t - 1) ** 2
+    return 1 + _BACK_C3 * (t - 1) ** 3 + _BACK_C1 * (t - 1) ** 2
 
 
 def ease_in_out_back(t: float) -> float:
     """Back ease-in-out (overshoots at both ends)."""
-    c1 = 1.70158
-    c2 = c1 * 1.525
+    c2 = _BACK_C2
     if t < 0.5:
         return ((2 * t) ** 2 * ((c2 + 1) * 2 * t - c2)) / 2
     return ((2 * t - 2) ** 2 * ((c2 + 1) * (t * 2 - 2) + c2) + 2) / 2
@@ -166,8 +192,7 @@ def ease_in_elastic(t: float) -> float:
         return 0
     if t == 1:
         return 1
-    c4 = (2 * math.pi) / 3
-    return -(2 ** (10 * t - 10)) * math.sin((t * 10 - 10.75) * c4)
+    return -(2 ** (10 * t - 10)) * math.sin((t * 10 - 10.75) * _ELASTIC_C4)
 
 
 def ease_out_elastic(t: float) -> float:
@@ -176,8 +201,7 @@ def ease_out_elastic(t: float) -> float:
         return 0
     if t == 1:
         return 1
-    c4 = (2 * math.pi) / 3
-    return 2 ** (-10 * t) * math.sin((t * 10 - 0.75) * c4) + 1
+    return 2 ** (-10 * t) * math.sin((t * 10 - 0.75) * _ELASTIC_C4) + 1
 
 
 def ease_in_out_elastic(t: float) -> float:
@@ -186,7 +210,7 @@ def ease_in_out_elastic(t: float) -> float:
         return 0
     if t == 1:
         return 1
-    c5 = (2 * math.pi) / 4.5
+    c5 = _ELASTIC_C5
     if t < 0.5:
         return -(2 ** (20 * t - 10) * math.sin((20 * t - 11.125) * c5)) / 2
     return (2 ** (-20 * t + 10) * math.sin((20 * t - 11.125) * c5)) / 2 + 1
@@ -194,24 +218,36 @@ def ease_in_out_elastic(t: float) -> float:
 
 def ease_out_bounce(t: float) -> float:
     """Bounce ease-out."""
-    n1 = 7.5625
-    d1 = 2.75
-    if t < 1 / d1:
+    n1 = _BOUNCE_N1
+    if t < _BOUNCE_T1:
         return n1 * t * t
-    elif t < 2 / d1:
-        t -= 1.5 / d1
+    elif t < _BOUNCE_T2:
+        t -= _BOUNCE_O2
         return n1 * t * t + 0.75
-    elif t < 2.5 / d1:
-        t -= 2.25 / d1
+    elif t < _BOUNCE_T3:
+        t -= _BOUNCE_O3
         return n1 * t * t + 0.9375
     else:
-        t -= 2.625 / d1
+        t -= _BOUNCE_O4
         return n1 * t * t + 0.984375
 
 
 def ease_in_bounce(t: float) -> float:
     """Bounce ease-in."""
-    return 1 - ease_out_bounce(1 - t)
+    # ease_out_bounce(1 - t) inlined to skip a Python call per frame.
+    t = 1 - t
+    n1 = _BOUNCE_N1
+    if t < _BOUNCE_T1:
+        return 1 - n1 * t * t
+    elif t < _BOUNCE_T2:
+        t -= _BOUNCE_O2
+        return 1 - (n1 * t * t + 0.75)
+    elif t < _BOUNCE_T3:
+        t -= _BOUNCE_O3
+        return 1 - (n1 * t * t + 0.9375)
+    else:
+        t -= _BOUNCE_O4
+        return 1 - (n1 * t * t + 0.984375)
 
 
 def ease_in_out_bounce(t: float) -> float:
@@ -265,9 +301,22 @@ EASING_FUNCTIONS: dict[str, EasingFunc] = {
 
 
 def get_easing(name: str | EasingFunc) -> EasingFunc:
-    """Get an easing function by name or return the function if already callable."""
+    """Get an easing function by name or return the function if already callable.
+
+    Canonical names ("ease_out") are a direct table lookup; other spellings
+    ("Ease-Out") are normalized once and memoized.
+    """
     if callable(name):
         return name
+    func = EASING_FUNCTIONS.get(name)
+    if func is not None:
+        return func
+    return _easing_by_name(name)
+
+
+@functools.lru_cache(maxsize=64)
+def _easing_by_name(name: str) -> EasingFunc:
+    """Resolve an easing name (case, '-' and ' ' insensitive)."""
     name_normalized = name.lower().replace("-", "_").replace(" ", "_")
     if name_normalized not in EASING_FUNCTIONS:
         raise ValueError(
@@ -1,18 +1,28 @@
 """CSS Grid-like layout system for desktop windows."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Iterator, Sequence, overload
+import functools
+from array import array
+from dataclasses import dataclass, field
+from itertools import accumulate, chain, repeat
+from typing import Any, Callable, Iterator, NamedTuple, Sequence, overload
 
-from .animate import _parallel_gen, _run_animation, move_async, resize_async
+from .animate import _bounds_all_gen, _run_animation
 from .color import ColorLike
 from .core import Desktop
 from .easing import EasingFunc, get_easing, linear
 from .media import get_gif_size, get_image_size, get_video_size
 from .window import Window
 
+# Media kind -> (size getter, Window region attribute) for Grid._fill_media.
+_MEDIA_FILLS: dict[str, tuple[Callable[[str], tuple[int, int]], str]] = {
+    "image": (get_image_size, "image_region"),
+    "gif": (get_gif_size, "gif_region"),
+    "video": (get_video_size, "video_region"),
+}
 
-@dataclass(slots=True)
+
+@dataclass(slots=True, frozen=True)
 class TrackSize:
     """Represents a grid track size (column width or row height).
 
@@ -22,6 +32,11 @@ class TrackSize:
     """
     value: float
     unit: str
+    # Unit as a flag, so track sizing tests a bool rather than comparing strings.
+    _fr: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_fr", self.unit == "fr")
 
     @classmethod
     def parse(cls, spec: str) -> TrackSize:
@@ -34,20 +49,18 @@ class TrackSize:
             "100" -> TrackSize(100.0, "px")
         """
         spec = spec.strip()
-        if spec.endswith("fr"):
-            value = float(spec[:-2])
-            return cls(value, "fr")
-        elif spec.endswith("px"):
-            value = float(spec[:-2])
-            return cls(value, "px")
-        else:
-            value = float(spec)
-            return cls(value, "px")
+        suffix = spec[-2:]
+        if suffix == "fr" or suffix == "px":
+            return cls(float(spec[:-2]), suffix)
+        return cls(float(spec), "px")
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class CellSpec:
-    """Specification for a grid cell's computed position and size."""
+    """Specification for a grid cell's computed position and size.
+
+    Immutable and hashable, so specs can be cached and shared.
+    """
     x: float
     y: float
     w: float
@@ -56,14 +69,32 @@ class CellSpec:
     col: int
 
 
-def _parse_template(template: str) -> list[TrackSize]:
-    """Parse a space-separated template string into track sizes."""
-    parts = template.split()
-    return [TrackSize.parse(p) for p in parts]
+class GridLayoutArrays(NamedTuple):
+    """Grid cell geometry as parallel row-major arrays (one entry per cell).
+
+    A compact alternative to a list of CellSpec objects: each field is a
+    single contiguous ``array.array`` buffer.
+    """
+    xs: array[float]
+    ys: array[float]
+    ws: array[float]
+    hs: array[float]
+    rows: array[int]
+    cols: array[int]
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_template(template: str) -> tuple[TrackSize, ...]:
+    """Parse a space-separated template string into track sizes.
+
+    Templates are usually a handful of literals reused across grids, so the
+    parsed (immutable) tracks are memoized and shared.
+    """
+    return tuple(TrackSize.parse(p) for p in template.split())
 
 
 def _compute_track_sizes(
-    tracks: list[TrackSize],
+    tracks: Sequence[TrackSize],
     available: float,
     gap: float,
 ) -> list[float]:
@@ -77,30 +108,45 @@ def _compute_track_sizes(
     num_gaps = len(tracks) - 1 if len(tracks) > 1 else 0
     usable = available - (gap * num_gaps)
 
-    fixed_total = sum(t.value for t in tracks if t.unit == "px")
-    fr_total = sum(t.value for t in tracks if t.unit == "fr")
+    # One pass collects both totals; the second only scales the fr tracks.
+    fixed_total = 0.0
+    fr_total = 0.0
+    for track in tracks:
+        if track._fr:
+            fr_total += track.value
+        else:
+            fixed_total += track.value
 
     remaining = max(0.0, usable - fixed_total)
     fr_unit = remaining / fr_total if fr_total > 0 else 0.0
 
-    sizes = []
-    for track in tracks:
-        if track.unit == "px":
-            sizes.append(track.value)
-        else:
-            sizes.append(track.value * fr_unit)
-
-    return sizes
+    return [t.value * fr_unit if t._fr else t.value for t in tracks]
 
 
-def _compute_track_positions(sizes: list[float], start: float, gap: float) -> list[float]:
+def _compute_track_positions(sizes: Sequence[float], start: float, gap: float) -> list[float]:
     """Compute starting positions for each track."""
-    positions = []
-    pos = start
-    for size in sizes:
-        positions.append(pos)
-        pos += size + gap
-    return positions
+    if not sizes:
+        return []
+    # Running sum of (size + gap), starting at `start`; the last track's size
+    # is not needed since no track follows it.
+    return list(accumulate((size + gap for size in sizes[:-1]), initial=start))
+
+
+@functools.lru_cache(maxsize=64)
+def _track_layout(
+    tracks: tuple[TrackSize, ...],
+    start: float,
+    available: float,
+    gap: float,
+) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """Compute (sizes, positions) for one axis, memoized.
+
+    Grids are re-laid out with the same templates and bounds over and over
+    (swaps, animate_to round trips, repeated grid_layout calls), so results
+    are cached as immutable tuples keyed by the parsed tracks and geometry.
+    """
+    sizes = _compute_track_sizes(tracks, available, gap)
+    return tuple(sizes), tuple(_compute_track_positions(sizes, start, gap))
 
 
 def grid_layout(
@@ -131,25 +177,33 @@ def grid_layout(
     col_tracks = _parse_template(columns)
     row_tracks = _parse_template(rows)
 
-    col_sizes = _compute_track_sizes(col_tracks, w, col_gap)
-    row_sizes = _compute_track_sizes(row_tracks, h, row_gap)
-
-    col_positions = _compute_track_positions(col_sizes, x, col_gap)
-    row_positions = _compute_track_positions(row_sizes, y, row_gap)
-
-    cells = []
-    for row_idx, (row_pos, row_size) in enumerate(zip(row_positions, row_sizes)):
-        for col_idx, (col_pos, col_size) in enumerate(zip(col_positions, col_sizes)):
-            cells.append(CellSpec(
-                x=col_pos,
-                y=row_pos,
-                w=col_size,
-                h=row_size,
-                row=row_idx,
-                col=col_idx,
-            ))
+    col_sizes, col_positions = _track_layout(col_tracks, x, w, col_gap)
+    row_sizes, row_positions = _track_layout(row_tracks, y, h, row_gap)
+
+    # The column tuples are built once and reused for every row; CellSpec is
+    # constructed positionally as (x, y, w, h, row, col).
+    cols = list(enumerate(zip(col_positions, col_sizes)))
+    return [
+        CellSpec(col_pos, row_pos, col_size, row_size, row_idx, col_idx)
+        for row_idx, (row_pos, row_size) in enumerate(zip(row_positions, row_sizes))
+        for col_idx, (col_pos, col_size) in cols
+    ]
+
 
-    return cells
+def _place(win: Window, spec: CellSpec) -> None:
+    """Move and resize a window to a cell spec, skipping unchanged values.
+
+    Windows already in place aren't re-dirtied and re-sent to SDL.
+    """
+    position = (spec.x, spec.y)
+    if win.position != position:
+        win.position = position
+    size = (spec.w, spec.h)
+    if win.size != size:
+        win.size = size
+
+
+_Tracks = tuple[tuple[float, ...], tuple[float, ...], tuple[float, ...], tuple[float, ...]]
 
 
 class Grid:
@@ -196,9 +250,22 @@ class Grid:
         self._col_tracks = _parse_template(columns)
         self._row_tracks = _parse_template(rows)
 
-        self._windows: dict[tuple[int, int], Window] = {}
-
-        self._spans: dict[tuple[int, int], tuple[int, int]] = {}
+        # Dense row-major cell tables: the window anchored at each cell (or
+        # None) and its (rowspan, colspan).
+        self._windows: list[list[Window | None]] = []
+        self._spans: list[list[tuple[int, int]]] = []
+        self._count = 0
+        # (row, col, window, rowspan, colspan) for occupied cells, rebuilt
+        # lazily after cells change.
+        self._live: list[tuple[int, int, Window, int, int]] | None = None
+        # Per-cell CellSpec table for the current bounds and spans; dropped
+        # when the grid moves, patched in place when a cell's span changes.
+        self._specs: list[list[CellSpec]] | None = None
+        self._reset_cells()
+
+        # (col_sizes, col_positions, row_sizes, row_positions) for the current
+        # bounds; rebuilt lazily after the grid is moved or resized.
+        self._tracks: _Tracks | None = None
 
     @property
     def x(self) -> float:
@@ -237,6 +304,43 @@ class Grid:
             return (self._gap, self._gap)
         return self._gap
 
+    def _reset_cells(self) -> None:
+        """Empty every cell."""
+        num_rows, num_cols = self.num_rows, self.num_cols
+        self._windows = [[None] * num_cols for _ in range(num_rows)]
+        self._spans = [[(1, 1)] * num_cols for _ in range(num_rows)]
+        self._count = 0
+        self._live = None
+        self._specs = None
+
+    def _live_cells(self) -> list[tuple[int, int, Window, int, int]]:
+        """Get (row, col, window, rowspan, colspan) for every occupied cell."""
+        live = self._live
+        if live is None:
+            live = self._live = [
+                (row, col, win, *row_spans[col])
+                for row, (row_windows, row_spans) in enumerate(zip(self._windows, self._spans))
+                for col, win in enumerate(row_windows)
+                if win is not None
+            ]
+        return live
+
+    def _set_bounds(self, x: float, y: float, w: float, h: float) -> None:
+        """Set the grid bounds and invalidate the cached tracks."""
+        self._x, self._y, self._w, self._h = float(x), float(y), float(w), float(h)
+        self._tracks = None
+        self._specs = None
+
+    def _get_tracks(self) -> _Tracks:
+        """Get (col_sizes, col_positions, row_sizes, row_positions), cached."""
+        tracks = self._tracks
+        if tracks is None:
+            col_gap, row_gap = self.gap
+            col_sizes, col_positions = _track_layout(self._col_tracks, self._x, self._w, col_gap)
+            row_sizes, row_positions = _track_layout(self._row_tracks, self._y, self._h, row_gap)
+            tracks = self._tracks = (col_sizes, col_positions, row_sizes, row_positions)
+        return tracks
+
     def _compute_cell(
         self,
         row: int,
@@ -246,12 +350,7 @@ class Grid:
     ) -> CellSpec:
         """Compute the position and size for a cell (with optional spanning)."""
         col_gap, row_gap = self.gap
-
-        col_sizes = _compute_track_sizes(self._col_tracks, self._w, col_gap)
-        row_sizes = _compute_track_sizes(self._row_tracks, self._h, row_gap)
-
-        col_positions = _compute_track_positions(col_sizes, self._x, col_gap)
-        row_positions = _compute_track_positions(row_sizes, self._y, row_gap)
+        col_sizes, col_positions, row_sizes, row_positions = self._get_tracks()
 
         cell_x = col_positions[col]
         cell_y = row_positions[row]
@@ -266,10 +365,46 @@ class Grid:
 
         return CellSpec(x=cell_x, y=cell_y, w=cell_w, h=cell_h, row=row, col=col)
 
+    def _compute_all_specs(self) -> list[list[CellSpec]]:
+        """Compute specs for every cell, using each cell's span, in one batch.
+
+        Same results as _compute_cell, but the tracks and gaps are fetched
+        once for the whole grid instead of once per cell. The table is cached
+        until the grid is moved, resized or cleared; callers must not mutate it.
+        """
+        if self._specs is not None:
+            return self._specs
+
+        col_gap, row_gap = self.gap
+        col_sizes, col_positions, row_sizes, row_positions = self._get_tracks()
+
+        specs: list[list[CellSpec]] = []
+        for row, row_spans in enumerate(self._spans):
+            cell_y = row_positions[row]
+            row_specs: list[CellSpec] = []
+            for col, (rowspan, colspan) in enumerate(row_spans):
+                if colspan == 1:
+                    cell_w = col_sizes[col]
+                else:
+                    cell_w = sum(col_sizes[col:col + colspan]) + col_gap * (colspan - 1)
+                if rowspan == 1:
+                    cell_h = row_sizes[row]
+                else:
+                    cell_h = sum(row_sizes[row:row + rowspan]) + row_gap * (rowspan - 1)
+                row_specs.append(CellSpec(col_positions[col], cell_y, cell_w, cell_h, row, col))
+            specs.append(row_specs)
+        self._specs = specs
+        return specs
+
+    def _refresh_spec(self, row: int, col: int) -> None:
+        """Recompute the cached spec for one cell after its span changed."""
+        if self._specs is not None:
+            rowspan, colspan = self._spans[row][col]
+            self._specs[row][col] = self._compute_cell(row, col, rowspan, colspan)
+
     def get_cell_spec(self, row: int, col: int) -> CellSpec:
         """Get the computed specification for a cell."""
-        rowspan, colspan = self._spans.get((row, col), (1, 1))
-        return self._compute_cell(row, col, rowspan, colspan)
+        return self._compute_all_specs()[row][col]
 
     def cell(
         self,
@@ -293,24 +428,27 @@ class Grid:
         Returns:
             The created Window
         """
-        if row < 0 or row >= self.num_rows:
-            raise ValueError(f"Row {row} out of range [0, {self.num_rows})")
-        if col < 0 or col >= self.num_cols:
-            raise ValueError(f"Column {col} out of range [0, {self.num_cols})")
+        self._check_cell(row, col)
         if row + rowspan > self.num_rows:
             raise ValueError(f"Row span exceeds grid bounds")
         if col + colspan > self.num_cols:
             raise ValueError(f"Column span exceeds grid bounds")
 
-        if (row, col) in self._windows:
-            self._windows[(row, col)].close()
+        existing = self._windows[row][col]
+        if existing is not None:
+            existing.close()
 
         spec = self._compute_cell(row, col, rowspan, colspan)
         desktop = Desktop.get()
         win = desktop.window(spec.x, spec.y, spec.w, spec.h, color=color, **kwargs)
 
-        self._windows[(row, col)] = win
-        self._spans[(row, col)] = (rowspan, colspan)
+        if existing is None:
+            self._count += 1
+        self._windows[row][col] = win
+        if self._spans[row][col] != (rowspan, colspan):
+            self._spans[row][col] = (rowspan, colspan)
+            self._refresh_spec(row, col)
+        self._live = None
 
         return win
 
@@ -340,7 +478,7 @@ class Grid:
                 if color_idx >= len(colors):
                     return windows
 
-                if (row, col) in self._windows:
+                if self._windows[row][col] is not None:
                     continue
 
                 win = self.cell(row, col, color=colors[color_idx], **kwargs)
@@ -349,60 +487,63 @@ class Grid:
 
         return windows
 
-    def fill_image(
-        self,
-        image_path: str,
-        **kwargs: Any,
-    ) -> list[Window]:
-        """Fill the grid with a single image split across all cells.
-
-        Each cell displays a portion of the image corresponding to its
-        position in the grid, creating a tiled/split image effect.
+    def _fill_media(self, kind: str, path: str, **kwargs: Any) -> list[Window]:
+        """Split one image, GIF or video across all cells.
 
         Args:
-            image_path: Path to the image file
+            kind: "image", "gif" or "video" (the window() keyword to pass)
+            path: Path to the media file
             **kwargs: Additional arguments passed to window()
 
         Returns:
             List of created windows
         """
-        img_w, img_h = get_image_size(image_path)
+        size_fn, region_attr = _MEDIA_FILLS[kind]
+        media_w, media_h = size_fn(path)
 
-        col_gap, row_gap = self.gap
-        col_sizes = _compute_track_sizes(self._col_tracks, self._w, col_gap)
-        row_sizes = _compute_track_sizes(self._row_tracks, self._h, row_gap)
+        col_sizes, _, row_sizes, _ = self._get_tracks()
+        col_scale = media_w / sum(col_sizes)
+        row_scale = media_h / sum(row_sizes)
 
-        total_col = sum(col_sizes)
-        total_row = sum(row_sizes)
+        # Integer source edges from prefix sums: each tile starts where the
+        # previous one ends, and the last edge is exactly the media size.
+        xs = [int(pos * col_scale) for pos in accumulate(col_sizes, initial=0.0)]
+        ys = [int(pos * row_scale) for pos in accumulate(row_sizes, initial=0.0)]
+        xs[-1] = media_w
+        ys[-1] = media_h
 
         windows: list[Window] = []
+        media_kwargs = {kind: path, **kwargs}
 
-        img_y = 0.0
         for row in range(self.num_rows):
-            img_x = 0.0
-            row_h = (row_sizes[row] / total_row) * img_h
-
+            src_y = ys[row]
+            src_h = ys[row + 1] - src_y
             for col in range(self.num_cols):
-                col_w = (col_sizes[col] / total_col) * img_w
+                src_x = xs[col]
+                win = self.cell(row, col, **media_kwargs)
+                setattr(win, region_attr, (src_x, src_y, xs[col + 1] - src_x, src_h))
+                windows.append(win)
 
-                src_x = int(img_x)
-                src_y = int(img_y)
-                src_w = int(col_w)
-                src_h = int(row_h)
+        return windows
 
-                if col == self.num_cols - 1:
-                    src_w = img_w - src_x
-                if row == self.num_rows - 1:
-                    src_h = img_h - src_y
+    def fill_image(
+        self,
+        image_path: str,
+        **kwargs: Any,
+    ) -> list[Window]:
+        """Fill the grid with a single image split across all cells.
 
-                win = self.cell(row, col, image=image_path, **kwargs)
-                win.image_region = (src_x, src_y, src_w, src_h)
-                windows.append(win)
+        Each cell displays a portion of the image corresponding to its
+        position in the grid, creating a tiled/split image effect.
 
-                img_x += col_w
-            img_y += row_h
+        Args:
+            image_path: Path to the image file
+            **kwargs: Additional arguments passed to window()
 
-        return windows
+        Returns:
+            List of created windows
+        """
+        return self._fill_media("image", image_path, **kwargs)
 
     def fill_gif(
         self,
@@ -421,43 +562,7 @@ class Grid:
         Returns:
             List of created windows
         """
-        gif_w, gif_h = get_gif_size(gif_path)
-
-        col_gap, row_gap = self.gap
-        col_sizes = _compute_track_sizes(self._col_tracks, self._w, col_gap)
-        row_sizes = _compute_track_sizes(self._row_tracks, self._h, row_gap)
-
-        total_col = sum(col_sizes)
-        total_row = sum(row_sizes)
-
-        windows: list[Window] = []
-
-        gif_y = 0.0
-        for row in range(self.num_rows):
-            gif_x = 0.0
-            row_h = (row_sizes[row] / total_row) * gif_h
-
-            for col in range(self.num_cols):
-                col_w = (col_sizes[col] / total_col) * gif_w
-
-                src_x = int(gif_x)
-                src_y = int(gif_y)
-                src_w = int(col_w)
-                src_h = int(row_h)
-
-                if col == self.num_cols - 1:
-                    src_w = gif_w - src_x
-                if row == self.num_rows - 1:
-                    src_h = gif_h - src_y
-
-                win = self.cell(row, col, gif=gif_path, **kwargs)
-                win.gif_region = (src_x, src_y, src_w, src_h)
-                windows.append(win)
-
-                gif_x += col_w
-            gif_y += row_h
-
-        return windows
+        return self._fill_media("gif", gif_path, **kwargs)
 
     def fill_video(
         self,
@@ -476,43 +581,7 @@ class Grid:
         Returns:
             List of created windows
         """
-        vid_w, vid_h = get_video_size(video_path)
-
-        col_gap, row_gap = self.gap
-        col_sizes = _compute_track_sizes(self._col_tracks, self._w, col_gap)
-        row_sizes = _compute_track_sizes(self._row_tracks, self._h, row_gap)
-
-        total_col = sum(col_sizes)
-        total_row = sum(row_sizes)
-
-        windows: list[Window] = []
-
-        vid_y = 0.0
-        for row in range(self.num_rows):
-            vid_x = 0.0
-            row_h = (row_sizes[row] / total_row) * vid_h
-
-            for col in range(self.num_cols):
-                col_w = (col_sizes[col] / total_col) * vid_w
-
-                src_x = int(vid_x)
-                src_y = int(vid_y)
-                src_w = int(col_w)
-                src_h = int(row_h)
-
-                if col == self.num_cols - 1:
-                    src_w = vid_w - src_x
-                if row == self.num_rows - 1:
-                    src_h = vid_h - src_y
-
-                win = self.cell(row, col, video=video_path, **kwargs)
-                win.video_region = (src_x, src_y, src_w, src_h)
-                windows.append(win)
-
-                vid_x += col_w
-            vid_y += row_h
-
-        return windows
+        return self._fill_media("video", video_path, **kwargs)
 
     @overload
     def __getitem__(self, key: tuple[int, int]) -> Window: ...
@@ -527,9 +596,10 @@ class Grid:
             col = key % self.num_cols
             key = (row, col)
 
-        if key not in self._windows:
+        win = self._get(*key)
+        if win is None:
             raise KeyError(f"No window at {key}")
-        return self._windows[key]
+        return win
 
     def __contains__(self, key: tuple[int, int] | int) -> bool:
         """Check if a cell has a window."""
@@ -537,41 +607,41 @@ class Grid:
             row = key // self.num_cols
             col = key % self.num_cols
             key = (row, col)
-        return key in self._windows
+        return self._get(*key) is not None
 
     def __iter__(self) -> Iterator[Window]:
         """Iterate over windows in row-major order."""
-        for row in range(self.num_rows):
-            for col in range(self.num_cols):
-                if (row, col) in self._windows:
-                    yield self._windows[(row, col)]
+        for row_windows in self._windows:
+            for win in row_windows:
+                if win is not None:
+                    yield win
 
     def __len__(self) -> int:
         """Number of windows in the grid."""
-        return len(self._windows)
+        return self._count
+
+    def _get(self, row: int, col: int) -> Window | None:
+        """Get the window anchored at a cell, or None (also when out of range)."""
+        if 0 <= row < self.num_rows and 0 <= col < self.num_cols:
+            return self._windows[row][col]
+        return None
 
     def _update_all_windows(self) -> None:
         """Update all window positions and sizes based on current grid bounds."""
-        for (row, col), win in self._windows.items():
+        specs = self._compute_all_specs()
+        for row, col, win, _, _ in self._live_cells():
             if win.closed:
                 continue
-            rowspan, colspan = self._spans.get((row, col), (1, 1))
-            spec = self._compute_cell(row, col, rowspan, colspan)
-            win.x = spec.x
-            win.y = spec.y
-            win.w = spec.w
-            win.h = spec.h
+            _place(win, specs[row][col])
 
     def move_to(self, x: float, y: float) -> None:
         """Move the grid to a new position (instant)."""
-        self._x = float(x)
-        self._y = float(y)
+        self._set_bounds(x, y, self._w, self._h)
         self._update_all_windows()
 
     def resize_to(self, w: float, h: float) -> None:
         """Resize the grid (instant)."""
-        self._w = float(w)
-        self._h = float(h)
+        self._set_bounds(self._x, self._y, w, h)
         self._update_all_windows()
 
     def animate_to(
@@ -588,70 +658,63 @@ class Grid:
         All windows are animated in parallel to their new positions.
         """
         if duration <= 0:
-            self._x = float(x)
-            self._y = float(y)
-            self._w = float(w)
-            self._h = float(h)
+            self._set_bounds(x, y, w, h)
             self._update_all_windows()
             return
 
         old_x, old_y, old_w, old_h = self._x, self._y, self._w, self._h
 
-        self._x, self._y, self._w, self._h = float(x), float(y), float(w), float(h)
+        self._set_bounds(x, y, w, h)
 
-        targets: dict[tuple[int, int], CellSpec] = {}
-        for (row, col), win in self._windows.items():
+        windows: list[Window] = []
+        bounds: list[tuple[float, float, float, float]] = []
+        specs = self._compute_all_specs()
+        for row, col, win, _, _ in self._live_cells():
             if win.closed:
                 continue
-            rowspan, colspan = self._spans.get((row, col), (1, 1))
-            targets[(row, col)] = self._compute_cell(row, col, rowspan, colspan)
+            target = specs[row][col]
+            windows.append(win)
+            bounds.append((target.x, target.y, target.w, target.h))
 
-        self._x, self._y, self._w, self._h = old_x, old_y, old_w, old_h
+        self._set_bounds(old_x, old_y, old_w, old_h)
 
-        ease_func = get_easing(ease)
-        animations = []
+        if windows:
+            _run_animation(_bounds_all_gen(windows, bounds, duration, get_easing(ease)))
 
-        for (row, col), win in self._windows.items():
-            if win.closed:
-                continue
-            target = targets[(row, col)]
-            animations.append(move_async(win, target.x, target.y, duration, ease_func))
-            animations.append(resize_async(win, target.w, target.h, duration, ease_func))
+        self._set_bounds(x, y, w, h)
+
+    def _check_cell(self, row: int, col: int) -> None:
+        """Raise ValueError unless (row, col) is inside the grid."""
+        if row < 0 or row >= self.num_rows:
+            raise ValueError(f"Row {row} out of range [0, {self.num_rows})")
+        if col < 0 or col >= self.num_cols:
+            raise ValueError(f"Column {col} out of range [0, {self.num_cols})")
 
-        if animations:
-            _run_animation(_parallel_gen(animations))
+    def _swap_cells(self, r1: int, c1: int, r2: int, c2: int) -> None:
+        """Exchange the windows and spans anchored at two cells.
 
-        self._x, self._y, self._w, self._h = float(x), float(y), float(w), float(h)
+        Empty cells always hold a (1, 1) span, so swapping with an empty cell
+        moves the window and resets the span it leaves behind.
+        """
+        windows = self._windows
+        spans = self._spans
+        windows[r1][c1], windows[r2][c2] = windows[r2][c2], windows[r1][c1]
+        if spans[r1][c1] != spans[r2][c2]:
+            spans[r1][c1], spans[r2][c2] = spans[r2][c2], spans[r1][c1]
+            self._refresh_spec(r1, c1)
+            self._refresh_spec(r2, c2)
+        self._live = None
 
     def swap(self, r1: int, c1: int, r2: int, c2: int) -> None:
         """Swap two cells instantly."""
-        key1 = (r1, c1)
-        key2 = (r2, c2)
-
-        win1 = self._windows.get(key1)
-        win2 = self._windows.get(key2)
-        span1 = self._spans.get(key1, (1, 1))
-        span2 = self._spans.get(key2, (1, 1))
-
-        if win1 and win2:
-            self._windows[key1] = win2
-            self._windows[key2] = win1
-            self._spans[key1] = span2
-            self._spans[key2] = span1
-        elif win1:
-            del self._windows[key1]
-            self._windows[key2] = win1
-            if key1 in self._spans:
-                del self._spans[key1]
-            self._spans[key2] = span1
-        elif win2:
-            del self._windows[key2]
-            self._windows[key1] = win2
-            if key2 in self._spans:
-                del self._spans[key2]
-            self._spans[key1] = span2
-
-        self._update_all_windows()
+        self._check_cell(r1, c1)
+        self._check_cell(r2, c2)
+        self._swap_cells(r1, c1, r2, c2)
+        # Only the two swapped windows move; every other cell keeps its spec.
+        for row, col in ((r1, c1), (r2, c2)):
+            win = self._windows[row][col]
+            if win is not None and not win.closed:
+                _place(win, self.get_cell_spec(row, col))
 
     def swap_animated(
         self,
@@ -663,13 +726,12 @@ class Grid:
         ease: str | EasingFunc = "ease_in_out",
     ) -> None:
         """Swap two cells with animation."""
-        key1 = (r1, c1)
-        key2 = (r2, c2)
-
-        win1 = self._windows.get(key1)
-        win2 = self._windows.get(key2)
-        span1 = self._spans.get(key1, (1, 1))
-        span2 = self._spans.get(key2, (1, 1))
+        self._check_cell(r1, c1)
+        self._check_cell(r2, c2)
+        win1 = self._windows[r1][c1]
+        win2 = self._windows[r2][c2]
+        span1 = self._spans[r1][c1]
+        span2 = self._spans[r2][c2]
 
         if not win1 and not win2:
             return
@@ -681,56 +743,94 @@ class Grid:
         spec1 = self._compute_cell(r1, c1, span2[0], span2[1]) if win2 else self._compute_cell(r1, c1, 1, 1)
         spec2 = self._compute_cell(r2, c2, span1[0], span1[1]) if win1 else self._compute_cell(r2, c2, 1, 1)
 
-        ease_func = get_easing(ease)
-        animations = []
+        # One fused move+resize per window; sizes only change when the spans
+        # differ, otherwise each window keeps its size and is just moved.
+        windows: list[Window] = []
+        bounds: list[tuple[float, float, float, float]] = []
+        resize = span1 != span2
 
         if win1 and not win1.closed:
-            animations.append(move_async(win1, spec2.x, spec2.y, duration, ease_func))
-            if span1 != span2:
-                animations.append(resize_async(win1, spec2.w, spec2.h, duration, ease_func))
+            windows.append(win1)
+            bounds.append((
+                spec2.x,
+                spec2.y,
+                spec2.w if resize else win1.w,
+                spec2.h if resize else win1.h,
+            ))
 
         if win2 and not win2.closed:
-            animations.append(move_async(win2, spec1.x, spec1.y, duration, ease_func))
-            if span1 != span2:
-                animations.append(resize_async(win2, spec1.w, spec1.h, duration, ease_func))
-
-        if animations:
-            _run_animation(_parallel_gen(animations))
-
-        if win1 and win2:
-            self._windows[key1] = win2
-            self._windows[key2] = win1
-            self._spans[key1] = span2
-            self._spans[key2] = span1
-        elif win1:
-            del self._windows[key1]
-            self._windows[key2] = win1
-            if key1 in self._spans:
-                del self._spans[key1]
-            self._spans[key2] = span1
-        elif win2:
-            del self._windows[key2]
-            self._windows[key1] = win2
-            if key2 in self._spans:
-                del self._spans[key2]
-            self._spans[key1] = span2
+            windows.append(win2)
+            bounds.append((
+                spec1.x,
+                spec1.y,
+                spec1.w if resize else win2.w,
+                spec1.h if resize else win2.h,
+            ))
+
+        if windows:
+            _run_animation(_bounds_all_gen(windows, bounds, duration, get_easing(ease)))
+
+        self._swap_cells(r1, c1, r2, c2)
 
     def clear(self) -> None:
         """Close all windows in the grid."""
-        for win in self._windows.values():
+        for win in self:
             if not win.closed:
                 win.close()
-        self._windows.clear()
-        self._spans.clear()
+        self._reset_cells()
 
     def __repr__(self) -> str:
         return (
             f"Grid(x={self._x}, y={self._y}, w={self._w}, h={self._h}, "
             f"columns={self._columns!r}, rows={self._rows!r}, "
-            f"windows={len(self._windows)})"
+            f"windows={self._count})"
         )
 
 
+def grid_layout_arrays(
+    x: float,
+    y: float,
+    w: float,
+    h: float,
+    columns: str,
+    rows: str,
+    gap: float | tuple[float, float] = 0,
+) -> GridLayoutArrays:
+    """Compute cell geometry for a grid layout as parallel arrays.
+
+    Same cells as grid_layout(), in the same row-major order, but stored
+    as six ``array.array`` columns instead of one CellSpec per cell.
+
+    Args:
+        x, y: Grid origin position
+        w, h: Grid total size
+        columns: Column template (e.g., "1fr 2fr 100px")
+        rows: Row template (e.g., "100px 1fr 1fr")
+        gap: Gap between cells (single value or (column_gap, row_gap))
+
+    Returns:
+        GridLayoutArrays with xs, ys, ws, hs, rows and cols
+    """
+    col_gap, row_gap = (gap, gap) if isinstance(gap, (int, float)) else gap
+
+    col_sizes, col_positions = _track_layout(_parse_template(columns), x, w, col_gap)
+    row_sizes, row_positions = _track_layout(_parse_template(rows), y, h, row_gap)
+    num_rows = len(row_sizes)
+    num_cols = len(col_sizes)
+
+    def per_row(values: Sequence[float]) -> Iterator[float]:
+        return chain.from_iterable(repeat(v, num_cols) for v in values)
+
+    return GridLayoutArrays(
+        xs=array("d", col_positions) * num_rows,
+        ys=array("d", per_row(row_positions)),
+        ws=array("d", col_sizes) * num_rows,
+        hs=array("d", per_row(row_sizes)),
+        rows=array("i", chain.from_iterable(repeat(r, num_cols) for r in range(num_rows))),
+        cols=array("i", range(num_cols)) * num_rows,
+    )
+
+
 def grid(
     x: float,
     y: float,
@@ -14,23 +14,36 @@ Optional dependencies:
 
 from __future__ import annotations
 
-from typing import Any, Union
+import struct
+from typing import Any, BinaryIO, Union
+
+from ._cache import cached_size, clear_media_size_cache
 
 ImageLike = Union[str, Any]
 
-_HAS_SDL2_IMAGE = False
+# SDL2_image is loaded on first use, so programs that never load an image
+# do not pay for importing it and its shared library
+_sdlimage: Any = None
+_sdlimage_checked = False
+
 
-try:
-    from sdl2 import sdlimage as _sdlimage
+def _get_sdlimage() -> Any:
+    """Import sdl2.sdlimage on first call. Returns None if unavailable."""
+    global _sdlimage, _sdlimage_checked
+    if not _sdlimage_checked:
+        _sdlimage_checked = True
+        try:
+            from sdl2 import sdlimage
 
-    _HAS_SDL2_IMAGE = True
-except ImportError:
-    _sdlimage = None
+            _sdlimage = sdlimage
+        except ImportError:
+            pass
+    return _sdlimage
 
 
 def has_image_support() -> bool:
     """Check if SDL2_image is available for loading images."""
-    return _HAS_SDL2_IMAGE
+    return _get_sdlimage() is not None
 
 
 def load_image(path: str) -> Any:
@@ -47,13 +60,14 @@ def load_image(path: str) -> Any:
         ImportError: If SDL2_image is not available
         ValueError: If the image fails to load
     """
-    if not _HAS_SDL2_IMAGE or _sdlimage is None:
+    sdlimage = _get_sdlimage()
+    if sdlimage is None:
         raise ImportError(
             "SDL2_image is required for image support. "
             "Install it with: pip install pysdl2-dll"
         )
 
-    surface = _sdlimage.IMG_Load(path.encode("utf-8"))
+    surface = sdlimage.IMG_Load(path.encode("utf-8"))
     if not surface:
         from sdl2 import SDL_GetError
 
@@ -64,10 +78,80 @@ def load_image(path: str) -> Any:
     return surface
 
 
+# JPEG start-of-frame markers (baseline, progressive, lossless, ...); C4, C8
+# and CC share the range but are DHT, JPG and DAC segments.
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _read_jpeg_size(f: BinaryIO) -> tuple[int, int] | None:
+    """Scan JPEG segments (after SOI) for a start-of-frame header."""
+    while True:
+        byte = f.read(1)
+        if not byte:
+            return None
+        if byte != b"\xff":
+            continue
+        marker = f.read(1)
+        while marker == b"\xff":
+            marker = f.read(1)
+        if not marker:
+            return None
+        code = marker[0]
+        if code == 0x01 or 0xD0 <= code <= 0xD9:
+            continue  # Standalone markers carry no length
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        (length,) = struct.unpack(">H", length_bytes)
+        if code in _JPEG_SOF_MARKERS:
+            sof = f.read(5)
+            if len(sof) < 5:
+                return None
+            height, width = struct.unpack(">xHH", sof)
+            return (width, height)
+        f.seek(length - 2, 1)
+
+
+def _read_image_header(path: str) -> tuple[int, int] | None:
+    """Read image dimensions from the file header without decoding pixels.
+
+    Handles PNG, GIF, BMP and JPEG; returns None for anything else (or a
+    malformed header) so the caller can fall back to a full decode.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(26)
+            if head[:8] == b"\x89PNG\r\n\x1a\n" and head[12:16] == b"IHDR":
+                width, height = struct.unpack(">II", head[16:24])
+                return (width, height)
+            if head[:6] in (b"GIF87a", b"GIF89a"):
+                width, height = struct.unpack("<HH", head[6:10])
+                return (width, height)
+            if head[:2] == b"BM" and len(head) >= 26:
+                (dib_size,) = struct.unpack("<I", head[14:18])
+                if dib_size == 12:
+                    width, height = struct.unpack("<HH", head[18:22])
+                else:
+                    # Negative height marks a top-down bitmap
+                    width, height = struct.unpack("<ii", head[18:26])
+                return (width, abs(height))
+            if head[:2] == b"\xff\xd8":
+                f.seek(2)
+                return _read_jpeg_size(f)
+    except (OSError, struct.error):
+        pass
+    return None
+
+
+@cached_size
 def get_image_size(path: str) -> tuple[int, int]:
     """
     Get the dimensions of an image without keeping it loaded.
 
+    PNG, GIF, BMP and JPEG sizes are read from the file header; other
+    formats are decoded with SDL2_image. Results are cached per file until
+    it changes on disk.
+
     Args:
         path: Path to the image file (PNG, JPG, etc.)
 
@@ -78,6 +162,10 @@ def get_image_size(path: str) -> tuple[int, int]:
         ImportError: If SDL2_image is not available
         ValueError: If the image fails to load
     """
+    size = _read_image_header(path)
+    if size is not None:
+        return size
+
     from sdl2 import SDL_FreeSurface
 
     surface = load_image(path)
@@ -97,6 +185,7 @@ __all__ = [
     "has_image_support",
     "load_image",
     "get_image_size",
+    "clear_media_size_cache",
     "GifAnimation",
     "has_gif_support",
     "get_gif_size",
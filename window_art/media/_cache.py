@@ -0,0 +1,59 @@
+"""Memoization of media dimension and info lookups."""
+from __future__ import annotations
+
+import functools
+import os
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+SizeFunc = Callable[[str], tuple[int, int]]
+InfoFunc = Callable[[str], dict[str, Any]]
+
+_caches: list[Any] = []
+
+
+def _cached_per_file(func: Callable[[str], T]) -> Callable[[str], T]:
+    """Cache a one-path lookup, invalidated when the file changes.
+
+    Entries are keyed by (path, mtime, size) so an edited file is re-read.
+    Paths that cannot be stat'ed (URLs, camera indices) are never cached.
+    """
+    @functools.lru_cache(maxsize=128)
+    def lookup(path: str, stamp: tuple[int, int]) -> T:
+        return func(path)
+
+    @functools.wraps(func)
+    def wrapper(path: str) -> T:
+        try:
+            st = os.stat(path)
+        except (OSError, TypeError, ValueError):
+            return func(path)
+        return lookup(path, (st.st_mtime_ns, st.st_size))
+
+    _caches.append(lookup)
+    return wrapper
+
+
+def cached_size(func: SizeFunc) -> SizeFunc:
+    """Cache a get_*_size function per path, invalidated when the file changes."""
+    return _cached_per_file(func)
+
+
+def cached_info(func: InfoFunc) -> InfoFunc:
+    """Cache a get_*_info function per path, invalidated when the file changes.
+
+    Each call returns its own copy of the cached dictionary.
+    """
+    lookup = _cached_per_file(func)
+
+    @functools.wraps(func)
+    def wrapper(path: str) -> dict[str, Any]:
+        return dict(lookup(path))
+
+    return wrapper
+
+
+def clear_media_size_cache() -> None:
+    """Forget all cached image, GIF and video dimensions and info."""
+    for cache in _caches:
+        cache.cache_clear()
@@ -0,0 +1,70 @@
+"""RGBA SDL textures for media whose pixels are replaced in place."""
+from __future__ import annotations
+
+from typing import Any
+
+# Byte alignment for frame buffers handed to SDL_UpdateTexture, so copies
+# out of them can use aligned vector loads
+PIXEL_ALIGNMENT = 64
+
+_sdl2: Any = None
+try:
+    import sdl2
+
+    _sdl2 = sdl2
+except ImportError:
+    pass
+
+
+def create_rgba_texture(
+    renderer: Any, width: int, height: int, pixels: Any, pixel_format: int | None = None
+) -> Any:
+    """Create a blended RGBA texture filled with pixels.
+
+    Args:
+        renderer: SDL renderer to create texture for
+        width, height: Texture size in pixels
+        pixels: RGBA bytes or a pointer to them, width * 4 bytes per row
+        pixel_format: Another 4-byte SDL pixel format the pixels are in,
+            defaults to SDL_PIXELFORMAT_RGBA32
+
+    Returns:
+        SDL_Texture pointer
+    """
+    if _sdl2 is None:
+        raise ImportError("SDL2 is required")
+
+    if pixel_format is None:
+        pixel_format = _sdl2.SDL_PIXELFORMAT_RGBA32
+    texture = _sdl2.SDL_CreateTexture(
+        renderer,
+        pixel_format,
+        _sdl2.SDL_TEXTUREACCESS_STATIC,
+        width,
+        height,
+    )
+    if not texture:
+        raise RuntimeError(f"Failed to create texture: {_sdl2.SDL_GetError()}")
+
+    _sdl2.SDL_SetTextureBlendMode(texture, _sdl2.SDL_BLENDMODE_BLEND)
+    try:
+        update_rgba_texture(texture, width, pixels)
+    except RuntimeError:
+        _sdl2.SDL_DestroyTexture(texture)
+        raise
+    return texture
+
+
+def update_rgba_texture(texture: Any, width: int, pixels: Any) -> None:
+    """Upload RGBA pixels into a texture made by create_rgba_texture.
+
+    SDL_UpdateTexture copies straight from pixels to the texture; locking a
+    streaming texture would first copy into SDL's shadow buffer.
+
+    Args:
+        texture: Texture from create_rgba_texture
+        width: Texture width in pixels
+        pixels: RGBA bytes or a pointer to them, width * 4 bytes per row
+    """
+    if _sdl2.SDL_UpdateTexture(texture, None, pixels, width * 4) != 0:
+        raise RuntimeError(f"Failed to update texture: {_sdl2.SDL_GetError()}")
@@ -1,9 +1,31 @@
 """GIF animation support using Pillow."""
 from __future__ import annotations
 
-import ctypes
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import accumulate
 from typing import Any
 
+from ._cache import cached_info, cached_size
+from ._texture import create_rgba_texture, update_rgba_texture
+
+# Memory budget for each GIF's decoded frames. GIFs that fit are decoded once
+# and kept whole; larger ones keep as many recently used frames as fit.
+_FRAME_CACHE_BYTES = 256 * 1024 * 1024
+
+# Shared background thread that decodes each GIF's next frame ahead of time
+_prefetcher: ThreadPoolExecutor | None = None
+
+
+def _get_prefetcher() -> ThreadPoolExecutor:
+    """Get the frame prefetch executor, creating it on first use."""
+    global _prefetcher
+    if _prefetcher is None:
+        _prefetcher = ThreadPoolExecutor(max_workers=1, thread_name_prefix="window-art-gif")
+    return _prefetcher
+
 _HAS_PIL = False
 _Image: Any = None
 try:
@@ -48,12 +70,27 @@ class GifAnimation:
             )
 
         self._path = path
-        self._frames: list[bytes] = []
+        # Open source image; frames are decoded from it on demand
+        self._img: Any = None
+        # Decoded frames (RGBA bytes), least recently used first
+        self._decoded: OrderedDict[int, bytes] = OrderedDict()
+        # Most frames _decoded holds, from _FRAME_CACHE_BYTES
+        self._cache_frames = 0
+        # Guards _img and _decoded against the prefetch thread
+        self._lock = threading.Lock()
+        self._prefetch: Future[bytes] | None = None
+        self._frame_size = 0
+        self._frame_count = 0
         self._delays: list[float] = []
+        # End time of each frame within one loop, for bisecting in update()
+        self._frame_ends: list[float] = []
+        self._total_duration = 0.0
+        # Shared delay when every frame has the same one, else None
+        self._uniform_delay: float | None = None
         self._width = 0
         self._height = 0
         self._current_frame = 0
-        self._elapsed = 0.0
+        self._loop_time = 0.0
         self._playing = True
         self._loop = True
         self._speed = 1.0
@@ -61,7 +98,10 @@ class GifAnimation:
         self._load_gif(path)
 
     def _load_gif(self, path: str) -> None:
-        """Load and extract all frames from a GIF."""
+        """Open a GIF, read its frame timing and decode the first frame.
+
+        Later frames are converted to RGBA on demand.
+        """
         try:
             img = _Image.open(path)
         except Exception as e:
@@ -69,16 +109,14 @@ class GifAnimation:
 
         self._width = img.width
         self._height = img.height
+        self._frame_size = img.width * img.height * 4
 
+        n_frames = getattr(img, "n_frames", 1)
+        frame_idx = 0
         try:
-            frame_idx = 0
-            while True:
+            while frame_idx < n_frames:
                 img.seek(frame_idx)
 
-                frame = img.convert("RGBA")
-
-                self._frames.append(frame.tobytes())
-
                 delay_ms = img.info.get("duration", 100)
                 self._delays.append(delay_ms / 1000.0)
 
@@ -86,8 +124,100 @@ class GifAnimation:
         except EOFError:
             pass
 
-        if not self._frames:
+        if frame_idx == 0 or self._frame_size == 0:
+            img.close()
             raise ValueError(f"No frames found in GIF '{path}'")
+        img.seek(0)
+        self._img = img
+        self._frame_count = frame_idx
+        self._cache_frames = max(2, min(frame_idx, _FRAME_CACHE_BYTES // self._frame_size))
+        self._frame_ends = list(accumulate(self._delays))
+        self._total_duration = self._frame_ends[-1]
+        first = self._delays[0]
+        if first > 0 and all(delay == first for delay in self._delays):
+            self._uniform_delay = first
+
+        # The first texture needs this frame anyway, and a file that cannot
+        # be decoded fails here rather than in the middle of playback
+        try:
+            self._decode_frame(0)
+        except Exception:
+            self.close()
+            raise
+
+    def _decode(self, frame: int) -> bytes:
+        """Decode one frame from the source image to RGBA bytes."""
+        img = self._img
+        img.seek(frame)
+        # Frames Pillow already composited to RGBA need no conversion copy
+        rgba = img if img.mode == "RGBA" else img.convert("RGBA")
+        data: bytes = rgba.tobytes()
+        return data
+
+    def _decode_frame(self, frame: int) -> bytes:
+        """Get a frame's RGBA bytes, decoding it unless cached."""
+        with self._lock:
+            decoded = self._decoded
+            data = decoded.get(frame)
+            if data is not None:
+                decoded.move_to_end(frame)
+                return data
+
+            if self._img is None:
+                raise ValueError(f"GIF '{self._path}' is closed")
+            data = self._decode(frame)
+            decoded[frame] = data
+            if len(decoded) > self._cache_frames:
+                decoded.popitem(last=False)
+            return data
+
+    def _prefetch_next(self) -> None:
+        """Decode the frame after the current one on the prefetch thread.
+
+        By the time update() advances to it, the frame is usually already in
+        the decode cache, so uploading it does not wait on decoding.
+        """
+        if self._img is None:
+            return
+        pending = self._prefetch
+        if pending is not None and not pending.done():
+            return
+
+        frame = self._current_frame + 1
+        if frame >= self._frame_count:
+            if not self._loop:
+                return
+            frame = 0
+        if frame not in self._decoded:
+            self._prefetch = _get_prefetcher().submit(self._decode_frame, frame)
+
+    def preload(self) -> None:
+        """Decode every frame up front and close the source file.
+
+        Playback then never decodes, at the cost of holding all frames in
+        memory even when they exceed the usual cache budget.
+        """
+        with self._lock:
+            if self._img is None:
+                return
+            decoded = self._decoded
+            for frame in range(self._frame_count):
+                if frame not in decoded:
+                    decoded[frame] = self._decode(frame)
+            self._cache_frames = self._frame_count
+            self._img.close()
+            self._img = None
+
+    def close(self) -> None:
+        """Close the source file and release decoded frames."""
+        if self._prefetch is not None:
+            self._prefetch.cancel()
+            self._prefetch = None
+        with self._lock:
+            if self._img is not None:
+                self._img.close()
+                self._img = None
+            self._decoded.clear()
 
     @property
     def path(self) -> str:
@@ -112,7 +242,7 @@ class GifAnimation:
     @property
     def frame_count(self) -> int:
         """Total number of frames in the animation."""
-        return len(self._frames)
+        return self._frame_count
 
     @property
     def current_frame(self) -> int:
@@ -122,7 +252,9 @@ class GifAnimation:
     @current_frame.setter
     def current_frame(self, value: int) -> None:
         """Set the current frame index."""
-        self._current_frame = max(0, min(value, len(self._frames) - 1))
+        frame = max(0, min(value, self._frame_count - 1))
+        self._current_frame = frame
+        self._loop_time = self._frame_ends[frame] - self._delays[frame]
 
     @property
     def playing(self) -> bool:
@@ -154,7 +286,7 @@ class GifAnimation:
     @property
     def total_duration(self) -> float:
         """Total duration of one loop in seconds."""
-        return sum(self._delays)
+        return self._total_duration
 
     def update(self, dt: float) -> bool:
         """Update animation state. Returns True if frame changed.
@@ -162,24 +294,28 @@ class GifAnimation:
         Args:
             dt: Delta time in seconds since last update
         """
-        if not self._playing or len(self._frames) <= 1:
+        total = self._total_duration
+        if not self._playing or self._frame_count <= 1 or total <= 0:
             return False
 
         old_frame = self._current_frame
-        self._elapsed += dt * self._speed
-
-        while self._elapsed >= self._delays[self._current_frame]:
-            self._elapsed -= self._delays[self._current_frame]
-            self._current_frame += 1
-
-            if self._current_frame >= len(self._frames):
-                if self._loop:
-                    self._current_frame = 0
-                else:
-                    self._current_frame = len(self._frames) - 1
-                    self._playing = False
-                    break
-
+        loop_time = self._loop_time + dt * self._speed
+
+        if loop_time >= total:
+            if not self._loop:
+                self._loop_time = total
+                self._current_frame = self._frame_count - 1
+                self._playing = False
+                return self._current_frame != old_frame
+            loop_time %= total
+
+        # A long stall skips straight to the right frame instead of stepping
+        self._loop_time = loop_time
+        delay = self._uniform_delay
+        if delay is not None:
+            self._current_frame = min(int(loop_time / delay), self._frame_count - 1)
+        else:
+            self._current_frame = bisect_right(self._frame_ends, loop_time)
         return self._current_frame != old_frame
 
     def get_frame_data(self, frame: int | None = None) -> bytes:
@@ -190,7 +326,7 @@ class GifAnimation:
         """
         if frame is None:
             frame = self._current_frame
-        return self._frames[frame]
+        return self._decode_frame(frame)
 
     def get_frame_delay(self, frame: int | None = None) -> float:
         """Get delay for a frame in seconds.
@@ -205,11 +341,14 @@ class GifAnimation:
     def reset(self) -> None:
         """Reset animation to the first frame."""
         self._current_frame = 0
-        self._elapsed = 0.0
+        self._loop_time = 0.0
         self._playing = True
 
     def create_texture(self, renderer: Any, frame: int | None = None) -> Any:
-        """Create an SDL texture from a frame.
+        """Create an SDL texture holding a frame.
+
+        Later frames can be uploaded into it with update_texture() rather
+        than creating a new texture each time.
 
         Args:
             renderer: SDL renderer to create texture for
@@ -218,46 +357,33 @@ class GifAnimation:
         Returns:
             SDL_Texture pointer
         """
-        if _sdl2 is None:
-            raise ImportError("SDL2 is required")
-
         if frame is None:
             frame = self._current_frame
-
-        data = self._frames[frame]
-
-        rmask = 0x000000FF
-        gmask = 0x0000FF00
-        bmask = 0x00FF0000
-        amask = 0xFF000000
-
-        surface = _sdl2.SDL_CreateRGBSurfaceFrom(
-            ctypes.c_char_p(data),
-            self._width,
-            self._height,
-            32,
-            self._width * 4,
-            rmask,
-            gmask,
-            bmask,
-            amask,
+        texture = create_rgba_texture(
+            renderer, self._width, self._height, self._decode_frame(frame)
         )
+        self._prefetch_next()
+        return texture
 
-        if not surface:
-            raise RuntimeError(f"Failed to create surface: {_sdl2.SDL_GetError()}")
-
-        texture = _sdl2.SDL_CreateTextureFromSurface(renderer, surface)
-        _sdl2.SDL_FreeSurface(surface)
-
-        if not texture:
-            raise RuntimeError(f"Failed to create texture: {_sdl2.SDL_GetError()}")
+    def update_texture(self, texture: Any, frame: int | None = None) -> None:
+        """Upload a frame into a texture made by create_texture().
 
-        return texture
+        Args:
+            texture: SDL texture returned by create_texture()
+            frame: Frame index, or None for current frame
+        """
+        if frame is None:
+            frame = self._current_frame
+        update_rgba_texture(texture, self._width, self._decode_frame(frame))
+        self._prefetch_next()
 
 
+@cached_size
 def get_gif_size(path: str) -> tuple[int, int]:
     """Get dimensions of a GIF without fully loading it.
 
+    Results are cached per file until it changes on disk.
+
     Args:
         path: Path to the GIF file
 
@@ -274,9 +400,12 @@ def get_gif_size(path: str) -> tuple[int, int]:
         return (img.width, img.height)
 
 
+@cached_info
 def get_gif_info(path: str) -> dict[str, Any]:
     """Get information about a GIF file.
 
+    Results are cached per file until it changes on disk.
+
     Args:
         path: Path to the GIF file
 
@@ -284,6 +413,7 @@ def get_gif_info(path: str) -> dict[str, Any]:
         Dictionary with width, height, frame_count, total_duration
     """
     gif = GifAnimation(path)
+    gif.close()
     return {
         "width": gif.width,
         "height": gif.height,
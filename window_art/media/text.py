@@ -2,8 +2,13 @@
 from __future__ import annotations
 
 import ctypes
+import functools
+import os
+import sys
 from typing import Any, Union
 
+from ._texture import create_rgba_texture, update_rgba_texture
+
 _HAS_PIL = False
 _Image: Any = None
 _ImageDraw: Any = None
@@ -28,6 +33,11 @@ except ImportError:
 
 PaddingLike = Union[int, tuple[int, int], tuple[int, int, int, int]]
 
+_WHITE = (255, 255, 255, 255)
+
+# A laid-out line: (text, x, y, ink box as (left, top, right, bottom))
+_PlacedLine = tuple[str, int, int, tuple[int, int, int, int]]
+
 
 def has_text_support() -> bool:
     """Check if text rendering support is available."""
@@ -47,6 +57,17 @@ def _normalize_padding(padding: PaddingLike) -> tuple[int, int, int, int]:
         raise ValueError(f"Invalid padding format: {padding}")
 
 
+_measure_draw: Any = None
+
+
+def _get_measure_draw() -> Any:
+    """Get a shared ImageDraw for multi-line text metrics."""
+    global _measure_draw
+    if _measure_draw is None:
+        _measure_draw = _ImageDraw.Draw(_Image.new("RGBA", (1, 1)))
+    return _measure_draw
+
+
 def get_text_size(
     text: str,
     font: str = "Arial",
@@ -70,17 +91,78 @@ def get_text_size(
 
     pil_font = _load_font(font, font_size)
 
-    dummy = _Image.new("RGBA", (1, 1))
-    draw = _ImageDraw.Draw(dummy)
-    bbox = draw.textbbox((0, 0), text, font=pil_font)
+    if "\n" in text:
+        bbox = _get_measure_draw().multiline_textbbox((0, 0), text, font=pil_font)
+    else:
+        bbox = pil_font.getbbox(text)
     width = bbox[2] - bbox[0]
     height = bbox[3] - bbox[1]
 
     return (width, height)
 
 
+def _boxes_overlap(a: tuple[int, int, int, int], b: tuple[int, int, int, int]) -> bool:
+    """Check whether two (left, top, right, bottom) boxes intersect."""
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+_FONT_EXTENSIONS = (".ttf", ".ttc", ".otf")
+
+
+def _font_dirs() -> list[tuple[str, bool]]:
+    """System font directories for this platform as (path, recursive)."""
+    if sys.platform == "darwin":
+        return [
+            ("/System/Library/Fonts", False),
+            ("/Library/Fonts", False),
+            ("~/Library/Fonts", False),
+            ("/System/Library/Fonts/Supplemental", False),
+        ]
+    if sys.platform == "win32":
+        windir = os.environ.get("WINDIR", "C:\\Windows")
+        return [(os.path.join(windir, "Fonts"), False)]
+    return [
+        ("/usr/share/fonts", True),
+        ("/usr/local/share/fonts", True),
+        ("~/.fonts", True),
+        ("~/.local/share/fonts", True),
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def _font_index() -> dict[str, str]:
+    """Map lowercase font file names (no extension) to paths.
+
+    The font directories are scanned once, on the first lookup by family name.
+    Earlier directories win, then .ttf over .ttc over .otf.
+    """
+    index: dict[str, str] = {}
+    ranks: dict[str, tuple[int, int]] = {}
+    for dir_rank, (directory, recursive) in enumerate(_font_dirs()):
+        for root, subdirs, files in os.walk(os.path.expanduser(directory)):
+            if not recursive:
+                subdirs.clear()
+            for name in files:
+                stem, ext = os.path.splitext(name)
+                ext = ext.lower()
+                if ext not in _FONT_EXTENSIONS:
+                    continue
+                key = stem.lower()
+                rank = (dir_rank, _FONT_EXTENSIONS.index(ext))
+                if key not in ranks or rank < ranks[key]:
+                    ranks[key] = rank
+                    index[key] = os.path.join(root, name)
+    return index
+
+
+@functools.lru_cache(maxsize=128)
 def _load_font(font: str, font_size: int) -> Any:
-    """Load a PIL font from name or path."""
+    """Load a PIL font from name or path.
+
+    Cached per (font, font_size); loaded fonts are safe to share between
+    renderers. Family names not known to FreeType are looked up in an index
+    of the system font directories.
+    """
     if not _HAS_PIL or _ImageFont is None:
         raise ImportError(
             "Pillow is required for text support. "
@@ -98,44 +180,12 @@ def _load_font(font: str, font_size: int) -> Any:
     except OSError:
         pass
 
-    import sys
-
-    font_paths = []
-    if sys.platform == "darwin":
-        font_paths = [
-            f"/System/Library/Fonts/{font}.ttf",
-            f"/System/Library/Fonts/{font}.ttc",
-            f"/Library/Fonts/{font}.ttf",
-            f"/Library/Fonts/{font}.ttc",
-            f"~/Library/Fonts/{font}.ttf",
-            f"~/Library/Fonts/{font}.ttc",
-            f"/System/Library/Fonts/Supplemental/{font}.ttf",
-            f"/System/Library/Fonts/Supplemental/{font}.ttc",
-        ]
-    elif sys.platform == "win32":
-        import os
-
-        windir = os.environ.get("WINDIR", "C:\\Windows")
-        font_paths = [
-            f"{windir}\\Fonts\\{font}.ttf",
-            f"{windir}\\Fonts\\{font.lower()}.ttf",
-        ]
-    else:
-        font_paths = [
-            f"/usr/share/fonts/truetype/{font.lower()}/{font}.ttf",
-            f"/usr/share/fonts/TTF/{font}.ttf",
-            f"~/.fonts/{font}.ttf",
-        ]
-
-    import os
-
-    for path in font_paths:
-        expanded = os.path.expanduser(path)
-        if os.path.exists(expanded):
-            try:
-                return _ImageFont.truetype(expanded, font_size)
-            except OSError:
-                continue
+    path = _font_index().get(font.lower())
+    if path is not None:
+        try:
+            return _ImageFont.truetype(path, font_size)
+        except OSError:
+            pass
 
     try:
         return _ImageFont.load_default()
@@ -144,7 +194,11 @@ def _load_font(font: str, font_size: int) -> Any:
 
 
 class TextRenderer:
-    """Renders text to RGBA bytes for use as SDL textures."""
+    """Renders text to RGBA bytes for use as SDL textures.
+
+    Textures hold glyphs rasterized in white, with text_color applied as a
+    color and alpha mod, so recoloring text never re-rasterizes it.
+    """
 
     def __init__(
         self,
@@ -192,7 +246,16 @@ class TextRenderer:
 
         self._font = _load_font(font, font_size)
         self._image: Any = None
+        self._draw: Any = None
+        # Lines currently on the canvas as (line, x, y, ink_box), and the
+        # font they were drawn with, for redrawing only what changed
+        self._drawn: list[_PlacedLine] = []
+        self._drawn_font: Any = None
         self._data: bytes | None = None
+        # (white coverage data, color, bytes) of the last render() result
+        self._tinted: tuple[bytes, tuple[int, int, int, int], bytes] | None = None
+        # (texture address, data) of the last upload, to skip re-uploading
+        self._uploaded: tuple[int | None, bytes] | None = None
         self._dirty = True
 
     @property
@@ -233,9 +296,7 @@ class TextRenderer:
 
     @text_color.setter
     def text_color(self, value: tuple[int, int, int, int]) -> None:
-        if self._text_color != value:
-            self._text_color = value
-            self._dirty = True
+        self._text_color = value
 
     @property
     def text_align(self) -> str:
@@ -294,67 +355,48 @@ class TextRenderer:
         if not words:
             return [""]
 
+        getbbox = self._font.getbbox
         lines: list[str] = []
-        current_line: list[str] = []
+        current = ""
 
+        # Lines are measured by the ink box of the whole candidate line, since
+        # kerning and glyph overhang make it differ from summed word advances
         for word in words:
-            test_line = " ".join(current_line + [word])
-            bbox = self._font.getbbox(test_line)
+            candidate = f"{current} {word}" if current else word
+            bbox = getbbox(candidate)
             width = bbox[2] - bbox[0]
 
             if width <= max_width:
-                current_line.append(word)
+                current = candidate
             else:
-                if current_line:
-                    lines.append(" ".join(current_line))
-                    current_line = [word]
+                if current:
+                    lines.append(current)
+                    current = word
                 else:
                     lines.append(word)
 
-        if current_line:
-            lines.append(" ".join(current_line))
+        if current:
+            lines.append(current)
 
         return lines if lines else [""]
 
-    def render(self) -> bytes:
-        """Render text to RGBA bytes.
-
-        Returns:
-            Raw RGBA pixel data as bytes
-        """
-        if not self._dirty and self._data is not None:
-            return self._data
-
-        self._image = _Image.new("RGBA", (self._width, self._height), (0, 0, 0, 0))
-        draw = _ImageDraw.Draw(self._image)
-
-        if not self._text:
-            self._data = self._image.tobytes()
-            self._dirty = False
-            return self._data
-
+    def _layout(self) -> list[_PlacedLine]:
+        """Position each non-empty line inside the padded content area."""
         pad_left, pad_top, pad_right, pad_bottom = self._text_padding
         content_width = self._width - pad_left - pad_right
         content_height = self._height - pad_top - pad_bottom
 
-        if content_width <= 0 or content_height <= 0:
-            self._data = self._image.tobytes()
-            self._dirty = False
-            return self._data
+        if not self._text or content_width <= 0 or content_height <= 0:
+            return []
 
         if self._text_wrap:
             lines = self._wrap_text(self._text, content_width)
         else:
             lines = self._text.split("\n")
 
-        line_heights: list[int] = []
-        for line in lines:
-            if line:
-                bbox = self._font.getbbox(line)
-                line_heights.append(bbox[3] - bbox[1])
-            else:
-                bbox = self._font.getbbox(" ")
-                line_heights.append(bbox[3] - bbox[1])
+        font = self._font
+        bboxes = [font.getbbox(line if line else " ") for line in lines]
+        line_heights = [bbox[3] - bbox[1] for bbox in bboxes]
 
         total_height = sum(line_heights)
         line_spacing = int(self._font_size * 0.2)
@@ -367,24 +409,95 @@ class TextRenderer:
         else:
             y = pad_top + (content_height - total_height) // 2
 
-        for i, line in enumerate(lines):
-            if not line:
-                y += line_heights[i] + line_spacing
-                continue
+        placed: list[_PlacedLine] = []
+        for line, bbox, line_height in zip(lines, bboxes, line_heights):
+            if line:
+                line_width = bbox[2] - bbox[0]
 
-            bbox = self._font.getbbox(line)
-            line_width = bbox[2] - bbox[0]
+                if self._text_align == "left":
+                    x = pad_left
+                elif self._text_align == "right":
+                    x = pad_left + content_width - line_width
+                else:
+                    x = pad_left + (content_width - line_width) // 2
 
-            if self._text_align == "left":
-                x = pad_left
-            elif self._text_align == "right":
-                x = pad_left + content_width - line_width
-            else:
-                x = pad_left + (content_width - line_width) // 2
+                ink = (x + bbox[0], y + bbox[1], x + bbox[2], y + bbox[3])
+                placed.append((line, x, y, ink))
+            y += line_height + line_spacing
+
+        return placed
 
-            draw.text((x, y), line, font=self._font, fill=self._text_color)
-            y += line_heights[i] + line_spacing
+    def render(self) -> bytes:
+        """Render text to RGBA bytes.
 
+        Returns:
+            Raw RGBA pixel data as bytes
+        """
+        coverage = self._render_coverage()
+        color = self._text_color
+        tinted = self._tinted
+        if tinted is not None and tinted[0] is coverage and tinted[1] == color:
+            return tinted[2]
+
+        image = _Image.new("RGBA", (self._width, self._height), (0, 0, 0, 0))
+        draw = _ImageDraw.Draw(image)
+        for line, x, y, _ in self._drawn:
+            draw.text((x, y), line, font=self._font, fill=color)
+        data: bytes = image.tobytes()
+        self._tinted = (coverage, color, data)
+        return data
+
+    def _render_coverage(self) -> bytes:
+        """Render text coverage to RGBA bytes for the textures.
+
+        Glyphs are drawn in opaque white; the textures from create_texture()
+        carry text_color as a color and alpha mod. When only the text changed,
+        lines that kept their content and position are left on the canvas;
+        only changed lines are cleared and redrawn.
+
+        Returns:
+            Raw RGBA pixel data as bytes
+        """
+        if not self._dirty and self._data is not None:
+            return self._data
+
+        placed = self._layout()
+
+        size = (self._width, self._height)
+        if self._image is None or self._image.size != size:
+            self._image = _Image.new("RGBA", size, (0, 0, 0, 0))
+            self._draw = _ImageDraw.Draw(self._image)
+            to_draw = placed
+        elif self._font is not self._drawn_font or not placed:
+            self._image.paste((0, 0, 0, 0), (0, 0) + size)
+            to_draw = placed
+        else:
+            current = set(placed)
+            kept = set(self._drawn) & current
+            cleared = [entry[3] for entry in self._drawn if entry not in current]
+            # An unchanged line that a cleared box cuts into is cleared too and
+            # redrawn whole, since drawing over its old pixels would composite
+            # the antialiased edges twice. Its box may cut into further lines.
+            pending = cleared
+            while pending and kept:
+                hit = {
+                    entry
+                    for entry in kept
+                    if any(_boxes_overlap(entry[3], ink) for ink in pending)
+                }
+                kept -= hit
+                pending = [entry[3] for entry in hit]
+                cleared += pending
+            for ink in cleared:
+                self._image.paste((0, 0, 0, 0), ink)
+            to_draw = [entry for entry in placed if entry not in kept]
+
+        draw = self._draw
+        for line, x, y, _ in to_draw:
+            draw.text((x, y), line, font=self._font, fill=_WHITE)
+
+        self._drawn = placed
+        self._drawn_font = self._font
         self._data = self._image.tobytes()
         self._dirty = False
         return self._data
@@ -398,40 +511,47 @@ class TextRenderer:
         Returns:
             SDL_Texture pointer
         """
-        if _sdl2 is None:
-            raise ImportError("SDL2 is required")
+        data = self._render_coverage()
+        texture = create_rgba_texture(renderer, self._width, self._height, data)
+        self._uploaded = (ctypes.cast(texture, ctypes.c_void_p).value, data)
+        self._apply_color(texture)
+        return texture
 
-        data = self.render()
-
-        rmask = 0x000000FF
-        gmask = 0x0000FF00
-        bmask = 0x00FF0000
-        amask = 0xFF000000
-
-        surface = _sdl2.SDL_CreateRGBSurfaceFrom(
-            ctypes.c_char_p(data),
-            self._width,
-            self._height,
-            32,
-            self._width * 4,
-            rmask,
-            gmask,
-            bmask,
-            amask,
-        )
+    def _apply_color(self, texture: Any) -> None:
+        """Tint the white glyphs in a texture with text_color."""
+        r, g, b, a = self._text_color
+        _sdl2.SDL_SetTextureColorMod(texture, r, g, b)
+        _sdl2.SDL_SetTextureAlphaMod(texture, a)
 
-        if not surface:
-            raise RuntimeError(f"Failed to create surface: {_sdl2.SDL_GetError()}")
+    def update_texture(self, texture: Any) -> bool:
+        """Re-render into a texture made by create_texture(), if sizes match.
 
-        texture = _sdl2.SDL_CreateTextureFromSurface(renderer, surface)
-        _sdl2.SDL_FreeSurface(surface)
+        Pixels are only uploaded when the rendered text changed; a color
+        change just updates the texture's color and alpha mod.
 
-        if not texture:
-            raise RuntimeError(f"Failed to create texture: {_sdl2.SDL_GetError()}")
+        Args:
+            texture: SDL texture returned by create_texture()
 
-        _sdl2.SDL_SetTextureBlendMode(texture, _sdl2.SDL_BLENDMODE_BLEND)
+        Returns:
+            False if the texture size no longer matches (the caller should
+            create a new texture), True once the pixels are uploaded
+        """
+        if _sdl2 is None:
+            raise ImportError("SDL2 is required")
 
-        return texture
+        tex_w = ctypes.c_int()
+        tex_h = ctypes.c_int()
+        _sdl2.SDL_QueryTexture(texture, None, None, ctypes.byref(tex_w), ctypes.byref(tex_h))
+        if tex_w.value != self._width or tex_h.value != self._height:
+            return False
+
+        data = self._render_coverage()
+        address = ctypes.cast(texture, ctypes.c_void_p).value
+        if self._uploaded is None or self._uploaded[0] != address or self._uploaded[1] is not data:
+            update_rgba_texture(texture, self._width, data)
+            self._uploaded = (address, data)
+        self._apply_color(texture)
+        return True
 
 
 __all__ = ["TextRenderer", "has_text_support", "get_text_size", "PaddingLike"]
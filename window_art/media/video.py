@@ -1,9 +1,13 @@
 """Video playback support using OpenCV."""
 from __future__ import annotations
 
-import ctypes
+import queue
+import threading
 from typing import Any
 
+from ._cache import cached_info, cached_size
+from ._texture import PIXEL_ALIGNMENT, create_rgba_texture, update_rgba_texture
+
 _HAS_CV2 = False
 _cv2: Any = None
 _np: Any = None
@@ -17,6 +21,15 @@ try:
 except ImportError:
     pass
 
+# Most skipped frames to step over with grab() before seeking instead
+_MAX_GRAB_SKIP = 30
+
+# Frames the background decoder may have ready ahead of playback
+_DECODE_AHEAD = 3
+
+# Seconds between checks that the decoder thread is still alive while waiting
+_DECODER_POLL = 0.1
+
 _sdl2: Any = None
 try:
     import sdl2
@@ -31,14 +44,101 @@ def has_video_support() -> bool:
     return _HAS_CV2 and _sdl2 is not None
 
 
+def _open_capture(path: str) -> Any:
+    """Open a video for playback, with hardware decoding where available.
+
+    Asks OpenCV's FFmpeg backend for any hardware decoder (VA-API, DXVA2,
+    VideoToolbox, ...) and falls back to the default capture if that backend
+    or acceleration is unavailable.
+    """
+    accel = getattr(_cv2, "VIDEO_ACCELERATION_ANY", None)
+    if accel is not None:
+        cap = _cv2.VideoCapture(path, _cv2.CAP_FFMPEG, [_cv2.CAP_PROP_HW_ACCELERATION, accel])
+        if cap.isOpened():
+            return cap
+        cap.release()
+    return _cv2.VideoCapture(path)
+
+
+def _empty_frame(height: int, width: int) -> Any:
+    """Allocate a BGRA frame buffer starting on a PIXEL_ALIGNMENT boundary."""
+    size = height * width * 4
+    raw = _np.empty(size + PIXEL_ALIGNMENT, _np.uint8)
+    offset = -raw.ctypes.data % PIXEL_ALIGNMENT
+    return raw[offset:offset + size].reshape(height, width, 4)
+
+
+def _decode_frames(
+    cap: Any,
+    index: int,
+    scale_to: tuple[int, int] | None,
+    skip_to: list[int],
+    free: queue.Queue[Any],
+    ready: queue.Queue[tuple[int, Any]],
+    stop: threading.Event,
+    errors: list[Exception],
+) -> None:
+    """Decode frames from index onward on the background decoder thread.
+
+    Each frame is shrunk to scale_to if given, converted to BGRA into a
+    buffer taken from free and queued on ready as (index, bgra); (index, None)
+    marks the end of the stream. Frames before skip_to[0], which playback has
+    already passed, are stepped over with grab(). OpenCV releases the GIL
+    while decoding and converting, so this runs alongside the render loop.
+
+    If decoding fails, the exception is added to errors before the end of
+    the stream is queued, for the render thread to raise.
+    """
+    # Bound once rather than looked up through module globals every frame
+    grab = cap.grab
+    read = cap.read
+    cvt_color = _cv2.cvtColor
+    bgr2bgra = _cv2.COLOR_BGR2BGRA
+    resize = _cv2.resize
+    inter_area = _cv2.INTER_AREA
+
+    bgr = None
+    small = None
+    try:
+        while True:
+            bgra = free.get()
+            if stop.is_set():
+                if bgra is not None:
+                    free.put(bgra)
+                return
+
+            while index < skip_to[0] and grab():
+                index += 1
+            ret, frame = read(bgr)
+            if not ret:
+                free.put(bgra)
+                ready.put((index, None))
+                return
+            bgr = frame
+            if scale_to is not None:
+                frame = small = resize(frame, scale_to, dst=small, interpolation=inter_area)
+
+            if bgra.shape[:2] != frame.shape[:2]:
+                bgra = _empty_frame(frame.shape[0], frame.shape[1])
+            cvt_color(frame, bgr2bgra, dst=bgra)
+            ready.put((index, bgra))
+            index += 1
+    except Exception as exc:
+        errors.append(exc)
+        ready.put((index, None))
+
 class VideoPlayer:
     """Manages video playback with frame extraction."""
 
-    def __init__(self, path: str) -> None:
+    def __init__(self, path: str, target_size: tuple[int, int] | None = None) -> None:
         """Load a video from a file path.
 
         Args:
             path: Path to the video file (MP4, AVI, etc.)
+            target_size: Optional (width, height) to shrink frames to right
+                after decoding, when smaller than the video. Frames and
+                textures then have this size; width, height and size still
+                report the video's own.
 
         Raises:
             ImportError: If OpenCV is not available
@@ -51,10 +151,14 @@ class VideoPlayer:
             )
 
         self._path = path
+        self._target_size = target_size
+        # Size frames are shrunk to, or None to keep them at full size
+        self._scale_to: tuple[int, int] | None = None
         self._cap: Any = None
         self._width = 0
         self._height = 0
         self._fps = 0.0
+        self._frame_duration = 1.0 / 30.0
         self._frame_count = 0
         self._duration = 0.0
         self._current_frame = 0
@@ -63,13 +167,30 @@ class VideoPlayer:
         self._playing = True
         self._loop = True
         self._speed = 1.0
-        self._frame_data: bytes | None = None
+        # Decode and shrink buffers for frames read on this thread; _frame is
+        # the BGRA array of the frame on show, uploaded from directly
+        self._bgr: Any = None
+        self._small: Any = None
+        self._frame: Any = None
+        self._frame_index = -1
+        # Background decoder: _free holds BGRA buffers for it to fill, _ready
+        # the decoded frames, _pending one taken from _ready not yet due.
+        # _spare keeps the buffers while the decoder is stopped, and
+        # _decoder_errors receives the exception the decoder failed with.
+        self._decoder: threading.Thread | None = None
+        self._decoder_errors: list[Exception] = []
+        self._stop = threading.Event()
+        self._skip_to = [0]
+        self._free: queue.Queue[Any] = queue.Queue()
+        self._ready: queue.Queue[tuple[int, Any]] = queue.Queue(maxsize=_DECODE_AHEAD)
+        self._pending: tuple[int, Any] | None = None
+        self._spare: list[Any] = []
 
         self._load_video(path)
 
     def _load_video(self, path: str) -> None:
         """Open the video file and extract metadata."""
-        self._cap = _cv2.VideoCapture(path)
+        self._cap = _open_capture(path)
 
         if not self._cap.isOpened():
             raise ValueError(f"Failed to open video '{path}'")
@@ -79,22 +200,188 @@ class VideoPlayer:
         self._fps = self._cap.get(_cv2.CAP_PROP_FPS) or 30.0
         self._frame_count = int(self._cap.get(_cv2.CAP_PROP_FRAME_COUNT))
         self._duration = self._frame_count / self._fps if self._fps > 0 else 0.0
+        if self._fps > 0:
+            self._frame_duration = 1.0 / self._fps
 
+        self._scale_to = self._fit_scale(self._target_size)
         self._read_current_frame()
+        self._start_decoder()
+
+    def _fit_scale(self, target_size: tuple[int, int] | None) -> tuple[int, int] | None:
+        """Get the size to shrink frames to for a target size, or None."""
+        if target_size is None:
+            return None
+        target_w, target_h = target_size
+        if 0 < target_w <= self._width and 0 < target_h <= self._height and (
+            target_w < self._width or target_h < self._height
+        ):
+            return (target_w, target_h)
+        return None
 
     def _read_current_frame(self) -> bool:
-        """Read the current frame into memory. Returns True if successful."""
+        """Read the current frame into memory. Returns True if successful.
+
+        Reads on the calling thread, so the background decoder must be stopped.
+        """
         if self._cap is None or _cv2 is None or _np is None:
             return False
 
-        ret, frame = self._cap.read()
+        ret, frame = self._cap.read(self._bgr)
         if not ret:
             return False
+        self._bgr = frame
+        if self._scale_to is not None:
+            frame = self._small = _cv2.resize(
+                frame, self._scale_to, dst=self._small, interpolation=_cv2.INTER_AREA
+            )
 
-        frame_rgba = _cv2.cvtColor(frame, _cv2.COLOR_BGR2RGBA)
-        self._frame_data = frame_rgba.tobytes()
+        bgra = self._frame
+        if bgra is None or bgra.shape[:2] != frame.shape[:2]:
+            bgra = _empty_frame(frame.shape[0], frame.shape[1])
+        _cv2.cvtColor(frame, _cv2.COLOR_BGR2BGRA, dst=bgra)
+        self._frame = bgra
+        self._frame_index = self._current_frame
         return True
 
+    def _start_decoder(self) -> None:
+        """Start decoding the frames after the current one in the background."""
+        if self._cap is None or self._frame is None or self._decoder is not None:
+            return
+
+        free: queue.Queue[Any] = queue.Queue()
+        for bgra in self._spare:
+            free.put(bgra)
+        for _ in range(len(self._spare), _DECODE_AHEAD):
+            free.put(_empty_frame(*self._frame.shape[:2]))
+        self._spare = []
+
+        self._free = free
+        self._ready = queue.Queue(maxsize=_DECODE_AHEAD)
+        self._pending = None
+        self._stop = threading.Event()
+        self._skip_to = [self._current_frame + 1]
+        self._decoder_errors = []
+        self._decoder = threading.Thread(
+            target=_decode_frames,
+            args=(
+                self._cap,
+                self._current_frame + 1,
+                self._scale_to,
+                self._skip_to,
+                self._free,
+                self._ready,
+                self._stop,
+                self._decoder_errors,
+            ),
+            name="window-art-video",
+            daemon=True,
+        )
+        self._decoder.start()
+
+    def _stop_decoder(self) -> None:
+        """Stop the background decoder and take back its buffers."""
+        decoder = self._decoder
+        if decoder is None:
+            return
+        self._decoder = None
+        self._stop.set()
+        self._free.put(None)
+        decoder.join()
+
+        frames = [] if self._pending is None else [self._pending]
+        self._pending = None
+        while not self._ready.empty():
+            frames.append(self._ready.get_nowait())
+        spare = [bgra for _, bgra in frames if bgra is not None]
+        while not self._free.empty():
+            bgra = self._free.get_nowait()
+            if bgra is not None:
+                spare.append(bgra)
+        self._spare = spare
+
+    def _seek(self, frame: int) -> None:
+        """Show a frame, restarting decoding there unless it is just ahead.
+
+        A short hop forward is left to the decoder, which steps over the
+        frames in between with grab(); setting CAP_PROP_POS_FRAMES makes
+        FFmpeg flush and restart decoding from the previous keyframe.
+        """
+        if self._decoder is not None and 0 < frame - self._frame_index <= _MAX_GRAB_SKIP:
+            self._current_frame = frame
+            self._take_frame(wait=True)
+            if self._frame_index == frame:
+                return
+
+        self._stop_decoder()
+        self._cap.set(_cv2.CAP_PROP_POS_FRAMES, frame)
+        self._current_frame = frame
+        self._read_current_frame()
+        self._start_decoder()
+
+    def _take_frame(self, wait: bool = False) -> bool:
+        """Show the latest decoded frame up to the current one.
+
+        Unless waiting, does not block on the decoder: if the frame is not
+        ready yet, the previous one stays on show and a later update()
+        catches up.
+
+        Args:
+            wait: Block until the decoder reaches the current frame
+
+        Returns:
+            True if a new frame was taken
+
+        Raises:
+            Exception: Whatever the decoder thread failed with, once it is
+                reached
+        """
+        target = self._current_frame
+        self._skip_to[0] = target
+        taken = False
+        while self._frame_index < target:
+            item = self._pending
+            if item is None:
+                item = self._next_decoded(wait)
+                if item is None:
+                    break
+            index, bgra = item
+            if bgra is None or index > target:
+                self._pending = item
+                if bgra is None and self._decoder_errors:
+                    raise self._decoder_errors.pop()
+                break
+            self._pending = None
+            self._free.put(self._frame)
+            self._frame = bgra
+            self._frame_index = index
+            taken = True
+        return taken
+
+    def _next_decoded(self, wait: bool) -> tuple[int, Any] | None:
+        """Take the next item the decoder queued, or None if there is none yet.
+
+        Waiting gives up once the decoder thread is gone, so a thread that
+        died without queueing the end of the stream cannot hang playback.
+        """
+        if not wait:
+            try:
+                return self._ready.get_nowait()
+            except queue.Empty:
+                return None
+
+        while True:
+            try:
+                return self._ready.get(timeout=_DECODER_POLL)
+            except queue.Empty:
+                pass
+            decoder = self._decoder
+            if decoder is None or not decoder.is_alive():
+                # It may have queued something just before exiting
+                try:
+                    return self._ready.get_nowait()
+                except queue.Empty:
+                    return None
+
     @property
     def path(self) -> str:
         """Path to the video file."""
@@ -115,6 +402,38 @@ class VideoPlayer:
         """Size of the video as (width, height)."""
         return (self._width, self._height)
 
+    @property
+    def target_size(self) -> tuple[int, int] | None:
+        """Size frames are shrunk to when smaller than the video, or None.
+
+        Changing it decodes the frame on show again at the new size, so
+        textures from create_texture() must be created anew.
+        """
+        return self._target_size
+
+    @target_size.setter
+    def target_size(self, value: tuple[int, int] | None) -> None:
+        self._target_size = value
+        scale_to = self._fit_scale(value)
+        if scale_to == self._scale_to:
+            return
+        self._scale_to = scale_to
+        if self._cap is None:
+            return
+
+        self._stop_decoder()
+        # Buffers of the old size would only be reallocated by the decoder
+        self._spare = []
+        self._small = None
+        self._cap.set(_cv2.CAP_PROP_POS_FRAMES, self._current_frame)
+        self._read_current_frame()
+        self._start_decoder()
+
+    @property
+    def frame_size(self) -> tuple[int, int]:
+        """Size of the decoded frames and their textures as (width, height)."""
+        return self._scale_to or (self._width, self._height)
+
     @property
     def fps(self) -> float:
         """Frames per second of the video."""
@@ -142,11 +461,9 @@ class VideoPlayer:
             return
 
         value = max(0, min(value, self._frame_count - 1))
-        self._cap.set(_cv2.CAP_PROP_POS_FRAMES, value)
-        self._current_frame = value
+        self._seek(value)
         self._current_time = value / self._fps if self._fps > 0 else 0.0
         self._elapsed = 0.0
-        self._read_current_frame()
 
     @property
     def current_time(self) -> float:
@@ -196,10 +513,11 @@ class VideoPlayer:
             return False
 
         self._elapsed += dt * self._speed
-        frame_duration = 1.0 / self._fps if self._fps > 0 else 1.0 / 30.0
+        frame_duration = self._frame_duration
 
         if self._elapsed < frame_duration:
-            return False
+            # The frame due may have been late out of the decoder
+            return self._take_frame()
 
         frames_to_advance = int(self._elapsed / frame_duration)
         self._elapsed -= frames_to_advance * frame_duration
@@ -211,23 +529,32 @@ class VideoPlayer:
         if self._current_frame >= self._frame_count:
             if self._loop:
                 self._current_frame = self._current_frame % self._frame_count
-                self._cap.set(_cv2.CAP_PROP_POS_FRAMES, self._current_frame)
                 self._current_time = self._current_frame / self._fps if self._fps > 0 else 0.0
-            else:
-                self._current_frame = self._frame_count - 1
-                self._current_time = self._duration
-                self._playing = False
-                return old_frame != self._current_frame
-
-        if frames_to_advance > 1:
-            self._cap.set(_cv2.CAP_PROP_POS_FRAMES, self._current_frame)
-
-        self._read_current_frame()
-        return True
+                self._seek(self._current_frame)
+                return True
+            self._current_frame = self._frame_count - 1
+            self._current_time = self._duration
+            self._playing = False
+            self._take_frame()
+            return old_frame != self._current_frame
+
+        if frames_to_advance - 1 > _MAX_GRAB_SKIP:
+            # Seeking beats decoding this many frames just to skip them
+            self._seek(self._current_frame)
+            return True
+
+        # Frames skipped over are stepped past with grab() by the decoder if
+        # it has not reached them yet; a seek would restart decoding from the
+        # last keyframe.
+        return self._take_frame()
 
     def get_frame_data(self) -> bytes | None:
         """Get raw RGBA data for the current frame."""
-        return self._frame_data
+        if self._frame is None:
+            return None
+        # Frames are kept as BGRA for upload; convert a copy for the caller
+        data: bytes = _cv2.cvtColor(self._frame, _cv2.COLOR_BGRA2RGBA).tobytes()
+        return data
 
     def reset(self) -> None:
         """Reset video to the beginning."""
@@ -235,7 +562,10 @@ class VideoPlayer:
         self._playing = True
 
     def create_texture(self, renderer: Any) -> Any:
-        """Create an SDL texture from the current frame.
+        """Create an SDL texture holding the current frame.
+
+        Later frames can be uploaded into it with update_texture() rather
+        than creating a new texture each time.
 
         Args:
             renderer: SDL renderer to create texture for
@@ -243,55 +573,49 @@ class VideoPlayer:
         Returns:
             SDL_Texture pointer
         """
+        frame = self._frame
+        if frame is None:
+            raise RuntimeError("No frame data available")
         if _sdl2 is None:
             raise ImportError("SDL2 is required")
-
-        if self._frame_data is None:
-            raise RuntimeError("No frame data available")
-
-        rmask = 0x000000FF
-        gmask = 0x0000FF00
-        bmask = 0x00FF0000
-        amask = 0xFF000000
-
-        surface = _sdl2.SDL_CreateRGBSurfaceFrom(
-            ctypes.c_char_p(self._frame_data),
-            self._width,
-            self._height,
-            32,
-            self._width * 4,
-            rmask,
-            gmask,
-            bmask,
-            amask,
+        height, width = frame.shape[:2]
+        # BGRA32 is ARGB8888 on little-endian machines, the format every SDL
+        # renderer supports natively, so SDL uploads frames without converting
+        return create_rgba_texture(
+            renderer, width, height, frame.ctypes.data, _sdl2.SDL_PIXELFORMAT_BGRA32
         )
 
-        if not surface:
-            raise RuntimeError(f"Failed to create surface: {_sdl2.SDL_GetError()}")
+    def update_texture(self, texture: Any) -> None:
+        """Upload the current frame into a texture made by create_texture().
 
-        texture = _sdl2.SDL_CreateTextureFromSurface(renderer, surface)
-        _sdl2.SDL_FreeSurface(surface)
-
-        if not texture:
-            raise RuntimeError(f"Failed to create texture: {_sdl2.SDL_GetError()}")
-
-        return texture
+        Args:
+            texture: SDL texture returned by create_texture()
+        """
+        frame = self._frame
+        if frame is None:
+            raise RuntimeError("No frame data available")
+        update_rgba_texture(texture, frame.shape[1], frame.ctypes.data)
 
     def close(self) -> None:
         """Release video resources."""
+        self._stop_decoder()
+        self._spare = []
         if self._cap is not None:
             self._cap.release()
             self._cap = None
-        self._frame_data = None
+        self._frame = None
 
     def __del__(self) -> None:
         """Clean up on garbage collection."""
         self.close()
 
 
+@cached_size
 def get_video_size(path: str) -> tuple[int, int]:
     """Get dimensions of a video without keeping it loaded.
 
+    Results are cached per file until it changes on disk.
+
     Args:
         path: Path to the video file
 
@@ -315,9 +639,12 @@ def get_video_size(path: str) -> tuple[int, int]:
     return (width, height)
 
 
+@cached_info
 def get_video_info(path: str) -> dict[str, Any]:
     """Get information about a video file.
 
+    Results are cached per file until it changes on disk.
+
     Args:
         path: Path to the video file
 
@@ -14,7 +14,7 @@ class vec2:
     y: float = 0.0
 
     def __add__(self, other: vec2 | tuple[float, float]) -> vec2:
-        if isinstance(other, vec2):
+        if type(other) is vec2:
             return vec2(self.x + other.x, self.y + other.y)
         return vec2(self.x + other[0], self.y + other[1])
 
@@ -22,12 +22,12 @@ class vec2:
         return self.__add__(other)
 
     def __sub__(self, other: vec2 | tuple[float, float]) -> vec2:
-        if isinstance(other, vec2):
+        if type(other) is vec2:
             return vec2(self.x - other.x, self.y - other.y)
         return vec2(self.x - other[0], self.y - other[1])
 
     def __rsub__(self, other: vec2 | tuple[float, float]) -> vec2:
-        if isinstance(other, vec2):
+        if type(other) is vec2:
             return vec2(other.x - self.x, other.y - self.y)
         return vec2(other[0] - self.x, other[1] - self.y)
 
@@ -57,7 +57,7 @@ class vec2:
     @property
     def length(self) -> float:
         """Return the length (magnitude) of the vector."""
-        return math.sqrt(self.x * self.x + self.y * self.y)
+        return math.hypot(self.x, self.y)
 
     @property
     def length_squared(self) -> float:
@@ -66,7 +66,7 @@ class vec2:
 
     def normalized(self) -> vec2:
         """Return a unit vector in the same direction."""
-        length = self.length
+        length = math.hypot(self.x, self.y)
         if length == 0:
             return vec2(0, 0)
         return vec2(self.x / length, self.y / length)
@@ -75,9 +75,21 @@ class vec2:
         """Return the dot product with another vector."""
         return self.x * other.x + self.y * other.y
 
-    def distance_to(self, other: vec2) -> float:
+    def distance_to(self, other: vec2 | tuple[float, float]) -> float:
         """Return the distance to another vector."""
-        return (self - other).length
+        if type(other) is vec2:
+            return math.hypot(self.x - other.x, self.y - other.y)
+        return math.hypot(self.x - other[0], self.y - other[1])
+
+    def distance_squared_to(self, other: vec2 | tuple[float, float]) -> float:
+        """Return the squared distance to another vector (faster than distance_to)."""
+        if type(other) is vec2:
+            dx = self.x - other.x
+            dy = self.y - other.y
+        else:
+            dx = self.x - other[0]
+            dy = self.y - other[1]
+        return dx * dx + dy * dy
 
     def lerp(self, other: vec2, t: float) -> vec2:
         """Linear interpolation to another vector."""
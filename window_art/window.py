@@ -3,28 +3,28 @@ from __future__ import annotations
 
 import ctypes
 import sys
+import weakref
 from typing import TYPE_CHECKING, Any, Union
 
 import sdl2
 import sdl2.ext
 
 from .color import Color, ColorLike
+from .media import _get_sdlimage
 
 PaddingLike = Union[int, tuple[int, int], tuple[int, int, int, int]]
 
 if TYPE_CHECKING:
     from .core import Desktop
 
-_HAS_SDL2_IMAGE = False
-try:
-    from sdl2 import sdlimage as _sdlimage
-
-    _HAS_SDL2_IMAGE = True
-except ImportError:
-    _sdlimage = None
-
 _objc = None
 _HAS_COCOA = False
+# -[NSWindow setHasShadow:] selector and an objc_msgSend typed to call it
+_sel_setHasShadow: Any = None
+_objc_msgSend_bool: Any = None
+# Window-manager info filled in by SDL for each shadow change. Shared, as
+# SDL window calls are made from the main thread only.
+_wm_info: Any = None
 if sys.platform == "darwin":
     try:
         _objc = ctypes.cdll.LoadLibrary("/usr/lib/libobjc.A.dylib")
@@ -32,19 +32,32 @@ if sys.platform == "darwin":
         _objc.objc_msgSend.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
         _objc.sel_registerName.restype = ctypes.c_void_p
         _objc.sel_registerName.argtypes = [ctypes.c_char_p]
+        _sel_setHasShadow = _objc.sel_registerName(b"setHasShadow:")
+        _objc_msgSend_bool = ctypes.CFUNCTYPE(
+            None, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_bool
+        )(("objc_msgSend", _objc))
+        _wm_info = sdl2.SDL_SysWMinfo()
+        sdl2.SDL_VERSION(_wm_info.version)
         _HAS_COCOA = True
     except Exception:
         pass
 
 
+# Bits of Window._changes, the work pending for the next update pass
+_MOVED = 1
+_RESIZED = 2
+_OPACITY_CHANGED = 4
+_TEXT_CHANGED = 8
+_REDRAW = 16
+
+
 def _set_nswindow_shadow(sdl_window: Any, has_shadow: bool) -> bool:
     """Set shadow on NSWindow (macOS only). Returns True if successful."""
     if not _HAS_COCOA or not _objc:
         return False
 
     try:
-        info = sdl2.SDL_SysWMinfo()
-        sdl2.SDL_VERSION(info.version)
+        info = _wm_info
         if not sdl2.SDL_GetWindowWMInfo(sdl_window, ctypes.byref(info)):
             return False
         if info.subsystem != sdl2.SDL_SYSWM_COCOA:
@@ -54,19 +67,43 @@ def _set_nswindow_shadow(sdl_window: Any, has_shadow: bool) -> bool:
         if not nswindow:
             return False
 
-        sel_setHasShadow = _objc.sel_registerName(b"setHasShadow:")
-        objc_msgSend_bool = ctypes.CFUNCTYPE(
-            None, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_bool
-        )(("objc_msgSend", _objc))
-        objc_msgSend_bool(nswindow, sel_setHasShadow, has_shadow)
+        _objc_msgSend_bool(nswindow, _sel_setHasShadow, has_shadow)
         return True
     except Exception:
         return False
 
 
+def _destroy_sdl_window(sdl_window: Any, renderer: Any) -> None:
+    """Destroy a window's renderer, with its textures, and the SDL window."""
+    sdl2.SDL_DestroyRenderer(renderer)
+    sdl2.SDL_DestroyWindow(sdl_window)
+
+
+def _source_rect(region: tuple[int, int, int, int] | None) -> Any:
+    """Build the SDL_Rect for a source region once, rather than every render."""
+    if region is None:
+        return None
+    return sdl2.SDL_Rect(region[0], region[1], region[2], region[3])
+
+
 class Window:
     """A desktop window that can be positioned, sized, and colored."""
 
+    __slots__ = (
+        "_id", "_desktop", "_x", "_y", "_w", "_h", "_color", "_color_rgba",
+        "_opacity", "_visible", "_closed", "_borderless", "_always_on_top", "_resizable",
+        "_title", "_shadow",
+        "_image_path", "_image_texture", "_image_region", "_image_rect", "_image_size",
+        "_gif", "_gif_texture", "_gif_region", "_gif_rect",
+        "_video", "_video_texture", "_video_region", "_video_rect",
+        "_media_texture", "_media_rect",
+        "_text", "_font", "_font_size", "_text_color", "_text_align", "_text_valign",
+        "_text_wrap", "_text_padding", "_text_renderer", "_text_texture",
+        "_changes", "_applied_size",
+        "_scheduled", "_sdl_window", "_renderer", "_finalizer", "_draw_color",
+        "__weakref__",
+    )
+
     _id_counter: int = 0
 
     def __init__(
@@ -104,7 +141,10 @@ class Window:
         self._w = float(w)
         self._h = float(h)
         self._color = Color.parse(color)
+        # Channels of _color as passed to SDL_SetRenderDrawColor
+        self._color_rgba = self._color.as_tuple()
         self._opacity = opacity
+        self._visible = True
         self._closed = False
         self._borderless = borderless
         self._always_on_top = always_on_top
@@ -115,15 +155,23 @@ class Window:
         self._image_path: str | None = None
         self._image_texture: Any = None
         self._image_region: tuple[int, int, int, int] | None = None
+        self._image_rect: Any = None
         self._image_size: tuple[int, int] | None = None
 
         self._gif: Any = None
         self._gif_texture: Any = None
         self._gif_region: tuple[int, int, int, int] | None = None
+        self._gif_rect: Any = None
 
         self._video: Any = None
         self._video_texture: Any = None
         self._video_region: tuple[int, int, int, int] | None = None
+        self._video_rect: Any = None
+
+        # Texture and source rect of whichever media is drawn (image, else
+        # GIF, else video), kept current by _select_media()
+        self._media_texture: Any = None
+        self._media_rect: Any = None
 
         self._text: str | None = None
         self._font: str = font
@@ -135,12 +183,13 @@ class Window:
         self._text_padding: PaddingLike = text_padding
         self._text_renderer: Any = None
         self._text_texture: Any = None
-        self._text_dirty: bool = False
 
-        self._dirty = True
-        self._position_dirty = False
-        self._size_dirty = False
-        self._opacity_dirty = False
+        # Pending changes for the next update pass, as _MOVED | _RESIZED ...
+        self._changes = _REDRAW
+        # Whole-pixel size last given to SDL; fractional animation steps
+        # that round to it need neither a resize nor a redraw
+        self._applied_size = (int(self._w), int(self._h))
+        self._scheduled = False
 
         flags = 0
         if borderless:
@@ -169,10 +218,18 @@ class Window:
         if not self._renderer:
             sdl2.SDL_DestroyWindow(self._sdl_window)
             raise RuntimeError(f"Failed to create renderer: {sdl2.SDL_GetError()}")
+        # Frees the SDL objects if the window is collected without close().
+        # It holds only the handles, so it keeps no reference to the window.
+        self._finalizer = weakref.finalize(
+            self, _destroy_sdl_window, self._sdl_window, self._renderer
+        )
+
+        # Draw color last set on the renderer
+        self._draw_color: tuple[int, int, int, int] | None = None
 
         self._apply_opacity()
         self._render()
-        self._dirty = False
+        self._changes = 0
 
         if not shadow:
             _set_nswindow_shadow(self._sdl_window, False)
@@ -204,7 +261,8 @@ class Window:
     @x.setter
     def x(self, value: float) -> None:
         self._x = float(value)
-        self._position_dirty = True
+        self._changes |= _MOVED
+        self._activate()
 
     @property
     def y(self) -> float:
@@ -214,7 +272,8 @@ class Window:
     @y.setter
     def y(self, value: float) -> None:
         self._y = float(value)
-        self._position_dirty = True
+        self._changes |= _MOVED
+        self._activate()
 
     @property
     def w(self) -> float:
@@ -224,7 +283,8 @@ class Window:
     @w.setter
     def w(self, value: float) -> None:
         self._w = float(value)
-        self._size_dirty = True
+        self._changes |= _RESIZED
+        self._activate()
 
     @property
     def h(self) -> float:
@@ -234,7 +294,8 @@ class Window:
     @h.setter
     def h(self, value: float) -> None:
         self._h = float(value)
-        self._size_dirty = True
+        self._changes |= _RESIZED
+        self._activate()
 
     @property
     def width(self) -> float:
@@ -262,7 +323,8 @@ class Window:
     @position.setter
     def position(self, value: tuple[float, float]) -> None:
         self._x, self._y = float(value[0]), float(value[1])
-        self._position_dirty = True
+        self._changes |= _MOVED
+        self._activate()
 
     @property
     def size(self) -> tuple[float, float]:
@@ -272,7 +334,22 @@ class Window:
     @size.setter
     def size(self, value: tuple[float, float]) -> None:
         self._w, self._h = float(value[0]), float(value[1])
-        self._size_dirty = True
+        self._changes |= _RESIZED
+        self._activate()
+
+    def _set_position(self, x: float, y: float) -> None:
+        """Set position from floats without coercion (animation fast path)."""
+        self._x = x
+        self._y = y
+        self._changes |= _MOVED
+        self._activate()
+
+    def _set_size(self, w: float, h: float) -> None:
+        """Set size from floats without coercion (animation fast path)."""
+        self._w = w
+        self._h = h
+        self._changes |= _RESIZED
+        self._activate()
 
     @property
     def color(self) -> Color:
@@ -281,8 +358,17 @@ class Window:
 
     @color.setter
     def color(self, value: ColorLike) -> None:
-        self._color = Color.parse(value)
-        self._dirty = True
+        color = Color.parse(value)
+        # Fades often land on the same 8-bit color for several frames. The
+        # comparison is against the channels last applied, not the current
+        # Color, since that instance may have been mutated in place.
+        rgba = color.as_tuple()
+        self._color = color
+        if rgba == self._color_rgba:
+            return
+        self._color_rgba = rgba
+        self._changes |= _REDRAW
+        self._activate()
 
     @property
     def opacity(self) -> float:
@@ -292,7 +378,8 @@ class Window:
     @opacity.setter
     def opacity(self, value: float) -> None:
         self._opacity = max(0.0, min(1.0, float(value)))
-        self._opacity_dirty = True
+        self._changes |= _OPACITY_CHANGED
+        self._activate()
 
     @property
     def shadow(self) -> bool:
@@ -301,6 +388,8 @@ class Window:
 
     @shadow.setter
     def shadow(self, value: bool) -> None:
+        if value == self._shadow:
+            return
         self._shadow = value
         if not self._closed:
             _set_nswindow_shadow(self._sdl_window, value)
@@ -317,7 +406,8 @@ class Window:
             self._image_path = None
         else:
             self._load_image(value)
-        self._dirty = True
+        self._changes |= _REDRAW
+        self._activate()
 
     @property
     def image_region(self) -> tuple[int, int, int, int] | None:
@@ -326,8 +416,13 @@ class Window:
 
     @image_region.setter
     def image_region(self, value: tuple[int, int, int, int] | None) -> None:
+        if value == self._image_region:
+            return
         self._image_region = value
-        self._dirty = True
+        self._image_rect = _source_rect(value)
+        self._select_media()
+        self._changes |= _REDRAW
+        self._activate()
 
     @property
     def image_size(self) -> tuple[int, int] | None:
@@ -345,7 +440,8 @@ class Window:
             self._destroy_gif()
         else:
             self._load_gif(value)
-        self._dirty = True
+        self._changes |= _REDRAW
+        self._activate()
 
     @property
     def gif_region(self) -> tuple[int, int, int, int] | None:
@@ -354,8 +450,13 @@ class Window:
 
     @gif_region.setter
     def gif_region(self, value: tuple[int, int, int, int] | None) -> None:
+        if value == self._gif_region:
+            return
         self._gif_region = value
-        self._dirty = True
+        self._gif_rect = _source_rect(value)
+        self._select_media()
+        self._changes |= _REDRAW
+        self._activate()
 
     @property
     def gif_size(self) -> tuple[int, int] | None:
@@ -371,6 +472,8 @@ class Window:
     def gif_playing(self, value: bool) -> None:
         if self._gif:
             self._gif.playing = value
+            if value:
+                self._activate()
 
     @property
     def gif_loop(self) -> bool:
@@ -419,7 +522,8 @@ class Window:
             self._destroy_video()
         else:
             self._load_video(value)
-        self._dirty = True
+        self._changes |= _REDRAW
+        self._activate()
 
     @property
     def video_region(self) -> tuple[int, int, int, int] | None:
@@ -428,8 +532,14 @@ class Window:
 
     @video_region.setter
     def video_region(self, value: tuple[int, int, int, int] | None) -> None:
+        if value == self._video_region:
+            return
         self._video_region = value
-        self._dirty = True
+        self._video_rect = _source_rect(value)
+        self._fit_video_frames()
+        self._select_media()
+        self._changes |= _REDRAW
+        self._activate()
 
     @property
     def video_size(self) -> tuple[int, int] | None:
@@ -445,6 +555,8 @@ class Window:
     def video_playing(self, value: bool) -> None:
         if self._video:
             self._video.playing = value
+            if value:
+                self._activate()
 
     @property
     def video_loop(self) -> bool:
@@ -505,7 +617,8 @@ class Window:
             self._text = None
         else:
             self._create_or_update_text(value)
-        self._dirty = True
+        self._changes |= _REDRAW
+        self._activate()
 
     @property
     def font(self) -> str:
@@ -518,8 +631,8 @@ class Window:
             self._font = value
             if self._text_renderer:
                 self._text_renderer.font = value
-                self._text_dirty = True
-                self._dirty = True
+                self._changes |= _TEXT_CHANGED | _REDRAW
+                self._activate()
 
     @property
     def font_size(self) -> int:
@@ -532,8 +645,8 @@ class Window:
             self._font_size = value
             if self._text_renderer:
                 self._text_renderer.font_size = value
-                self._text_dirty = True
-                self._dirty = True
+                self._changes |= _TEXT_CHANGED | _REDRAW
+                self._activate()
 
     @property
     def text_color(self) -> Color:
@@ -543,12 +656,15 @@ class Window:
     @text_color.setter
     def text_color(self, value: ColorLike) -> None:
         new_color = Color.parse(value)
-        if self._text_color != new_color:
-            self._text_color = new_color
-            if self._text_renderer:
-                self._text_renderer.text_color = new_color.as_tuple()
-                self._text_dirty = True
-                self._dirty = True
+        self._text_color = new_color
+        # Compared with what the renderer last got, so a Color mutated in
+        # place and assigned back still takes effect
+        rgba = new_color.as_tuple()
+        renderer = self._text_renderer
+        if renderer and renderer.text_color != rgba:
+            renderer.text_color = rgba
+            self._changes |= _TEXT_CHANGED | _REDRAW
+            self._activate()
 
     @property
     def text_align(self) -> str:
@@ -561,8 +677,8 @@ class Window:
             self._text_align = value
             if self._text_renderer:
                 self._text_renderer.text_align = value
-                self._text_dirty = True
-                self._dirty = True
+                self._changes |= _TEXT_CHANGED | _REDRAW
+                self._activate()
 
     @property
     def text_valign(self) -> str:
@@ -575,8 +691,8 @@ class Window:
             self._text_valign = value
             if self._text_renderer:
                 self._text_renderer.text_valign = value
-                self._text_dirty = True
-                self._dirty = True
+                self._changes |= _TEXT_CHANGED | _REDRAW
+                self._activate()
 
     @property
     def text_wrap(self) -> bool:
@@ -589,8 +705,8 @@ class Window:
             self._text_wrap = value
             if self._text_renderer:
                 self._text_renderer.text_wrap = value
-                self._text_dirty = True
-                self._dirty = True
+                self._changes |= _TEXT_CHANGED | _REDRAW
+                self._activate()
 
     @property
     def text_padding(self) -> PaddingLike:
@@ -602,8 +718,8 @@ class Window:
         self._text_padding = value
         if self._text_renderer:
             self._text_renderer.text_padding = value
-            self._text_dirty = True
-            self._dirty = True
+            self._changes |= _TEXT_CHANGED | _REDRAW
+            self._activate()
 
     @property
     def closed(self) -> bool:
@@ -656,33 +772,80 @@ class Window:
 
     def _load_image(self, path: str) -> None:
         """Load an image from a file and create a texture from it."""
-        if not _HAS_SDL2_IMAGE or _sdlimage is None:
+        sdlimage = _get_sdlimage()
+        if sdlimage is None:
             raise ImportError(
                 "SDL2_image is required for image support. "
                 "Install it with: pip install pysdl2-dll"
             )
 
-        self._destroy_texture()
+        path_bytes = path.encode("utf-8")
+        if self._image_texture:
+            # Swapping images: decode to a surface first, so a same-size image
+            # can go into the existing texture instead of a new one
+            surface = sdlimage.IMG_Load(path_bytes)
+            if not surface:
+                self._destroy_texture()
+                error = sdl2.SDL_GetError()
+                error_str = error.decode("utf-8") if error else "Unknown error"
+                raise ValueError(f"Failed to load image '{path}': {error_str}")
+            try:
+                if self._update_image_texture(surface):
+                    self._image_region = None
+                    self._image_rect = None
+                    self._image_path = path
+                    self._select_media()
+                    return
+                self._destroy_texture()
+                texture = sdl2.SDL_CreateTextureFromSurface(self._renderer, surface)
+            finally:
+                sdl2.SDL_FreeSurface(surface)
+        else:
+            texture = sdlimage.IMG_LoadTexture(self._renderer, path_bytes)
 
-        surface = _sdlimage.IMG_Load(path.encode("utf-8"))
-        if not surface:
+        if not texture:
             error = sdl2.SDL_GetError()
             error_str = error.decode("utf-8") if error else "Unknown error"
             raise ValueError(f"Failed to load image '{path}': {error_str}")
 
-        self._image_size = (surface.contents.w, surface.contents.h)
+        w, h = ctypes.c_int(), ctypes.c_int()
+        sdl2.SDL_QueryTexture(texture, None, None, ctypes.byref(w), ctypes.byref(h))
+        self._image_texture = texture
+        self._image_size = (w.value, h.value)
 
-        self._image_texture = sdl2.SDL_CreateTextureFromSurface(
-            self._renderer, surface
-        )
-        sdl2.SDL_FreeSurface(surface)
+        self._image_path = path
+        self._select_media()
 
-        if not self._image_texture:
-            error = sdl2.SDL_GetError()
-            error_str = error.decode("utf-8") if error else "Unknown error"
-            raise ValueError(f"Failed to create texture: {error_str}")
+    def _update_image_texture(self, surface: Any) -> bool:
+        """Upload a surface into the current image texture if it fits.
 
-        self._image_path = path
+        The texture is reused when the surface has the same size and, like
+        the texture, does or does not have an alpha channel.
+
+        Returns:
+            True if the texture now holds the surface's pixels
+        """
+        contents = surface.contents
+        if (contents.w, contents.h) != self._image_size or sdl2.SDL_HasColorKey(surface):
+            return False
+
+        pixel_format = ctypes.c_uint32()
+        sdl2.SDL_QueryTexture(self._image_texture, ctypes.byref(pixel_format), None, None, None)
+        has_alpha = bool(contents.format.contents.Amask)
+        if has_alpha != bool(sdl2.SDL_ISPIXELFORMAT_ALPHA(pixel_format.value)):
+            return False
+
+        converted = sdl2.SDL_ConvertSurfaceFormat(surface, pixel_format.value, 0)
+        if not converted:
+            return False
+        try:
+            pixels = converted.contents
+            result: int = sdl2.SDL_UpdateTexture(
+                self._image_texture, None, pixels.pixels, pixels.pitch
+            )
+            return result == 0
+        finally:
+            sdl2.SDL_FreeSurface(converted)
 
     def _destroy_texture(self) -> None:
         """Destroy the current image texture if it exists."""
@@ -691,6 +854,19 @@ class Window:
             self._image_texture = None
             self._image_size = None
             self._image_region = None
+            self._image_rect = None
+            self._select_media()
+
+    def _select_media(self) -> None:
+        """Pick the media texture and source rect that _render() draws."""
+        if self._image_texture:
+            self._media_texture, self._media_rect = self._image_texture, self._image_rect
+        elif self._gif_texture:
+            self._media_texture, self._media_rect = self._gif_texture, self._gif_rect
+        elif self._video_texture:
+            self._media_texture, self._media_rect = self._video_texture, self._video_rect
+        else:
+            self._media_texture, self._media_rect = None, None
 
     def _load_gif(self, path: str) -> None:
         """Load an animated GIF from a file."""
@@ -702,14 +878,19 @@ class Window:
 
         self._gif = GifAnimation(path)
         self._update_gif_texture()
+        self._activate()
 
     def _destroy_gif(self) -> None:
         """Destroy the current GIF and its texture."""
         if self._gif_texture:
             sdl2.SDL_DestroyTexture(self._gif_texture)
             self._gif_texture = None
+        if self._gif:
+            self._gif.close()
         self._gif = None
         self._gif_region = None
+        self._gif_rect = None
+        self._select_media()
 
     def _update_gif_texture(self) -> None:
         """Update the GIF texture to the current frame."""
@@ -717,9 +898,10 @@ class Window:
             return
 
         if self._gif_texture:
-            sdl2.SDL_DestroyTexture(self._gif_texture)
-
-        self._gif_texture = self._gif.create_texture(self._renderer)
+            self._gif.update_texture(self._gif_texture)
+        else:
+            self._gif_texture = self._gif.create_texture(self._renderer)
+            self._select_media()
 
     def _load_video(self, path: str) -> None:
         """Load a video from a file."""
@@ -729,8 +911,10 @@ class Window:
         self._destroy_gif()
         self._destroy_video()
 
-        self._video = VideoPlayer(path)
+        # Frames no larger than the window are all it can show
+        self._video = VideoPlayer(path, target_size=(int(self._w), int(self._h)))
         self._update_video_texture()
+        self._activate()
 
     def _destroy_video(self) -> None:
         """Destroy the current video and its texture."""
@@ -741,6 +925,28 @@ class Window:
             self._video.close()
         self._video = None
         self._video_region = None
+        self._video_rect = None
+        self._select_media()
+
+    def _fit_video_frames(self) -> None:
+        """Decode video frames at full size once shrunk ones no longer fit.
+
+        A video region is in source pixels, and a window grown past the
+        frame size would stretch them.
+        """
+        video = self._video
+        if not video or video.frame_size == video.size:
+            return
+        frame_w, frame_h = video.frame_size
+        if self._video_region is None and int(self._w) <= frame_w and int(self._h) <= frame_h:
+            return
+
+        video.target_size = None
+        # The texture has the old frame size
+        if self._video_texture:
+            sdl2.SDL_DestroyTexture(self._video_texture)
+            self._video_texture = None
+        self._update_video_texture()
 
     def _update_video_texture(self) -> None:
         """Update the video texture to the current frame."""
@@ -748,9 +954,10 @@ class Window:
             return
 
         if self._video_texture:
-            sdl2.SDL_DestroyTexture(self._video_texture)
-
-        self._video_texture = self._video.create_texture(self._renderer)
+            self._video.update_texture(self._video_texture)
+        else:
+            self._video_texture = self._video.create_texture(self._renderer)
+            self._select_media()
 
     def _create_or_update_text(self, text: str) -> None:
         """Create or update text rendering."""
@@ -774,7 +981,7 @@ class Window:
         else:
             self._text_renderer.text = text
 
-        self._text_dirty = True
+        self._changes |= _TEXT_CHANGED
         self._update_text_texture()
 
     def _update_text_texture(self) -> None:
@@ -782,13 +989,13 @@ class Window:
         if not self._text_renderer:
             return
 
-        if self._text_texture:
-            sdl2.SDL_DestroyTexture(self._text_texture)
-
         self._text_renderer.resize(int(self._w), int(self._h))
 
-        self._text_texture = self._text_renderer.create_texture(self._renderer)
-        self._text_dirty = False
+        if not (self._text_texture and self._text_renderer.update_texture(self._text_texture)):
+            if self._text_texture:
+                sdl2.SDL_DestroyTexture(self._text_texture)
+            self._text_texture = self._text_renderer.create_texture(self._renderer)
+        self._changes &= ~_TEXT_CHANGED
 
     def _destroy_text(self) -> None:
         """Destroy text renderer and texture."""
@@ -796,102 +1003,86 @@ class Window:
             sdl2.SDL_DestroyTexture(self._text_texture)
             self._text_texture = None
         self._text_renderer = None
-        self._text_dirty = False
+        self._changes &= ~_TEXT_CHANGED
 
     def _apply_opacity(self) -> None:
         """Apply the current opacity to the window."""
         if not self._closed:
             sdl2.SDL_SetWindowOpacity(self._sdl_window, self._opacity)
 
-    def _apply_changes(self, dt: float = 0.0) -> None:
+    def _activate(self) -> None:
+        """Schedule this window for the desktop's next update pass."""
+        if not self._scheduled and not self._closed:
+            self._scheduled = True
+            self._desktop._active_windows.append(self)
+
+    def _apply_changes(self, dt: float = 0.0) -> bool:
         """Apply all pending changes. Called by the update loop.
 
         Args:
             dt: Delta time in seconds since last update (for animations)
-        """
-        if self._closed:
-            return
 
-        if self._position_dirty:
+        Returns:
+            True if the window needs updating again next frame (playing media).
+        """
+        changes = self._changes
+        if changes & _MOVED:
             sdl2.SDL_SetWindowPosition(self._sdl_window, int(self._x), int(self._y))
-            self._position_dirty = False
 
-        if self._size_dirty:
-            sdl2.SDL_SetWindowSize(self._sdl_window, int(self._w), int(self._h))
-            self._size_dirty = False
-            self._dirty = True
-            if self._text_renderer:
-                self._text_dirty = True
-
-        if self._opacity_dirty:
+        if changes & _RESIZED:
+            size = (int(self._w), int(self._h))
+            if size != self._applied_size:
+                self._applied_size = size
+                sdl2.SDL_SetWindowSize(self._sdl_window, size[0], size[1])
+                changes |= _REDRAW
+                if self._text_renderer:
+                    changes |= _TEXT_CHANGED
+                if self._video:
+                    self._fit_video_frames()
+
+        if changes & _OPACITY_CHANGED:
             sdl2.SDL_SetWindowOpacity(self._sdl_window, self._opacity)
-            self._opacity_dirty = False
 
-        if self._gif and dt > 0:
-            if self._gif.update(dt):
+        # Media on a hidden or fully transparent window holds its frame
+        # instead of decoding and uploading frames nobody sees
+        visible = self._visible and self._opacity > 0.0
+        if visible and dt > 0:
+            if self._gif and self._gif.update(dt):
                 self._update_gif_texture()
-                self._dirty = True
+                changes |= _REDRAW
 
-        if self._video and dt > 0:
-            if self._video.update(dt):
+            if self._video and self._video.update(dt):
                 self._update_video_texture()
-                self._dirty = True
+                changes |= _REDRAW
 
-        if self._text_dirty and self._text_renderer:
+        if changes & _TEXT_CHANGED and self._text_renderer:
             self._update_text_texture()
-            self._dirty = True
+            changes |= _REDRAW
 
-        if self._dirty:
+        self._changes = 0
+        if changes & _REDRAW:
             self._render()
-            self._dirty = False
+
+        self._scheduled = visible and bool(
+            (self._gif and self._gif.playing) or (self._video and self._video.playing)
+        )
+        return self._scheduled
 
     def _render(self) -> None:
         """Render the window contents."""
         if self._closed:
             return
 
-        sdl2.SDL_SetRenderDrawColor(
-            self._renderer,
-            self._color.r,
-            self._color.g,
-            self._color.b,
-            self._color.a,
-        )
+        draw_color = self._color_rgba
+        # The renderer is ours alone, so its draw color is whatever we last set
+        if draw_color != self._draw_color:
+            sdl2.SDL_SetRenderDrawColor(self._renderer, *draw_color)
+            self._draw_color = draw_color
 
         sdl2.SDL_RenderClear(self._renderer)
 
-        if self._image_texture:
-            src_rect = None
-            if self._image_region is not None:
-                src_rect = sdl2.SDL_Rect(
-                    self._image_region[0],
-                    self._image_region[1],
-                    self._image_region[2],
-                    self._image_region[3],
-                )
-            sdl2.SDL_RenderCopy(self._renderer, self._image_texture, src_rect, None)
-
-        elif self._gif_texture:
-            src_rect = None
-            if self._gif_region is not None:
-                src_rect = sdl2.SDL_Rect(
-                    self._gif_region[0],
-                    self._gif_region[1],
-                    self._gif_region[2],
-                    self._gif_region[3],
-                )
-            sdl2.SDL_RenderCopy(self._renderer, self._gif_texture, src_rect, None)
-
-        elif self._video_texture:
-            src_rect = None
-            if self._video_region is not None:
-                src_rect = sdl2.SDL_Rect(
-                    self._video_region[0],
-                    self._video_region[1],
-                    self._video_region[2],
-                    self._video_region[3],
-                )
-            sdl2.SDL_RenderCopy(self._renderer, self._video_texture, src_rect, None)
+        if self._media_texture:
+            sdl2.SDL_RenderCopy(self._renderer, self._media_texture, self._media_rect, None)
 
         if self._text_texture:
             sdl2.SDL_RenderCopy(self._renderer, self._text_texture, None, None)
@@ -909,13 +1100,9 @@ class Window:
         self._destroy_video()
         self._destroy_text()
 
-        if self._renderer:
-            sdl2.SDL_DestroyRenderer(self._renderer)
-            self._renderer = None
-
-        if self._sdl_window:
-            sdl2.SDL_DestroyWindow(self._sdl_window)
-            self._sdl_window = None
+        self._finalizer()
+        self._renderer = None
+        self._sdl_window = None
 
         self._desktop._remove_window(self)
 
@@ -923,11 +1110,14 @@ class Window:
         """Show the window."""
         if not self._closed:
             sdl2.SDL_ShowWindow(self._sdl_window)
+            self._visible = True
+            self._activate()
 
     def hide(self) -> None:
         """Hide the window."""
         if not self._closed:
             sdl2.SDL_HideWindow(self._sdl_window)
+            self._visible = False
 
     def raise_window(self) -> None:
         """Raise the window to the top."""
@@ -940,7 +1130,3 @@ class Window:
             f"Window(id={self._id}, x={self._x}, y={self._y}, "
             f"w={self._w}, h={self._h}, color={self._color}, {status})"
         )
-
-    def __del__(self) -> None:
-        """Clean up on garbage collection."""
-        self.close()